@@ -0,0 +1,501 @@
+"""
+Shared helpers for the gradient / scroll debugging and streaming example
+scripts.
+
+These scripts are run directly (``python examples/<name>.py``), so the
+examples directory is on ``sys.path`` and this module can be imported as
+``from _common import ...``.
+"""
+
+import argparse
+import functools
+import os
+import queue
+import shutil
+import signal
+import sys
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterable, Sequence
+from types import ModuleType
+from typing import Any
+
+# Largest single write issued by the batch tests. One giant write spikes peak
+# memory and hands xterm.js one huge parse burst; capping each write keeps
+# throughput high while smoothing both.
+WRITE_CAP = 256 * 1024
+
+# Most buffers the kernel accepts in one writev() call.
+try:
+    _IOV_MAX = os.sysconf("SC_IOV_MAX")
+except (AttributeError, ValueError, OSError):
+    _IOV_MAX = 1024
+# sysconf returns -1 when the limit is indeterminate
+if _IOV_MAX <= 0:
+    _IOV_MAX = 1024
+
+# Output is built as pre-encoded bytes and written to ``sys.stdout.buffer``,
+# so the per-cell hot path never goes through the text codec.
+RESET = b"\x1b[0m"
+
+# Decimal strings for every 8-bit channel value, so building an SGR escape is
+# plain concatenation instead of int -> str formatting per cell.
+_DEC = [str(i).encode() for i in range(256)]
+_FG_PREFIX = b"\x1b[38;2;"
+_BG_PREFIX = b"\x1b[48;2;"
+
+# Opt-in 256-color mode, switched on with ``set_palette_256()`` (the scripts
+# expose it as --palette-256): truecolor is quantized to the xterm palette, so
+# every SGR is a short prebuilt escape and the wire carries roughly half the
+# bytes.
+PALETTE_256 = False
+_FG256 = [b"\x1b[38;5;" + _DEC[i] + b"m" for i in range(256)]
+_BG256 = [b"\x1b[48;5;" + _DEC[i] + b"m" for i in range(256)]
+
+# Full escapes keyed by color. Gradients only have a few hundred distinct
+# colors per test, so these stay small.
+_FG_CACHE: dict[tuple[int, int, int], bytes] = {}
+_BG_CACHE: dict[tuple[int, int, int], bytes] = {}
+
+
+# Cached (cols, rows); filled on first use and refreshed on SIGWINCH.
+_terminal_size: tuple[int, int] | None = None
+
+
+def refresh_terminal_size(*_args: object) -> tuple[int, int]:
+    """Re-query the terminal size and update the cache (SIGWINCH handler)."""
+    global _terminal_size
+    size = shutil.get_terminal_size()
+    _terminal_size = (size.columns, size.lines)
+    return _terminal_size
+
+
+def get_terminal_size() -> tuple[int, int]:
+    """
+    Get the terminal size as (cols, rows).
+
+    The size is queried once and cached. On platforms with SIGWINCH a handler
+    is installed on first use so the cache follows terminal resizes.
+    """
+    if _terminal_size is not None:
+        return _terminal_size
+    if hasattr(signal, "SIGWINCH"):
+        signal.signal(signal.SIGWINCH, refresh_terminal_size)
+    return refresh_terminal_size()
+
+
+def write_bytes(data: bytes, flush: bool = True) -> None:
+    """
+    Write pre-encoded `data` to the binary stdout.
+
+    Pending text written with ``print()`` is flushed first so the two layers
+    stay in order. Pass ``flush=False`` when more output follows immediately:
+    the bytes then ride along with the next flush (e.g. the next ``print()``)
+    instead of costing a write syscall of their own.
+    """
+    sys.stdout.flush()
+    sys.stdout.buffer.write(data)
+    if flush:
+        sys.stdout.buffer.flush()
+
+
+def write_vectored(parts: Sequence[bytes | bytearray]) -> None:
+    """
+    Write `parts` straight to the stdout file descriptor, bypassing Python's
+    buffered writer.
+
+    Uses ``os.writev`` where available so the kernel gathers the buffers in
+    one syscall without a Python-side join; elsewhere the parts are joined
+    and written with ``os.write``. Short writes are retried until everything
+    is written; a write that makes no progress raises ``OSError``. Pending
+    ``print()`` output is flushed first.
+    """
+    sys.stdout.flush()
+    sys.stdout.buffer.flush()
+    fd = sys.stdout.fileno()
+
+    if not hasattr(os, "writev"):
+        data = memoryview(b"".join(parts))
+        while data:
+            written = os.write(fd, data)
+            if not written:
+                raise OSError("os.write wrote 0 bytes to stdout")
+            data = data[written:]
+        return
+
+    pending = [memoryview(part) for part in parts if part]
+    i = 0
+    while i < len(pending):
+        written = os.writev(fd, pending[i : i + _IOV_MAX])
+        if not written:
+            raise OSError("os.writev wrote 0 bytes to stdout")
+        # Skip the buffers that were written completely, then trim the
+        # partially written one
+        while i < len(pending) and written >= len(pending[i]):
+            written -= len(pending[i])
+            i += 1
+        if written:
+            pending[i] = pending[i][written:]
+
+
+def flush_bounded(parts: Iterable[bytes], cap: int = WRITE_CAP) -> None:
+    """
+    Write `parts` to stdout in chunks of at most `cap` bytes.
+
+    Parts are accumulated until adding the next one would exceed `cap`, then
+    the accumulated chunk is handed to ``write_vectored``. A single part
+    larger than `cap` is written on its own. Writes go straight to the file
+    descriptor, so no trailing flush is needed: output is only pushed when a
+    chunk is full or the input runs out.
+    """
+    chunk: list[bytes] = []
+    size = 0
+    for part in parts:
+        if chunk and size + len(part) > cap:
+            write_vectored(chunk)
+            chunk.clear()
+            size = 0
+        chunk.append(part)
+        size += len(part)
+    if chunk:
+        write_vectored(chunk)
+
+
+def rgb_to_ansi256(r: int, g: int, b: int) -> int:
+    """
+    Map an RGB color to an xterm 256-color palette index.
+
+    Uses the same mapping as the library's ``Color::to_ansi_256``: neutral
+    grays go to the grayscale ramp, everything else to the 6x6x6 cube.
+    """
+    if r == g == b:
+        if r < 8:
+            return 16
+        if r > 248:
+            return 231
+        return 232 + (r - 8) // 10
+    return 16 + 36 * round(r / 255 * 5) + 6 * round(g / 255 * 5) + round(b / 255 * 5)
+
+
+class ChunkWriter:
+    """
+    Accumulate output in a single growable ``bytearray`` and write it out in
+    chunks of at most `cap` bytes.
+
+    Unlike building a list of parts and joining it, this keeps one
+    contiguous buffer that is reused for every chunk. Use as a context
+    manager so the final partial chunk is written on exit.
+    """
+
+    def __init__(self, cap: int = WRITE_CAP) -> None:
+        self.cap = cap
+        self.buf = bytearray()
+
+    def write(self, data: bytes) -> None:
+        """Append `data`, first writing the buffer out if it would exceed `cap`."""
+        if self.buf and len(self.buf) + len(data) > self.cap:
+            self.flush()
+        self.buf += data
+
+    def flush(self) -> None:
+        """Write out and clear any buffered bytes."""
+        if self.buf:
+            write_vectored([self.buf])
+            self.buf.clear()
+
+    def __enter__(self) -> "ChunkWriter":
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        self.flush()
+
+
+def fg_escape(r: int, g: int, b: int) -> bytes:
+    """Return the FG escape for (r, g, b), cached per color."""
+    color = (r, g, b)
+    seq = _FG_CACHE.get(color)
+    if seq is None:
+        if PALETTE_256:
+            seq = _FG256[rgb_to_ansi256(r, g, b)]
+        else:
+            seq = _FG_PREFIX + _DEC[r] + b";" + _DEC[g] + b";" + _DEC[b] + b"m"
+        _FG_CACHE[color] = seq
+    return seq
+
+
+def bg_escape(r: int, g: int, b: int) -> bytes:
+    """Return the BG escape for (r, g, b), cached per color."""
+    color = (r, g, b)
+    seq = _BG_CACHE.get(color)
+    if seq is None:
+        if PALETTE_256:
+            seq = _BG256[rgb_to_ansi256(r, g, b)]
+        else:
+            seq = _BG_PREFIX + _DEC[r] + b";" + _DEC[g] + b";" + _DEC[b] + b"m"
+        _BG_CACHE[color] = seq
+    return seq
+
+
+@functools.lru_cache(maxsize=None)
+def bg_row_template(cols: int, char: bytes = b" ") -> bytes:
+    """
+    Return a ``%``-format template for one row of `cols` BG-colored cells.
+
+    The template is specialized once per width. Filling it with
+    ``template % channels`` (a flat ``(r, g, b, r, g, b, ...)`` tuple) formats
+    the whole row in a single call instead of one Python call per cell. The
+    row ends with one reset rather than a reset after every cell.
+    """
+    return (b"\x1b[48;2;%d;%d;%dm" + char.replace(b"%", b"%%")) * cols + RESET
+
+
+def render_bg_row(cols: int, channels: Sequence[int], char: bytes = b" ") -> bytes:
+    """
+    Render one row of `cols` BG-colored cells followed by a reset.
+
+    `channels` is a flat ``(r, g, b, r, g, b, ...)`` sequence. Truecolor rows
+    are formatted through ``bg_row_template``; in 256-color mode each cell
+    uses the prebuilt palette escape instead.
+    """
+    if not PALETTE_256:
+        return bg_row_template(cols, char) % tuple(channels)
+    cells = [bg_escape(*channels[i : i + 3]) + char for i in range(0, 3 * cols, 3)]
+    cells.append(RESET)
+    return b"".join(cells)
+
+
+@functools.lru_cache(maxsize=None)
+def ryg_gradient(cols: int) -> tuple[tuple[int, int, int], ...]:
+    """
+    Return the red -> yellow -> green gradient colors for `cols` steps.
+
+    Step ``i`` maps to ``t = i / (cols - 1)``, so the first entry is pure red
+    and the last pure green. Cached per width so every test (and every run in
+    the same process) shares one table.
+    """
+    colors = []
+    for i in range(cols):
+        t = i / max(cols - 1, 1)
+        if t < 0.5:
+            colors.append((255, int(255 * (t * 2)), 0))
+        else:
+            colors.append((int(255 * (1 - (t - 0.5) * 2)), 255, 0))
+    return tuple(colors)
+
+
+@functools.lru_cache(maxsize=None)
+def ryg_bg_escapes(cols: int) -> tuple[bytes, ...]:
+    """Return the pre-encoded background SGR for each step of `ryg_gradient`."""
+    return tuple(bg_escape(r, g, b) for r, g, b in ryg_gradient(cols))
+
+
+class SgrEmitter:
+    """
+    Emit SGR color sequences only when the emitted color actually changes.
+
+    Tracks the last FG/BG escape written so consecutive cells that resolve to
+    the same escape (the same RGB, or the same palette entry in 256-color
+    mode) skip it entirely, and replaces the per-cell ``ESC[0m`` with a
+    single reset at the end of the line. The output therefore differs from
+    Rich's per-cell stream even though it renders the same colors.
+    """
+
+    def __init__(self) -> None:
+        self.last_fg: bytes | None = None
+        self.last_bg: bytes | None = None
+
+    def set_fg(self, r: int, g: int, b: int) -> bytes:
+        """Return the FG escape for (r, g, b), or b"" if it is already set."""
+        seq = fg_escape(r, g, b)
+        if seq == self.last_fg:
+            return b""
+        self.last_fg = seq
+        return seq
+
+    def set_bg(self, r: int, g: int, b: int) -> bytes:
+        """Return the BG escape for (r, g, b), or b"" if it is already set."""
+        seq = bg_escape(r, g, b)
+        if seq == self.last_bg:
+            return b""
+        self.last_bg = seq
+        return seq
+
+    def finish_line(self) -> bytes:
+        """Return a reset if any color was set since the last reset, else b""."""
+        if self.last_fg is None and self.last_bg is None:
+            return b""
+        self.last_fg = None
+        self.last_bg = None
+        return RESET
+
+
+class RowCache:
+    """
+    Fixed-capacity LRU of fully rendered rows.
+
+    Keys are ``(kind, cols, *params)`` tuples, so every test in a process that
+    renders the same row shares one bytes object instead of re-rendering it.
+    The capacity bounds memory when many widths or parameters are used.
+    """
+
+    def __init__(self, maxsize: int = 256) -> None:
+        self.maxsize = maxsize
+        self._rows: OrderedDict[Hashable, bytes] = OrderedDict()
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._rows
+
+    def get(self, key: Hashable) -> bytes | None:
+        """Return the cached row for `key`, or None on a miss."""
+        row = self._rows.get(key)
+        if row is not None:
+            self._rows.move_to_end(key)
+        return row
+
+    def put(self, key: Hashable, row: bytes) -> None:
+        """Store `row`, evicting the least recently used row when full."""
+        self._rows[key] = row
+        self._rows.move_to_end(key)
+        if len(self._rows) > self.maxsize:
+            self._rows.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every cached row."""
+        self._rows.clear()
+
+    def get_or_build(self, key: Hashable, build: Callable[[], bytes]) -> bytes:
+        """Return the cached row for `key`, rendering it with `build` on a miss."""
+        row = self.get(key)
+        if row is None:
+            row = build()
+            self.put(key, row)
+        return row
+
+
+# Process-wide row cache shared by every test in a script
+row_cache = RowCache()
+
+
+def add_palette_argument(parser: argparse.ArgumentParser) -> None:
+    """Add the --palette-256 flag; pass its value to ``set_palette_256()``."""
+    parser.add_argument(
+        "--palette-256",
+        action="store_true",
+        help="quantize colors to the xterm 256-color palette",
+    )
+
+
+def set_palette_256(enabled: bool) -> None:
+    """
+    Switch color escapes between truecolor and the xterm 256-color palette.
+
+    Cached escapes and rendered rows were built for the previous mode, so
+    they are discarded when the mode actually changes.
+    """
+    global PALETTE_256
+    if enabled == PALETTE_256:
+        return
+    PALETTE_256 = enabled
+    _FG_CACHE.clear()
+    _BG_CACHE.clear()
+    ryg_bg_escapes.cache_clear()
+    row_cache.clear()
+
+
+def import_core() -> ModuleType:
+    """
+    Import ``par_term_emu_core_rust``, exiting with build instructions if it
+    is missing.
+
+    The streaming scripts call this from ``main()`` after parsing arguments,
+    so ``--help`` works instantly and without the extension built.
+    """
+    try:
+        import par_term_emu_core_rust
+    except ImportError:
+        print("Error: par_term_emu_core_rust module not found.")
+        print("Build the module with: uv run maturin develop --features streaming")
+        sys.exit(1)
+    return par_term_emu_core_rust
+
+
+def start_stdin_reader() -> "queue.SimpleQueue[str]":
+    """
+    Read stdin lines on a daemon thread and return the queue they arrive on.
+
+    Event loops can then check for a command with ``get_nowait()`` instead of
+    a ``select()`` on stdin every iteration (which also does not work on
+    Windows). Input is read with raw ``os.read`` calls and split into lines
+    here, bypassing ``sys.stdin``'s buffered text layer. The thread stops at
+    EOF; a trailing unterminated line is still delivered.
+    """
+    lines: "queue.SimpleQueue[str]" = queue.SimpleQueue()
+    fd = sys.stdin.fileno()
+
+    def pump() -> None:
+        pending = b""
+        while data := os.read(fd, 4096):
+            *complete, pending = (pending + data).split(b"\n")
+            for line in complete:
+                lines.put(line.decode(errors="replace") + "\n")
+        if pending:
+            lines.put(pending.decode(errors="replace"))
+
+    threading.Thread(target=pump, name="stdin-reader", daemon=True).start()
+    return lines
+
+
+class ThrottledPrinter:
+    """
+    Print messages at most once per `interval` seconds.
+
+    Messages arriving inside the window are counted and the count is
+    reported with the next printed message, so an error that repeats on
+    every loop iteration cannot flood the console.
+    """
+
+    def __init__(self, interval: float = 1.0) -> None:
+        self.interval = interval
+        self._next = 0.0
+        self._suppressed = 0
+
+    def __call__(self, message: str) -> None:
+        now = time.monotonic()
+        if now < self._next:
+            self._suppressed += 1
+            return
+        if self._suppressed:
+            message += f" ({self._suppressed} similar suppressed)"
+            self._suppressed = 0
+        print(message)
+        self._next = now + self.interval
+
+
+def next_command(commands: "queue.SimpleQueue[str]") -> str | None:
+    """Return the next queued stdin command, normalized, or None if there is none."""
+    try:
+        return commands.get_nowait().strip().lower()
+    except queue.Empty:
+        return None
+
+
+def close_streaming_session(pty_terminal: Any, streaming_server: Any, reason: str) -> None:
+    """
+    Shut down `streaming_server` (telling clients `reason`) and ask the shell
+    running in `pty_terminal` to exit.
+
+    Shared teardown for the streaming scripts; errors are reported, not
+    raised, so cleanup always runs to completion.
+    """
+    try:
+        streaming_server.shutdown(reason)
+    except Exception as e:
+        print(f"Error shutting down streaming server: {e}")
+
+    if pty_terminal.is_running():
+        try:
+            pty_terminal.write(b"exit\n")
+            time.sleep(0.5)
+        except Exception:
+            pass
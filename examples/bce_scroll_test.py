@@ -12,23 +12,32 @@ If xterm.js incorrectly uses BCE, new lines during scroll will
 have the wrong background color.
 
 Usage:
-    python examples/bce_scroll_test.py
+    python examples/bce_scroll_test.py [--palette-256]
 """
 
+import argparse
 import os
 import sys
 import time
 
-
-def get_terminal_size() -> tuple[int, int]:
-    """Get terminal size."""
-    import shutil
-    size = shutil.get_terminal_size()
-    return (size.columns, size.lines)
+from _common import (
+    RESET,
+    add_palette_argument,
+    get_terminal_size,
+    ryg_bg_escapes,
+    ryg_gradient,
+    set_palette_256,
+    write_bytes,
+)
 
 
 def main() -> None:
     """Run BCE scroll test."""
+    parser = argparse.ArgumentParser(description="BCE scroll test")
+    add_palette_argument(parser)
+    args = parser.parse_args()
+    set_palette_256(args.palette_256)
+
     cols, rows = get_terminal_size()
     print(f"Terminal size: {cols}x{rows}")
     print()
@@ -68,28 +77,23 @@ def main() -> None:
     print()
     time.sleep(1)
 
+    # Both rapid tests share the same per-row gradient, so compute it once
+    row_colors = ryg_gradient(rows + 5)
+    row_escapes = ryg_bg_escapes(rows + 5)
+
     # This mimics what Rich does - rapid colored output
     for i in range(rows + 5):
         # Progress through colors: red -> yellow -> green
-        t = i / max(rows + 4, 1)
-        if t < 0.5:
-            t2 = t * 2
-            r = 255
-            g = int(255 * t2)
-            b = 0
-        else:
-            t2 = (t - 0.5) * 2
-            r = int(255 * (1 - t2))
-            g = 255
-            b = 0
-
-        # Set background color and output
-        sys.stdout.write(f"\x1b[48;2;{r};{g};{b}m")
-        sys.stdout.write(f" Row {i+1:3d} ")
-        sys.stdout.write("\x1b[0m")  # Reset after content but before newline
-        sys.stdout.write(f" <- BG should be default here, not RGB({r},{g},{b})")
-        sys.stdout.write("\n")
-        sys.stdout.flush()
+        r, g, b = row_colors[i]
+
+        # Set background color and output, resetting after content but
+        # before the newline
+        write_bytes(
+            row_escapes[i]
+            + f" Row {i+1:3d} ".encode()
+            + RESET
+            + f" <- BG should be default here, not RGB({r},{g},{b})\n".encode()
+        )
 
     print()
     print("=== Test 3: No reset before newline (worst case) ===")
@@ -98,27 +102,14 @@ def main() -> None:
     time.sleep(1)
 
     for i in range(rows + 5):
-        t = i / max(rows + 4, 1)
-        if t < 0.5:
-            t2 = t * 2
-            r = 255
-            g = int(255 * t2)
-            b = 0
-        else:
-            t2 = (t - 0.5) * 2
-            r = int(255 * (1 - t2))
-            g = 255
-            b = 0
+        r, g, b = row_colors[i]
 
         # Set background and output content
-        sys.stdout.write(f"\x1b[48;2;{r};{g};{b}m")
-        sys.stdout.write(f" Row {i+1:3d} - BG is RGB({r},{g},{b})")
         # NO RESET before newline - if BCE, rest of line gets this color
-        sys.stdout.write("\n")
-        sys.stdout.flush()
+        write_bytes(row_escapes[i] + f" Row {i+1:3d} - BG is RGB({r},{g},{b})\n".encode())
 
-    # Final reset
-    sys.stdout.write("\x1b[0m")
+    # Final reset (flushed by the print below)
+    write_bytes(RESET, flush=False)
     print()
     print("=== Test Complete ===")
     print("Scroll up and check:")
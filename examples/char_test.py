@@ -8,50 +8,80 @@ The ▄ character (U+2584, lower half block) causes artifacts.
 Let's test other characters to narrow down the issue.
 
 Usage:
-    python examples/char_test.py
+    python examples/char_test.py [--palette-256]
 """
 
+import argparse
 import colorsys
-import sys
+import functools
 
+from _common import (
+    SgrEmitter,
+    add_palette_argument,
+    flush_bounded,
+    get_terminal_size,
+    row_cache,
+    set_palette_256,
+)
 
-def get_terminal_size() -> tuple[int, int]:
-    """Get terminal size."""
-    import shutil
-    size = shutil.get_terminal_size()
-    return (size.columns, size.lines)
+RgbRow = list[tuple[int, int, int]]
 
 
-def rgb_fg(r: int, g: int, b: int) -> str:
-    return f"\x1b[38;2;{r};{g};{b}m"
+def gradient_row(cols: int, char: str, use_fg: bool = True) -> bytes:
+    """
+    Generate one row of gradient with the specified character.
 
+    Each test repeats the same row many times, so rows are memoized in the
+    shared row cache; the column colors are shared across all tests.
+    """
+    return row_cache.get_or_build(
+        ("char", cols, char, use_fg), lambda: _build_gradient_row(cols, char, use_fg)
+    )
 
-def rgb_bg(r: int, g: int, b: int) -> str:
-    return f"\x1b[48;2;{r};{g};{b}m"
 
+# Background lightness of the gradient; the FG sits LIGHTNESS_FG_OFFSET above
+LIGHTNESS = 0.4
+LIGHTNESS_FG_OFFSET = 0.1
 
-def reset() -> str:
-    return "\x1b[0m"
 
+@functools.lru_cache(maxsize=None)
+def column_colors(cols: int, l: float) -> tuple[RgbRow, RgbRow]:
+    """
+    Return the per-column (FG colors, BG colors) of the gradient at lightness `l`.
 
-def gradient_row(cols: int, char: str, use_fg: bool = True) -> str:
-    """Generate one row of gradient with the specified character."""
-    output = []
+    Hue depends only on the column, so the HLS conversions run once per width
+    and are shared by every character test.
+    """
+    fg: RgbRow = []
+    bg: RgbRow = []
     for x in range(cols):
         h = x / cols
-        l = 0.4
-
         r1, g1, b1 = colorsys.hls_to_rgb(h, l, 1.0)
-        r2, g2, b2 = colorsys.hls_to_rgb(h, l + 0.1, 1.0)
+        r2, g2, b2 = colorsys.hls_to_rgb(h, l + LIGHTNESS_FG_OFFSET, 1.0)
+        fg.append((int(r2 * 255), int(g2 * 255), int(b2 * 255)))
+        bg.append((int(r1 * 255), int(g1 * 255), int(b1 * 255)))
+    return fg, bg
+
 
+def _build_gradient_row(cols: int, char: str, use_fg: bool) -> bytes:
+    """Render one gradient row with the specified character (uncached)."""
+    char_bytes = char.encode()
+    fg_colors, bg_colors = column_colors(cols, LIGHTNESS)
+    sgr = SgrEmitter()
+    output = []
+    # Bind the per-cell callables once instead of looking them up per cell
+    append = output.append
+    set_fg = sgr.set_fg
+    set_bg = sgr.set_bg
+    for x in range(cols):
         if use_fg:
-            output.append(rgb_fg(int(r2 * 255), int(g2 * 255), int(b2 * 255)))
-        output.append(rgb_bg(int(r1 * 255), int(g1 * 255), int(b1 * 255)))
-        output.append(char)
-        output.append(reset())
+            append(set_fg(*fg_colors[x]))
+        append(set_bg(*bg_colors[x]))
+        append(char_bytes)
 
-    output.append("\n")
-    return "".join(output)
+    append(sgr.finish_line())
+    append(b"\n")
+    return b"".join(output)
 
 
 def test_character(name: str, char: str, cols: int, rows: int, use_fg: bool = True) -> None:
@@ -59,9 +89,8 @@ def test_character(name: str, char: str, cols: int, rows: int, use_fg: bool = Tr
     print(f"--- {name}: '{char}' (U+{ord(char):04X}) {'FG+BG' if use_fg else 'BG only'} ---")
 
     # Generate enough rows to trigger scroll
-    for _ in range(rows + 5):
-        sys.stdout.write(gradient_row(cols, char, use_fg))
-    sys.stdout.flush()
+    row = gradient_row(cols, char, use_fg)
+    flush_bounded(row for _ in range(rows + 5))
 
     print()
     input("Press Enter for next test...")
@@ -69,6 +98,11 @@ def test_character(name: str, char: str, cols: int, rows: int, use_fg: bool = Tr
 
 
 def main() -> None:
+    parser = argparse.ArgumentParser(description="Character-specific test")
+    add_palette_argument(parser)
+    args = parser.parse_args()
+    set_palette_256(args.palette_256)
+
     cols, rows = get_terminal_size()
     print(f"Terminal size: {cols}x{rows}")
     print()
@@ -7,7 +7,7 @@ It can be used to verify that both xterm.js (streaming) and TUI correctly handle
 line wrapping at the terminal width boundary.
 
 Usage:
-    python examples/gradient_test.py
+    python examples/gradient_test.py [--palette-256]
 
 The test outputs:
 1. Terminal size (as queried via ioctl)
@@ -18,31 +18,29 @@ If the gradient wraps incorrectly, you'll see part of the gradient on the second
 line before the marker character.
 """
 
+import argparse
 import os
+import shutil
 import sys
 
+from _common import (
+    SgrEmitter,
+    add_palette_argument,
+    flush_bounded,
+    row_cache,
+    ryg_gradient,
+    set_palette_256,
+    write_bytes,
+)
 
 def get_terminal_size() -> tuple[int, int]:
-    """Get terminal size using multiple methods for debugging."""
-    # Method 1: os.get_terminal_size()
-    try:
-        size = os.get_terminal_size()
-        print(f"os.get_terminal_size(): {size.columns}x{size.lines}")
-    except OSError as e:
-        print(f"os.get_terminal_size() failed: {e}")
-        size = None
-
-    # Method 2: shutil
-    import shutil
-
-    try:
-        shutil_size = shutil.get_terminal_size()
-        print(f"shutil.get_terminal_size(): {shutil_size.columns}x{shutil_size.lines}")
-    except Exception as e:
-        print(f"shutil.get_terminal_size() failed: {e}")
-        shutil_size = None
+    """
+    Get terminal size, reporting which query method answered.
 
-    # Method 3: Direct ioctl (Unix only)
+    Methods are tried cheapest-first (direct ioctl, os, shutil) and the first
+    that succeeds wins, rather than querying all three.
+    """
+    # Method 1: Direct ioctl (Unix only)
     if sys.platform != "win32":
         try:
             import fcntl
@@ -51,61 +49,53 @@ def get_terminal_size() -> tuple[int, int]:
 
             result = fcntl.ioctl(sys.stdout.fileno(), termios.TIOCGWINSZ, b"\x00" * 8)
             rows, cols, _, _ = struct.unpack("HHHH", result)
-            print(f"Direct ioctl TIOCGWINSZ: {cols}x{rows}")
+            if cols and rows:
+                print(f"Direct ioctl TIOCGWINSZ: {cols}x{rows}")
+                return (cols, rows)
         except Exception as e:
             print(f"Direct ioctl failed: {e}")
 
-    # Use shutil as fallback since it handles edge cases
-    if shutil_size:
-        return (shutil_size.columns, shutil_size.lines)
-    if size:
+    # Method 2: os.get_terminal_size()
+    try:
+        size = os.get_terminal_size()
+        print(f"os.get_terminal_size(): {size.columns}x{size.lines}")
         return (size.columns, size.lines)
-    return (80, 24)  # fallback
-
-
-def rgb_to_ansi_bg(r: int, g: int, b: int) -> str:
-    """Return ANSI escape sequence for 24-bit background color."""
-    return f"\x1b[48;2;{r};{g};{b}m"
-
+    except OSError as e:
+        print(f"os.get_terminal_size() failed: {e}")
 
-def reset_style() -> str:
-    """Return ANSI reset sequence."""
-    return "\x1b[0m"
+    # Method 3: shutil handles the remaining edge cases (env vars, fallback)
+    size = shutil.get_terminal_size()
+    print(f"shutil.get_terminal_size(): {size.columns}x{size.lines}")
+    return (size.columns, size.lines)
 
 
-def gradient_bar(cols: int) -> str:
+def gradient_bar(cols: int) -> bytes:
     """
     Generate a gradient bar that fills exactly `cols` characters.
 
     The gradient goes from red (left) through yellow to green (right).
-    Each character is a space with a background color.
+    Each character is a space with a background color. Bars are memoized in
+    the shared row cache, so every test and row of the same width reuses one
+    rendering.
     """
-    result = []
-    for i in range(cols):
-        # Progress from 0.0 to 1.0
-        t = i / max(cols - 1, 1)
-
-        # Red to Yellow (0.0 to 0.5)
-        if t < 0.5:
-            t2 = t * 2  # 0.0 to 1.0
-            r = 255
-            g = int(255 * t2)
-            b = 0
-        # Yellow to Green (0.5 to 1.0)
-        else:
-            t2 = (t - 0.5) * 2  # 0.0 to 1.0
-            r = int(255 * (1 - t2))
-            g = 255
-            b = 0
+    return row_cache.get_or_build(("rgy-bar", cols), lambda: _build_bar(cols))
 
-        result.append(rgb_to_ansi_bg(r, g, b) + " ")
 
-    result.append(reset_style())
-    return "".join(result)
+def _build_bar(cols: int) -> bytes:
+    """Render the gradient bar for `cols` columns (uncached)."""
+    sgr = SgrEmitter()
+    result = [sgr.set_bg(r, g, b) + b" " for r, g, b in ryg_gradient(cols)]
+    result.append(sgr.finish_line())
+    return b"".join(result)
 
 
 def main() -> None:
     """Run the gradient test."""
+    parser = argparse.ArgumentParser(description="Minimal gradient wrap test")
+    add_palette_argument(parser)
+    args = parser.parse_args()
+    set_palette_256(args.palette_256)
+
     print("=== Gradient Wrap Test ===")
     print()
 
@@ -148,21 +138,20 @@ def main() -> None:
     label_width = 30
     num_gradient_rows = rows + 10
 
+    # Accumulate all rows and write them in bounded chunks
+    output = []
     for row_num in range(num_gradient_rows):
         # Get label for this row (cycle through labels)
         label = labels[row_num % len(labels)]
-        padded_label = label.ljust(label_width)
+        padded_label = label.ljust(label_width).encode()
 
         # Calculate remaining width for gradient
         gradient_width = cols - label_width
         if gradient_width > 0:
-            gradient = gradient_bar(gradient_width)
-            sys.stdout.write(padded_label)
-            sys.stdout.write(gradient)
-            sys.stdout.write("\n")
+            output.append(padded_label + gradient_bar(gradient_width) + b"\n")
         else:
-            sys.stdout.write(padded_label + "\n")
-        sys.stdout.flush()
+            output.append(padded_label + b"\n")
+    flush_bounded(output)
 
     print()
     print(f"▶ Marker after {num_gradient_rows} gradient rows with labels")
@@ -176,7 +165,7 @@ def main() -> None:
 
     # Output exactly cols characters (gradient bar)
     gradient = gradient_bar(cols)
-    print(gradient)
+    write_bytes(gradient + b"\n", flush=False)
 
     # Output a marker to see where the cursor ends up
     print("▶ Marker (should be at start of this line)")
@@ -187,7 +176,7 @@ def main() -> None:
     print()
 
     gradient_minus_1 = gradient_bar(cols - 1)
-    print(gradient_minus_1)
+    write_bytes(gradient_minus_1 + b"\n", flush=False)
     print("▶ Marker")
     print()
 
@@ -196,7 +185,7 @@ def main() -> None:
     print()
 
     gradient_plus_1 = gradient_bar(cols + 1)
-    print(gradient_plus_1)
+    write_bytes(gradient_plus_1 + b"\n", flush=False)
     print("▶ Marker (should be AFTER the 1 wrapped char)")
     print()
 
@@ -211,18 +200,7 @@ def main() -> None:
 
         # Create a gradient text that fills the width
         text = Text()
-        for i in range(console_width):
-            t = i / max(console_width - 1, 1)
-            if t < 0.5:
-                t2 = t * 2
-                r = 255
-                g = int(255 * t2)
-                b = 0
-            else:
-                t2 = (t - 0.5) * 2
-                r = int(255 * (1 - t2))
-                g = 255
-                b = 0
+        for r, g, b in ryg_gradient(console_width):
             text.append(" ", style=f"on rgb({r},{g},{b})")
 
         console.print(text)
@@ -2,143 +2,203 @@
 """
 Rich Mimic Test
 
-This test mimics exactly how Rich outputs its gradient:
+This test approximates how Rich outputs its gradient:
 1. Uses the ▄ (lower half block) character like Rich's ColorBox
 2. Uses both foreground AND background colors
-3. Outputs the entire content in one large write (like Rich does)
+3. Builds the entire content up front and writes it in large chunks of at
+   most 256 KiB each, rather than one row or cell at a time
+
+The byte stream is not identical to Rich's: colors are only emitted when they
+change and each row ends with a single reset, whereas Rich writes ``ESC[0m``
+after every cell, so a result here is not a byte-for-byte replay of Rich.
 
 This should help identify if the issue is specific to:
 - The ▄ character
 - Using both FG and BG colors together
-- Large batch writes
+- Large (256 KiB) writes
 - Something else in Rich's rendering
 
 Usage:
-    python examples/rich_mimic_test.py
+    python examples/rich_mimic_test.py [--palette-256]
 """
 
+import argparse
 import colorsys
 import os
-import sys
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+
+from _common import (
+    ChunkWriter,
+    SgrEmitter,
+    add_palette_argument,
+    get_terminal_size,
+    render_bg_row,
+    row_cache,
+    set_palette_256,
+    write_bytes,
+)
 
+# Number of lightness buckets used to key the Test 1 row cache. Quantizing
+# lightness bounds the cache size while staying visually indistinguishable.
+LIGHTNESS_BUCKETS = 64
 
-def get_terminal_size() -> tuple[int, int]:
-    """Get terminal size."""
-    import shutil
-    size = shutil.get_terminal_size()
-    return (size.columns, size.lines)
+# Above this many cells, Test 1 rows are pre-rendered in a process pool.
+PARALLEL_THRESHOLD = 50_000
 
+# Pre-encoded lower half block, the character Rich's ColorBox uses
+BLOCK = "▄".encode()
 
-def rgb_fg(r: int, g: int, b: int) -> str:
-    """Set RGB foreground color."""
-    return f"\x1b[38;2;{r};{g};{b}m"
 
+def column_hues(cols: int) -> list[float]:
+    """Return the hue for each column (hue depends only on x)."""
+    return [x / cols for x in range(cols)]
 
-def rgb_bg(r: int, g: int, b: int) -> str:
-    """Set RGB background color."""
-    return f"\x1b[48;2;{r};{g};{b}m"
 
+def colorbox_row_at(cols: int, l: float) -> bytes:
+    """
+    Render one ColorBox-style row of ▄ cells at lightness `l`.
 
-def reset() -> str:
-    """Reset all attributes."""
-    return "\x1b[0m"
+    The FG lightness sits slightly above the BG lightness, like Rich. Unlike
+    Rich, colors are only re-emitted when they change and the row ends with
+    one reset instead of one per cell.
+    """
+    sgr = SgrEmitter()
+    output = []
+    # Bind the per-cell callables once instead of looking them up per cell
+    append = output.append
+    hls_to_rgb = colorsys.hls_to_rgb
+    set_fg = sgr.set_fg
+    set_bg = sgr.set_bg
+    l_fg = l + 0.07
+    for h in column_hues(cols):
+        r1, g1, b1 = hls_to_rgb(h, l, 1.0)
+        r2, g2, b2 = hls_to_rgb(h, l_fg, 1.0)
+        append(set_fg(int(r2 * 255), int(g2 * 255), int(b2 * 255)))
+        append(set_bg(int(r1 * 255), int(g1 * 255), int(b1 * 255)))
+        append(BLOCK)
+    append(sgr.finish_line())
+    return b"".join(output)
+
+
+def bucket_lightness(bucket: int) -> float:
+    """Return the Test 1 BG lightness for a lightness bucket."""
+    return 0.1 + (bucket / LIGHTNESS_BUCKETS) * 0.7
+
+
+def colorbox_row(cols: int, bucket: int) -> bytes:
+    """
+    Render one ColorBox-style row of ▄ cells for the given lightness bucket.
+
+    Rows are memoized in the shared row cache so repeated widths/buckets are
+    free.
+    """
+    return row_cache.get_or_build(
+        ("colorbox", cols, bucket), lambda: colorbox_row_at(cols, bucket_lightness(bucket))
+    )
+
+
+def prerender_rows(cols: int, buckets: list[int], palette_256: bool) -> None:
+    """
+    Render the uncached rows for `buckets` across all CPU cores.
+
+    Rows are independent, so they are split into contiguous bands, rendered
+    by worker processes, and stored in the shared row cache in order. Workers
+    are switched to the same color mode as this process first.
+    """
+    missing = sorted(
+        {bucket for bucket in buckets if ("colorbox", cols, bucket) not in row_cache}
+    )
+    if not missing:
+        return
+
+    workers = os.cpu_count() or 1
+    lightness = [bucket_lightness(bucket) for bucket in missing]
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=set_palette_256, initargs=(palette_256,)
+    ) as pool:
+        rows = pool.map(
+            colorbox_row_at,
+            repeat(cols),
+            lightness,
+            chunksize=max(1, len(missing) // workers),
+        )
+        for bucket, row in zip(missing, rows):
+            row_cache.put(("colorbox", cols, bucket), row)
 
 
 def main() -> None:
     """Run Rich mimic test."""
+    parser = argparse.ArgumentParser(description="Rich ColorBox mimic test")
+    add_palette_argument(parser)
+    args = parser.parse_args()
+    set_palette_256(args.palette_256)
+
     cols, rows = get_terminal_size()
     print(f"Terminal size: {cols}x{rows}")
     print()
 
-    # Test 1: Mimic Rich's ColorBox exactly
-    # Rich uses ▄ with both FG and BG colors, outputs in one batch
-    print("=== Test 1: Mimic Rich ColorBox (single batch) ===")
-    print("Using ▄ character with FG+BG colors, output all at once...")
+    # Test 1: Approximate Rich's ColorBox
+    # Rich uses ▄ with both FG and BG colors, output in large writes
+    print("=== Test 1: Mimic Rich ColorBox (256 KiB writes) ===")
+    print("Using ▄ character with FG+BG colors, output in 256 KiB chunks...")
     print()
 
-    # Build entire output in memory first (like Rich does)
-    output = []
-
     # Generate enough rows to trigger scroll
     num_rows = rows + 10
 
-    for y in range(num_rows):
-        for x in range(cols):
-            h = x / cols
-            l = 0.1 + ((y / num_rows) * 0.7)
-
-            # Two slightly different lightness values for FG and BG
-            r1, g1, b1 = colorsys.hls_to_rgb(h, l, 1.0)
-            r2, g2, b2 = colorsys.hls_to_rgb(h, l + 0.07, 1.0)
-
-            # FG and BG like Rich does
-            output.append(rgb_fg(int(r2 * 255), int(g2 * 255), int(b2 * 255)))
-            output.append(rgb_bg(int(r1 * 255), int(g1 * 255), int(b1 * 255)))
-            output.append("▄")
-            output.append(reset())  # Rich resets after each segment
-
-        output.append("\n")
+    buckets = [(y * LIGHTNESS_BUCKETS) // num_rows for y in range(num_rows)]
+    if num_rows * cols > PARALLEL_THRESHOLD:
+        prerender_rows(cols, buckets, args.palette_256)
 
-    # Write ALL at once (like Rich does)
-    sys.stdout.write("".join(output))
-    sys.stdout.flush()
+    # Build the output in memory and write it in chunks of at most 256 KiB
+    with ChunkWriter() as out:
+        for bucket in buckets:
+            out.write(colorbox_row(cols, bucket))
+            out.write(b"\n")
 
     print()
-    print("=== Test 2: Same but character-by-character ===")
-    print("Using ▄ character with FG+BG colors, output one at a time...")
+    print("=== Test 2: Same but row-by-row ===")
+    print("Using ▄ character with FG+BG colors, output one row at a time...")
     print()
 
     import time
 
-    for y in range(10):  # Fewer rows for this test
-        for x in range(cols):
-            h = x / cols
-            l = 0.3
-
-            r1, g1, b1 = colorsys.hls_to_rgb(h, l, 1.0)
-            r2, g2, b2 = colorsys.hls_to_rgb(h, l + 0.07, 1.0)
+    # Lightness is constant here, so the row only needs rendering once
+    row = colorbox_row_at(cols, 0.3) + b"\n"
 
-            sys.stdout.write(rgb_fg(int(r2 * 255), int(g2 * 255), int(b2 * 255)))
-            sys.stdout.write(rgb_bg(int(r1 * 255), int(g1 * 255), int(b1 * 255)))
-            sys.stdout.write("▄")
-            sys.stdout.write(reset())
-            sys.stdout.flush()
-
-        sys.stdout.write("\n")
-        sys.stdout.flush()
+    for y in range(10):  # Fewer rows for this test
+        # One write and flush per row instead of one per character
+        write_bytes(row)
 
     print()
-    print("=== Test 3: Space only (no FG color) in single batch ===")
-    print("Using space with BG color only, output all at once...")
+    print("=== Test 3: Space only (no FG color) in 256 KiB writes ===")
+    print("Using space with BG color only, output in 256 KiB chunks...")
     print()
 
-    output = []
-    for y in range(num_rows):
-        for x in range(cols):
-            h = x / cols
+    hues = column_hues(cols)
+    hls_to_rgb = colorsys.hls_to_rgb
+    with ChunkWriter() as out:
+        for y in range(num_rows):
             l = 0.3 + ((y / num_rows) * 0.5)
+            channels: list[int] = []
+            for h in hues:
+                r, g, b = hls_to_rgb(h, l, 1.0)
+                channels += (int(r * 255), int(g * 255), int(b * 255))
 
-            r, g, b = colorsys.hls_to_rgb(h, l, 1.0)
-
-            output.append(rgb_bg(int(r * 255), int(g * 255), int(b * 255)))
-            output.append(" ")
-            output.append(reset())
-
-        output.append("\n")
-
-    sys.stdout.write("".join(output))
-    sys.stdout.flush()
+            out.write(render_bg_row(cols, channels))
+            out.write(b"\n")
 
     print()
     print("=== Test Complete ===")
     print()
     print("Compare the tests:")
-    print("- Test 1 (▄ + FG+BG, batch) - mimics Rich exactly")
-    print("- Test 2 (▄ + FG+BG, char-by-char)")
-    print("- Test 3 (space + BG only, batch)")
+    print("- Test 1 (▄ + FG+BG, 256 KiB writes) - closest to Rich")
+    print("- Test 2 (▄ + FG+BG, row-by-row)")
+    print("- Test 3 (space + BG only, 256 KiB writes)")
     print()
-    print("If only Test 1 has artifacts, the issue is batch + special char")
-    print("If Test 1 and 3 have artifacts, the issue is batch writing")
+    print("If only Test 1 has artifacts, the issue is large writes + special char")
+    print("If Test 1 and 3 have artifacts, the issue is large writes")
     print("If none have artifacts, the issue is something else in Rich")
 
 
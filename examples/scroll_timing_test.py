@@ -9,29 +9,25 @@ The key question: when scroll occurs mid-line during gradient output,
 is the cursor position preserved correctly?
 
 Usage:
-    python examples/scroll_timing_test.py
+    python examples/scroll_timing_test.py [--palette-256]
 """
 
+import argparse
 import os
-import sys
 import time
 
+from _common import (
+    SgrEmitter,
+    add_palette_argument,
+    get_terminal_size,
+    render_bg_row,
+    set_palette_256,
+    write_bytes,
+    write_vectored,
+)
 
-def get_terminal_size() -> tuple[int, int]:
-    """Get terminal size."""
-    import shutil
-    size = shutil.get_terminal_size()
-    return (size.columns, size.lines)
-
-
-def rgb_bg(r: int, g: int, b: int) -> str:
-    """Set RGB background color."""
-    return f"\x1b[48;2;{r};{g};{b}m"
-
-
-def reset() -> str:
-    """Reset all attributes."""
-    return "\x1b[0m"
+# Pre-encoded full block used for the Test 1 gradient cells
+FULL_BLOCK = "█".encode()
 
 
 def cursor_pos() -> str:
@@ -39,14 +35,31 @@ def cursor_pos() -> str:
     return "\x1b[6n"
 
 
+def column_colors(cols: int) -> tuple[list[int], list[int]]:
+    """
+    Return the per-column red and base green channels of the test gradient.
+
+    Both depend only on the column, so they are computed once per width
+    instead of once per cell.
+    """
+    reds = [255 - int((col / cols) * 200) for col in range(cols)]
+    greens = [int((col / cols) * 100) for col in range(cols)]
+    return reds, greens
+
+
 def main() -> None:
     """Run scroll timing test."""
+    parser = argparse.ArgumentParser(description="Scroll timing test")
+    add_palette_argument(parser)
+    args = parser.parse_args()
+    set_palette_256(args.palette_256)
+
     cols, rows = get_terminal_size()
     print(f"Terminal size: {cols}x{rows}")
     print()
 
-    # Test 1: Output styled content character by character to see exact scroll point
-    print("=== Test 1: Character-by-character styled output ===")
+    # Test 1: Output styled content a row at a time to see exact scroll point
+    print("=== Test 1: Row-by-row styled output ===")
     print("Watch for the exact moment scroll happens...")
     print()
     time.sleep(1)
@@ -58,53 +71,40 @@ def main() -> None:
     print("Now outputting gradient that will trigger scroll:")
     print()
 
-    # Output gradient one character at a time with delays
-    for col in range(cols):
-        # Red gradient
-        r = 255 - int((col / cols) * 200)
-        g = int((col / cols) * 100)
-        b = 0
+    reds, greens = column_colors(cols)
+
+    # Build the gradient row once; each row is emitted with a single write and
+    # flush rather than one flush per character
+    sgr = SgrEmitter()
+    row = b"".join(
+        [sgr.set_bg(reds[col], greens[col], 0) + FULL_BLOCK for col in range(cols)]
+    )
 
-        sys.stdout.write(rgb_bg(r, g, b))
-        sys.stdout.write("█")
-        sys.stdout.flush()
-        # Small delay to see what's happening
-        time.sleep(0.01)
+    write_vectored([row])
+    # One pause before the scroll so the rendered row can be inspected; the
+    # total time matches the old per-character delays of the first row
+    time.sleep(cols * 0.01)
 
     # Now the critical moment - newline while background is set
-    sys.stdout.write("\n")
-    sys.stdout.flush()
+    write_bytes(b"\n")
 
     # Continue on next line (after scroll)
-    for col in range(cols):
-        r = 255 - int((col / cols) * 200)
-        g = int((col / cols) * 100)
-        b = 0
+    write_vectored([row])
 
-        sys.stdout.write(rgb_bg(r, g, b))
-        sys.stdout.write("█")
-        sys.stdout.flush()
-        time.sleep(0.01)
-
-    sys.stdout.write(reset())
-    sys.stdout.write("\n\n")
+    write_bytes(sgr.finish_line() + b"\n\n", flush=False)
 
     print("=== Test 2: Fast output (realistic scenario) ===")
     time.sleep(1)
 
-    # Now test at full speed
+    # Now test at full speed; each row is formatted in one call
     for row in range(rows + 5):
+        g_row = int((row / (rows + 5)) * 155)
+        b = int((row / (rows + 5)) * 100)
+        channels: list[int] = []
         for col in range(cols):
-            r = 255 - int((col / cols) * 200)
-            g = int((col / cols) * 100) + int((row / (rows + 5)) * 155)
-            b = int((row / (rows + 5)) * 100)
-
-            sys.stdout.write(rgb_bg(r, g, b))
-            sys.stdout.write(" ")
+            channels += (reds[col], greens[col] + g_row, b)
 
-        sys.stdout.write(reset())
-        sys.stdout.write("\n")
-        sys.stdout.flush()
+        write_vectored([render_bg_row(cols, channels), b"\n"])
 
     print()
     print("=== Test 3: With explicit SGR reset before newline ===")
@@ -112,18 +112,14 @@ def main() -> None:
     time.sleep(1)
 
     for row in range(rows + 5):
+        g_row = int((row / (rows + 5)) * 155)
+        b = int((row / (rows + 5)) * 100)
+        channels = []
         for col in range(cols):
-            r = 255 - int((col / cols) * 200)
-            g = int((col / cols) * 100) + int((row / (rows + 5)) * 155)
-            b = int((row / (rows + 5)) * 100)
-
-            sys.stdout.write(rgb_bg(r, g, b))
-            sys.stdout.write(" ")
+            channels += (reds[col], greens[col] + g_row, b)
 
-        # RESET BEFORE NEWLINE
-        sys.stdout.write(reset())
-        sys.stdout.write("\n")
-        sys.stdout.flush()
+        # RESET BEFORE NEWLINE (the row template ends with a reset)
+        write_vectored([render_bg_row(cols, channels), b"\n"])
 
     print()
     print("=== Test Complete ===")
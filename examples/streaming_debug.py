@@ -15,25 +15,33 @@ Then in the web terminal:
 2. Check the console output for size discrepancies
 """
 
-import argparse
 import sys
 import time
-import select
 from pathlib import Path
 
 # Add parent directory to path for development
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-try:
-    import par_term_emu_core_rust as terminal_core
-except ImportError:
-    print("Error: par_term_emu_core_rust module not found.")
-    print("Build the module with: uv run maturin develop --features streaming")
-    sys.exit(1)
+from _common import (
+    ThrottledPrinter,
+    close_streaming_session,
+    import_core,
+    next_command,
+    start_stdin_reader,
+)
+
+# Bounds for coalescing queued resize requests into a single resize
+RESIZE_DRAIN_WINDOW = 0.016  # seconds
+RESIZE_DRAIN_MAX = 32
+
+# Pause after a failed resize wait so a persistent error cannot spin the loop
+ERROR_BACKOFF = 0.1  # seconds
 
 
 def main() -> None:
     """Run the streaming debug server."""
+    import argparse
+
     parser = argparse.ArgumentParser(description="Streaming Debug Server")
     parser.add_argument(
         "--host", default="127.0.0.1", help="Host to bind to (default: 127.0.0.1)"
@@ -49,6 +57,9 @@ def main() -> None:
     )
     args = parser.parse_args()
 
+    # Deferred until after argument parsing so --help is instant
+    terminal_core = import_core()
+
     # Create PTY terminal
     print(f"[DEBUG] Creating terminal ({args.cols}x{args.rows})...")
     pty_terminal = terminal_core.PtyTerminal(args.cols, args.rows, 1000)
@@ -64,8 +75,6 @@ def main() -> None:
         print(f"Error starting shell: {e}")
         sys.exit(1)
 
-    time.sleep(0.2)
-
     # Create streaming server
     addr = f"{args.host}:{args.port}"
     print(f"[DEBUG] Creating streaming server on {addr}...")
@@ -84,8 +93,6 @@ def main() -> None:
         print(f"Error starting streaming server: {e}")
         sys.exit(1)
 
-    time.sleep(0.5)
-
     print(f"\n{'='*60}")
     print("  Streaming Debug Server Running")
     print(f"{'='*60}")
@@ -100,6 +107,10 @@ def main() -> None:
     last_resize_time = 0.0
     resize_count = 0
 
+    # Operator commands are read off the event loop (see start_stdin_reader)
+    commands = start_stdin_reader()
+    report_error = ThrottledPrinter()
+
     try:
         while True:
             # Check if PTY process has exited
@@ -107,11 +118,26 @@ def main() -> None:
                 print("\n[DEBUG] PTY process has exited")
                 break
 
-            # Poll for resize requests (FAST - 10ms instead of 100ms)
+            # Block until a resize request arrives (wakes immediately) or the
+            # timeout elapses, so stdin and process exit are still checked
             try:
-                resize_request = streaming_server.poll_resize()
+                resize_request = streaming_server.wait_resize(timeout=0.1)
                 if resize_request is not None:
+                    # Window drags send resize storms; drain whatever else is
+                    # already queued (bounded) and only apply the latest size
                     cols, rows = resize_request
+                    coalesced = 0
+                    drain_deadline = time.monotonic() + RESIZE_DRAIN_WINDOW
+                    while (
+                        coalesced < RESIZE_DRAIN_MAX
+                        and time.monotonic() < drain_deadline
+                    ):
+                        pending = streaming_server.poll_resize()
+                        if pending is None:
+                            break
+                        cols, rows = pending
+                        coalesced += 1
+
                     resize_count += 1
                     now = time.time()
                     delta = now - last_resize_time if last_resize_time > 0 else 0
@@ -119,7 +145,7 @@ def main() -> None:
 
                     print(
                         f"[RESIZE #{resize_count}] {cols}x{rows} "
-                        f"(delta: {delta*1000:.1f}ms)"
+                        f"(delta: {delta*1000:.1f}ms, coalesced: {coalesced})"
                     )
 
                     # Resize immediately
@@ -134,55 +160,42 @@ def main() -> None:
                     streaming_server.send_resize(cols, rows)
 
             except Exception as e:
-                print(f"[ERROR] Resize handling: {e}")
-
-            # Check for stdin input (non-blocking)
-            if sys.platform != "win32":
-                ready, _, _ = select.select([sys.stdin], [], [], 0)
-                if ready:
-                    try:
-                        cmd = sys.stdin.readline().strip().lower()
-                        if cmd == "s":
-                            cols, rows = pty_terminal.size()
-                            print(f"[SIZE] PTY: {cols}x{rows}")
-                            print(f"[SIZE] Resize events: {resize_count}")
-                            print(f"[SIZE] Connected clients: {streaming_server.client_count()}")
-                        elif cmd == "d":
-                            cols, rows = pty_terminal.size()
-                            print(f"\n[DUMP] Terminal size: {cols}x{rows}")
-                            # Get visible screen styled output
-                            styled = pty_terminal.export_visible_screen_styled()
-                            print(f"[DUMP] Styled output length: {len(styled)} bytes")
-                            # Show first line as hex for debugging
-                            first_line = styled.split("\n")[0] if "\n" in styled else styled[:100]
-                            hex_line = " ".join(f"{ord(c):02x}" for c in first_line[:50])
-                            print(f"[DUMP] First 50 chars (hex): {hex_line}")
-                        elif cmd == "q":
-                            print("[DEBUG] Quitting...")
-                            break
-                    except Exception as e:
-                        print(f"[ERROR] Command: {e}")
-
-            # Smaller sleep for faster resize response
-            time.sleep(0.01)  # 10ms instead of 100ms
+                report_error(f"[ERROR] Resize handling: {e}")
+                # wait_resize() did not block; back off instead of spinning
+                time.sleep(ERROR_BACKOFF)
+
+            # Handle a queued stdin command, if any (read on a background
+            # thread, so this never blocks and also works on Windows)
+            cmd = next_command(commands)
+            if cmd is not None:
+                try:
+                    if cmd == "s":
+                        cols, rows = pty_terminal.size()
+                        print(f"[SIZE] PTY: {cols}x{rows}")
+                        print(f"[SIZE] Resize events: {resize_count}")
+                        print(f"[SIZE] Connected clients: {streaming_server.client_count()}")
+                    elif cmd == "d":
+                        cols, rows = pty_terminal.size()
+                        print(f"\n[DUMP] Terminal size: {cols}x{rows}")
+                        # Get visible screen styled output
+                        styled = pty_terminal.export_visible_screen_styled()
+                        print(f"[DUMP] Styled output length: {len(styled)} bytes")
+                        # Show first line as hex for debugging
+                        first_line = styled.split("\n")[0] if "\n" in styled else styled[:100]
+                        hex_line = " ".join(f"{ord(c):02x}" for c in first_line[:50])
+                        print(f"[DUMP] First 50 chars (hex): {hex_line}")
+                    elif cmd == "q":
+                        print("[DEBUG] Quitting...")
+                        break
+                except Exception as e:
+                    print(f"[ERROR] Command: {e}")
 
     except KeyboardInterrupt:
         print("\n\n[DEBUG] Interrupted")
 
     finally:
         print("[DEBUG] Cleaning up...")
-        try:
-            streaming_server.shutdown("Debug server shutting down")
-        except Exception as e:
-            print(f"[ERROR] Shutdown: {e}")
-
-        if pty_terminal.is_running():
-            try:
-                pty_terminal.write(b"exit\n")
-                time.sleep(0.5)
-            except Exception:
-                pass
-
+        close_streaming_session(pty_terminal, streaming_server, "Debug server shutting down")
         print("[DEBUG] Done")
 
 
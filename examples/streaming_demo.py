@@ -13,11 +13,13 @@ Then open examples/streaming_client.html in your web browser and connect to:
     ws://localhost:8080 (or your custom host:port)
 """
 
-import argparse
 import sys
 import time
-import select
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import par_term_emu_core_rust as terminal_core
 
 # Terminal color themes: (background, foreground, normal[8], bright[8])
 THEMES: dict[str, dict[str, tuple[int, int, int] | list[tuple[int, int, int]]]] = {
@@ -119,38 +121,42 @@ THEMES: dict[str, dict[str, tuple[int, int, int] | list[tuple[int, int, int]]]]
     },
 }
 
+# THEMES flattened once at import into the exact arguments of
+# set_palette_bulk: (background, foreground, normal + bright as one tuple)
+ThemeArgs = tuple[tuple[int, int, int], tuple[int, int, int], tuple[tuple[int, int, int], ...]]
+THEME_ARGS: dict[str, ThemeArgs] = {
+    name: (
+        theme["background"],  # type: ignore[misc]
+        theme["foreground"],  # type: ignore[misc]
+        (*theme["normal"], *theme["bright"]),  # type: ignore[misc]
+    )
+    for name, theme in THEMES.items()
+}
+
 # Add parent directory to path for development
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-try:
-    import par_term_emu_core_rust as terminal_core
-except ImportError:
-    print("Error: par_term_emu_core_rust module not found.")
-    print("Build the module with: uv run maturin develop --features streaming")
-    sys.exit(1)
+from _common import (
+    ThrottledPrinter,
+    close_streaming_session,
+    import_core,
+    next_command,
+    start_stdin_reader,
+)
+
+# Pause after a failed resize wait so a persistent error cannot spin the loop
+ERROR_BACKOFF = 0.1  # seconds
 
 
 def apply_theme(pty_terminal: "terminal_core.PtyTerminal", theme_name: str) -> None:
     """Apply a color theme to the terminal."""
-    if theme_name not in THEMES:
+    if theme_name not in THEME_ARGS:
         print(f"Warning: Unknown theme '{theme_name}', using iTerm2-dark")
         theme_name = "iTerm2-dark"
 
-    theme = THEMES[theme_name]
-    bg = theme["background"]
-    fg = theme["foreground"]
-    normal = theme["normal"]
-    bright = theme["bright"]
-
-    # Set default colors
-    pty_terminal.set_default_bg(*bg)  # type: ignore[arg-type]
-    pty_terminal.set_default_fg(*fg)  # type: ignore[arg-type]
-
-    # Set ANSI palette (0-7 normal, 8-15 bright)
-    for i, color in enumerate(normal):  # type: ignore[arg-type]
-        pty_terminal.set_ansi_palette_color(i, *color)
-    for i, color in enumerate(bright):  # type: ignore[arg-type]
-        pty_terminal.set_ansi_palette_color(i + 8, *color)
+    # Set default colors and the ANSI palette (0-7 normal, 8-15 bright) in
+    # one call
+    pty_terminal.set_palette_bulk(*THEME_ARGS[theme_name])
 
     print(f"Applied theme: {theme_name}")
 
@@ -169,6 +175,8 @@ def print_help():
 
 
 def main():
+    import argparse
+
     parser = argparse.ArgumentParser(description='Terminal Streaming Demo')
     parser.add_argument('--host', default='127.0.0.1', help='Host to bind to (default: 127.0.0.1)')
     parser.add_argument('--port', type=int, default=8080, help='Port to bind to (default: 8080)')
@@ -180,6 +188,9 @@ def main():
                         help='Color theme (default: iTerm2-dark)')
     args = parser.parse_args()
 
+    # Deferred until after argument parsing so --help is instant
+    terminal_core = import_core()
+
     # Create PTY terminal
     print(f"Creating terminal ({args.cols}x{args.rows})...")
     pty_terminal = terminal_core.PtyTerminal(args.cols, args.rows, args.scrollback)
@@ -198,22 +209,22 @@ def main():
         print(f"Error starting shell: {e}")
         sys.exit(1)
 
-    # Wait a moment for shell to start
-    time.sleep(0.2)
-
     # Create streaming server (AFTER shell is spawned so PTY writer is available)
     addr = f"{args.host}:{args.port}"
     print(f"Creating streaming server on {addr}...")
 
     try:
-        streaming_server = terminal_core.StreamingServer(pty_terminal, addr)
+        # A large send buffer keeps output bursts (e.g. `cat` of a big file)
+        # flowing on high-latency links instead of stalling on backpressure
+        config = terminal_core.StreamingConfig(send_buffer_bytes=4 * 1024 * 1024)
+        streaming_server = terminal_core.StreamingServer(pty_terminal, addr, config)
     except Exception as e:
         print(f"Error: Failed to create streaming server: {e}")
         print("\nMake sure the module was built with streaming support:")
         print("  uv run maturin develop --features streaming")
         sys.exit(1)
 
-    # Start streaming server (non-blocking)
+    # Start streaming server (returns once it is listening)
     print("Starting streaming server...")
     try:
         streaming_server.start()
@@ -221,9 +232,6 @@ def main():
         print(f"Error starting streaming server: {e}")
         sys.exit(1)
 
-    # Give the server a moment to start
-    time.sleep(0.5)
-
     print(f"\n{'='*60}")
     print(f"  Terminal streaming server is running!")
     print(f"{'='*60}")
@@ -234,6 +242,10 @@ def main():
 
     print_help()
 
+    # Operator commands are read off the event loop (see start_stdin_reader)
+    commands = start_stdin_reader()
+    report_error = ThrottledPrinter()
+
     try:
         # Main event loop - handle user commands and resize requests
         while True:
@@ -242,59 +254,40 @@ def main():
                 print("\nPTY process has exited")
                 break
 
-            # Poll for resize requests from clients
+            # Block until a resize request arrives (wakes immediately) or the
+            # timeout elapses, so stdin and process exit are still checked.
+            # Requests queued behind it (window drags) collapse into the latest.
             try:
-                resize_request = streaming_server.poll_resize()
+                resize_request = streaming_server.wait_resize(timeout=0.1, coalesce=True)
                 if resize_request is not None:
                     cols, rows = resize_request
                     print(f"\nResizing terminal to {cols}x{rows}")
-                    pty_terminal.resize(cols, rows)
-                    # Broadcast resize to all clients
-                    streaming_server.send_resize(cols, rows)
+                    # Resize the PTY and broadcast the new size in one call
+                    streaming_server.resize_and_broadcast(pty_terminal, cols, rows)
             except Exception as e:
-                print(f"Error handling resize: {e}")
-
-            # Check for stdin input (non-blocking)
-            # Note: select.select doesn't work on Windows for stdin
-            # This is just for demonstration on Unix-like systems
-            if sys.platform != 'win32':
-                ready, _, _ = select.select([sys.stdin], [], [], 0)
-                if ready:
-                    try:
-                        cmd = sys.stdin.readline().strip().lower()
-                        if cmd == 's':
-                            client_count = streaming_server.client_count()
-                            print(f"Connected clients: {client_count}")
-                            cols, rows = pty_terminal.size()
-                            print(f"Terminal size: {cols}x{rows}")
-                    except Exception as e:
-                        print(f"Error: {e}")
-
-            # Small sleep to prevent CPU spinning
-            # Using 10ms instead of 100ms to minimize resize race condition
-            time.sleep(0.01)
+                report_error(f"Error handling resize: {e}")
+                # wait_resize() did not block; back off instead of spinning
+                time.sleep(ERROR_BACKOFF)
+
+            # Handle a queued stdin command, if any (read on a background
+            # thread, so this never blocks and also works on Windows)
+            cmd = next_command(commands)
+            if cmd is not None:
+                try:
+                    if cmd == 's':
+                        client_count = streaming_server.client_count()
+                        print(f"Connected clients: {client_count}")
+                        cols, rows = pty_terminal.size()
+                        print(f"Terminal size: {cols}x{rows}")
+                except Exception as e:
+                    print(f"Error: {e}")
 
     except KeyboardInterrupt:
         print("\n\nReceived interrupt signal")
 
     finally:
-        # Cleanup
         print("\nCleaning up...")
-
-        # Shutdown streaming server
-        try:
-            streaming_server.shutdown("Server shutting down")
-        except Exception as e:
-            print(f"Error shutting down streaming server: {e}")
-
-        # Stop PTY terminal
-        if pty_terminal.is_running():
-            try:
-                pty_terminal.write(b"exit\n")
-                time.sleep(0.5)
-            except:
-                pass
-
+        close_streaming_session(pty_terminal, streaming_server, "Server shutting down")
         print("Goodbye!")
 
 
@@ -17,6 +17,9 @@ This library provides a full-featured terminal emulator with support for:
 - PTY support for running shell processes (PtyTerminal)
 """
 
+from functools import lru_cache
+
+from . import _native
 from ._native import (
     AmbiguousWidth,
     Attributes,
@@ -71,35 +74,70 @@ from ._native import (
     is_east_asian_ambiguous,
 )
 
-# Optional streaming support (available when built with --features streaming)
-try:
-    from ._native import (
-        StreamingConfig,
-        StreamingServer,
-        encode_server_message,
-        decode_server_message,
-        encode_client_message,
-        decode_client_message,
-    )
+# Pure color conversions are memoized: rendering converts the same few hundred
+# palette colors over and over, and a cache hit skips the native call entirely.
+# The uncached native function stays reachable as ``__wrapped__``. Only
+# conversions over RGB tuples and hex strings are cached; float-valued inputs
+# such as HSL rarely repeat exactly.
+_COLOR_CACHE_SIZE = 4096
+color_luminance = lru_cache(maxsize=_COLOR_CACHE_SIZE)(color_luminance)
+hex_to_rgb = lru_cache(maxsize=_COLOR_CACHE_SIZE)(hex_to_rgb)
+rgb_to_ansi_256 = lru_cache(maxsize=_COLOR_CACHE_SIZE)(rgb_to_ansi_256)
+rgb_to_hex = lru_cache(maxsize=_COLOR_CACHE_SIZE)(rgb_to_hex)
+rgb_to_hsl = lru_cache(maxsize=_COLOR_CACHE_SIZE)(rgb_to_hsl)
 
-    _has_streaming = True
-except ImportError:
-    _has_streaming = False
-    StreamingConfig = None
-    StreamingServer = None
-    encode_server_message = None
-    decode_server_message = None
-    encode_client_message = None
-    decode_client_message = None
+# Optional streaming support (available when built with --features streaming).
+# Probed by attribute rather than try/except ImportError so the common build
+# without streaming does not construct and unwind an exception at import time.
+_has_streaming = hasattr(_native, "StreamingServer")
+StreamingConfig = getattr(_native, "StreamingConfig", None)
+StreamingServer = getattr(_native, "StreamingServer", None)
+encode_server_message = getattr(_native, "encode_server_message", None)
+decode_server_message = getattr(_native, "decode_server_message", None)
+encode_client_message = getattr(_native, "encode_client_message", None)
+decode_client_message = getattr(_native, "decode_client_message", None)
 
-from .observers import (
-    on_bell,
-    on_command_complete,
-    on_cwd_change,
-    on_title_change,
-    on_zone_change,
+# The observer convenience wrappers are pure Python and pull in ``typing``,
+# which dominates cold import time. They are resolved on first access via
+# PEP 562 module ``__getattr__`` instead of at package import. The private
+# flag is never true at runtime, but type checkers still analyse the guarded
+# import and see the real signatures, without the runtime importing
+# ``typing`` for ``TYPE_CHECKING``.
+_TYPE_CHECKING = False
+if _TYPE_CHECKING:
+    from .observers import (
+        on_bell,
+        on_command_complete,
+        on_cwd_change,
+        on_title_change,
+        on_zone_change,
+    )
+
+_LAZY_OBSERVERS = frozenset(
+    {
+        "on_bell",
+        "on_command_complete",
+        "on_cwd_change",
+        "on_title_change",
+        "on_zone_change",
+    }
 )
 
+
+def __getattr__(name: str) -> object:
+    if name in _LAZY_OBSERVERS:
+        from . import observers
+
+        value = getattr(observers, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | _LAZY_OBSERVERS)
+
+
 __version__ = "0.43.1"
 __all__ = [
     "AmbiguousWidth",
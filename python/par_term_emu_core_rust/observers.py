@@ -25,15 +25,11 @@ def on_command_complete(
     Returns:
         Observer ID for later removal via ``terminal.remove_observer()``.
     """
-
-    def handler(event: dict[str, str]) -> None:
-        if (
-            event.get("type") == "shell_integration"
-            and event.get("event_type") == "command_finished"
-        ):
-            callback(event)
-
-    return terminal.add_observer(handler, kinds=["shell_integration"])
+    # The event_type filter runs natively, so other shell integration
+    # markers (OSC 133 A/B/C) never reach Python.
+    return terminal.add_observer(
+        callback, kinds=["shell_integration"], event_type="command_finished"
+    )
 
 
 def on_zone_change(terminal: Any, callback: Callable[[dict[str, str]], None]) -> int:
@@ -0,0 +1,99 @@
+"""
+Shared helpers for the WebSocket streaming test clients in this directory.
+"""
+
+import json
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+from typing import Any
+
+import websockets  # type: ignore
+
+# Use orjson for the per-message protocol JSON when it is installed; the
+# stdlib module is the fallback so the clients run without extra packages.
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None
+
+json_loads: Callable[[str | bytes], Any]
+json_dumps: Callable[[Any], str]
+if orjson is not None:
+    json_loads = orjson.loads
+
+    def json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+
+else:
+    json_loads = json.loads
+    json_dumps = json.dumps
+
+DEFAULT_URI = "ws://127.0.0.1:8080"
+
+# Fixed-shape client messages; only the values are formatted per send
+INPUT_TEMPLATE = '{"type":"input","data":%s}'
+RESIZE_TEMPLATE = '{"type":"resize","cols":%d,"rows":%d}'
+
+# Shell command that prints a completion marker once earlier input has run.
+# The printf format keeps the echoed command line itself from matching.
+DONE_COMMAND = "printf '__DONE_%%s__\\n' %s\n"
+DONE_MARKER = b"__DONE_%s__"
+
+
+class StreamClient:
+    """Connected streaming client with pre-bound send/recv and encoders."""
+
+    def __init__(self, websocket: Any) -> None:
+        self.websocket = websocket
+        self.send = websocket.send
+        self.recv = websocket.recv
+
+    async def recv_json(self) -> Any:
+        """Receive and decode one message."""
+        return json_loads(await self.recv())
+
+    async def send_input(self, data: str) -> None:
+        """Send terminal input."""
+        await self.send(INPUT_TEMPLATE % json_dumps(data))
+
+    async def send_resize(self, cols: int, rows: int) -> None:
+        """Request a terminal resize."""
+        await self.send(RESIZE_TEMPLATE % (cols, rows))
+
+    async def until_done(self, token: str) -> AsyncIterator[Any]:
+        """Yield decoded messages until previously sent input has finished.
+
+        Sends a marker command after the pending input and stops as soon as
+        its output arrives, so completion is signalled by the shell instead
+        of inferred from an idle timeout. Callers bound the whole wait with
+        a single ``asyncio.timeout()`` around the loop rather than one timer
+        per ``recv()``.
+
+        Args:
+            token: Unique marker suffix for this wait
+        """
+        marker = DONE_MARKER % token.encode()
+        await self.send_input(DONE_COMMAND % token)
+        # Keep a short tail so a marker split across messages is still seen
+        tail = b""
+        while True:
+            data = json_loads(await self.recv())
+            yield data
+            if data.get("type") == "output":
+                window = tail + data.get("data", "").encode()
+                if marker in window:
+                    return
+                tail = window[-len(marker) :]
+
+
+@asynccontextmanager
+async def connect(uri: str = DEFAULT_URI) -> AsyncIterator[StreamClient]:
+    """Connect to the streaming server and yield a :class:`StreamClient`."""
+    print(f"Connecting to {uri}...")
+    # Loopback test harness: skip permessage-deflate, keepalive pings and the
+    # 1 MiB frame cap, none of which buy anything on localhost
+    async with websockets.connect(
+        uri, compression=None, ping_interval=None, max_size=None
+    ) as websocket:
+        print("Connected!")
+        yield StreamClient(websocket)
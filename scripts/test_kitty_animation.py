@@ -10,8 +10,46 @@ https://sw.kovidgoyal.net/kitty/graphics-protocol/#animation
 """
 
 import base64
+import struct
 import sys
 import time
+import zlib
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+# Maximum base64 bytes per APC chunk. Kitty requires every chunk except the
+# last to be a multiple of 4 bytes and recommends at most 4096.
+APC_CHUNK_SIZE = 4096
+
+# APC (Application Program Command) framing: ESC _ G <payload> ; <data> ESC \
+APC_PREFIX = b"\x1b_G"
+APC_SUFFIX = b"\x1b\\"
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+# Empty IEND chunk: zero length, type, and its fixed CRC
+PNG_IEND = b"\x00\x00\x00\x00IEND\xaeB`\x82"
+
+
+@lru_cache(maxsize=None)
+def _png_header(width: int, height: int) -> bytes:
+    """Return the PNG signature plus IHDR chunk for an 8-bit RGB image.
+
+    Args:
+        width: Image width in pixels
+        height: Image height in pixels
+
+    Returns:
+        Signature and IHDR chunk bytes
+    """
+    ihdr = struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)
+    return PNG_SIGNATURE + _png_chunk(b"IHDR", ihdr)
+
+
+def _png_chunk(kind: bytes, data: bytes) -> bytes:
+    """Frame PNG chunk data with its length and CRC."""
+    crc = zlib.crc32(data, zlib.crc32(kind))
+    return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", crc)
 
 
 def create_solid_png(
@@ -19,6 +57,10 @@ def create_solid_png(
 ) -> bytes:
     """Create a simple solid color PNG image.
 
+    The image is encoded directly rather than through an imaging library:
+    every scanline is identical, so one row is built and repeated before a
+    single deflate pass.
+
     Args:
         color_rgb: RGB color tuple (r, g, b)
         width: Image width in pixels
@@ -27,36 +69,121 @@ def create_solid_png(
     Returns:
         PNG image bytes
     """
-    try:
-        from PIL import Image
-        import io
-
-        img = Image.new("RGB", (width, height), color_rgb)
-        buf = io.BytesIO()
-        img.save(buf, format="PNG")
-        return buf.getvalue()
-    except ImportError:
-        print(
-            "Error: PIL (Pillow) is required. Install with: pip install Pillow",
-            file=sys.stderr,
-        )
-        sys.exit(1)
+    # Filter type 0 (None) followed by the raw RGB pixels
+    scanline = b"\x00" + bytes(color_rgb) * width
+    idat = zlib.compress(scanline * height)
+    return _png_header(width, height) + _png_chunk(b"IDAT", idat) + PNG_IEND
+
 
+@lru_cache(maxsize=None)
+def solid_frame_payload(
+    color_rgb: tuple[int, int, int], width: int = 100, height: int = 100
+) -> bytes:
+    """Return the base64-encoded solid color PNG for an animation frame.
 
-def send_kitty_graphics(payload: str) -> None:
+    Frames are deterministic, so each (color, size) is encoded once and
+    reused across both animation tests.
+
+    Args:
+        color_rgb: RGB color tuple (r, g, b)
+        width: Image width in pixels
+        height: Image height in pixels
+
+    Returns:
+        Base64-encoded PNG bytes
+    """
+    return base64.b64encode(create_solid_png(color_rgb, width, height))
+
+
+def send_kitty_graphics(payload: bytes) -> None:
     """Send a Kitty graphics protocol sequence.
 
     Args:
         payload: The graphics protocol payload (keys=values,...)
     """
-    # APC (Application Program Command): ESC _ G <payload> ; <data> ESC \
-    print(f"\x1b_G{payload}\x1b\\", end="", flush=True)
+    write_apc([apc(payload)])
+
+
+def apc(payload: bytes) -> bytes:
+    """Encode a Kitty graphics payload as a complete APC sequence.
+
+    Args:
+        payload: The graphics protocol payload (keys=values,...)
+
+    Returns:
+        The encoded escape sequence
+    """
+    return APC_PREFIX + payload + APC_SUFFIX
+
+
+def write_apc(chunks: Iterable[bytes | memoryview]) -> None:
+    """Write pre-encoded APC sequences with a single write and flush.
+
+    Args:
+        chunks: Byte fragments of complete APC sequences, in order
+    """
+    # Flush pending print() text first so it lands before the graphics data
+    sys.stdout.flush()
+    sys.stdout.buffer.write(b"".join(chunks))
+    sys.stdout.buffer.flush()
+
+
+def frame_chunks(control: bytes, encoded: bytes) -> Iterator[bytes | memoryview]:
+    """Split a base64 payload into chunked Kitty APC sequences.
+
+    The first chunk carries the control keys; continuation chunks carry only
+    ``m=``, as required by the protocol.
+
+    Args:
+        control: Control keys for the first chunk (keys=values,...)
+        encoded: Base64-encoded image data
+
+    Yields:
+        Fragments that concatenate to one APC sequence per chunk; the data
+        is a view into ``encoded`` so it is only copied by the final join
+    """
+    view = memoryview(encoded)
+    for start in range(0, len(encoded), APC_CHUNK_SIZE):
+        more = 1 if start + APC_CHUNK_SIZE < len(encoded) else 0
+        yield APC_PREFIX
+        if start == 0:
+            yield b"%s,m=%d;" % (control, more)
+        else:
+            yield b"m=%d;" % more
+        yield view[start : start + APC_CHUNK_SIZE]
+        yield APC_SUFFIX
+
+
+def frame_apc(
+    image_id: int, frame_number: int, encoded: bytes, delay_ms: int = 500
+) -> list[bytes | memoryview]:
+    """Build the APC sequences for one animation frame without writing them.
+
+    Args:
+        image_id: Image ID for this animation
+        frame_number: Frame number (1-indexed)
+        encoded: Base64-encoded PNG image data
+        delay_ms: Frame delay in milliseconds
+
+    Returns:
+        Fragments of the frame's chunked APC sequences
+    """
+    # Action: a=f (frame)
+    # Image ID: i=<id>
+    # Frame number: r=<frame>
+    # Delay: z=<delay_ms>
+    # Format: f=100 (PNG)
+    # Transmission: t=d (direct)
+    # Always use 'f' for animation frames, not 'T'
+    # Data is split into m=1/m=0 chunks
+    control = b"a=f,i=%d,r=%d,z=%d,f=100,t=d" % (image_id, frame_number, delay_ms)
+    return list(frame_chunks(control, encoded))
 
 
 def send_frame(
     image_id: int,
     frame_number: int,
-    png_data: bytes,
+    encoded: bytes,
     delay_ms: int = 500,
     display: bool = False,
 ) -> None:
@@ -65,27 +192,36 @@ def send_frame(
     Args:
         image_id: Image ID for this animation
         frame_number: Frame number (1-indexed)
-        png_data: PNG image data
+        encoded: Base64-encoded PNG image data
         delay_ms: Frame delay in milliseconds
         display: Whether to also display after transmission
     """
-    encoded = base64.standard_b64encode(png_data).decode("ascii")
-
-    # Action: a=f (frame)
-    # Image ID: i=<id>
-    # Frame number: r=<frame>
-    # Delay: z=<delay_ms>
-    # Format: f=100 (PNG)
-    # Transmission: t=d (direct)
-    # Always use 'f' for animation frames, not 'T'
-    payload = f"a=f,i={image_id},r={frame_number},z={delay_ms},f=100,t=d;{encoded}"
-    send_kitty_graphics(payload)
+    write_apc(frame_apc(image_id, frame_number, encoded, delay_ms))
 
     # Display the image after sending the first frame (if requested)
     if display and frame_number == 1:
         display_image(image_id)
 
 
+def send_frames(
+    image_id: int, frames: list[bytes], delay_ms: int = 500, display: bool = False
+) -> None:
+    """Send a sequence of animation frames in a single write.
+
+    Args:
+        image_id: Image ID for this animation
+        frames: Base64-encoded PNG data for frames 1..N
+        delay_ms: Frame delay in milliseconds
+        display: Whether to display the image right after frame 1
+    """
+    chunks: list[bytes | memoryview] = []
+    for frame_number, encoded in enumerate(frames, 1):
+        chunks.extend(frame_apc(image_id, frame_number, encoded, delay_ms))
+        if display and frame_number == 1:
+            chunks.append(apc(b"a=p,i=%d" % image_id))
+    write_apc(chunks)
+
+
 def send_animation_control(
     image_id: int, state: str | None = None, num_plays: int | None = None
 ) -> None:
@@ -110,7 +246,7 @@ def send_animation_control(
     if num_plays is not None:
         params.append(f"v={num_plays}")
     payload = ",".join(params)
-    send_kitty_graphics(payload)
+    send_kitty_graphics(payload.encode("ascii"))
 
 
 def display_image(image_id: int) -> None:
@@ -121,7 +257,7 @@ def display_image(image_id: int) -> None:
     """
     # Action: a=p (put/display)
     # Image ID: i=<id>
-    payload = f"a=p,i={image_id}"
+    payload = b"a=p,i=%d" % image_id
     send_kitty_graphics(payload)
 
 
@@ -134,7 +270,7 @@ def delete_image(image_id: int) -> None:
     # Action: a=d (delete)
     # Delete: d=i (by image ID)
     # Image ID: i=<id>
-    payload = f"a=d,d=i,i={image_id}"
+    payload = b"a=d,d=i,i=%d" % image_id
     send_kitty_graphics(payload)
 
 
@@ -146,8 +282,8 @@ def test_simple_animation() -> None:
 
     # Create frames
     print("Creating animation frames...")
-    frame1_data = create_solid_png((255, 0, 0), 100, 100)  # Red
-    frame2_data = create_solid_png((0, 0, 255), 100, 100)  # Blue
+    frame1_data = solid_frame_payload((255, 0, 0), 100, 100)  # Red
+    frame2_data = solid_frame_payload((0, 0, 255), 100, 100)  # Blue
 
     # Send frame 1 (with display)
     print("Sending frame 1 (red, 500ms delay)...")
@@ -205,12 +341,13 @@ def test_multi_frame_animation() -> None:
 
     print(f"Creating {len(colors)}-frame color cycle animation...")
 
-    # Send all frames
-    for i, color in enumerate(colors, 1):
-        print(f"  Sending frame {i} (RGB{color})...")
-        frame_data = create_solid_png(color, 100, 100)
-        send_frame(image_id, i, frame_data, delay_ms=400, display=(i == 1))
-        time.sleep(0.05)
+    # Encode the frames in parallel (zlib releases the GIL)
+    with ThreadPoolExecutor(max_workers=len(colors)) as executor:
+        frames = list(executor.map(solid_frame_payload, colors))
+
+    # Send all frames in one write; the APC parser needs no pacing
+    print(f"  Sending {len(frames)} frames...")
+    send_frames(image_id, frames, delay_ms=400, display=True)
 
     print(f"\n{len(colors)}-frame animation loaded. Playing with 2 loops...")
     send_animation_control(image_id, num_plays=3)  # v=3 means 2 loops (N-1)
@@ -4,71 +4,72 @@ Test UTF-8 character handling in streaming
 """
 
 import asyncio
-import json
-import websockets  # type: ignore
+import re
+from _ws_common import INPUT_TEMPLATE, connect, json_dumps
+
+# Test various UTF-8 characters
+TEST_COMMANDS = [
+    ("echo 'Hello World'", "Basic ASCII"),
+    ("echo 'Café résumé naïve'", "Latin extended (accents)"),
+    ("echo '你好世界'", "Chinese characters"),
+    ("echo '🚀 🎉 ✨'", "Emojis"),
+    ("echo 'Привет мир'", "Cyrillic"),
+    ("echo 'مرحبا بالعالم'", "Arabic"),
+    ("echo '日本語テスト'", "Japanese"),
+]
+
+# (input message, command, description, expected UTF-8 bytes), built once
+COMMANDS = [
+    (
+        INPUT_TEMPLATE % json_dumps(cmd + "\n"),
+        cmd,
+        description,
+        (cmd.split("'")[1] if "'" in cmd else cmd).encode(),
+    )
+    for cmd, description in TEST_COMMANDS
+]
+
+# Match every expected string in one pass over each command's raw UTF-8
+# output, without decoding it first
+NEEDLE_RE = re.compile(b"|".join(re.escape(needle) for *_, needle in COMMANDS))
 
 
 async def test_utf8():
-    uri = "ws://127.0.0.1:8080"
-    print(f"Connecting to {uri}...")
-
-    try:
-        async with websockets.connect(uri) as websocket:
-            print("Connected!")
-
-            # Receive initial connection message
-            msg = await websocket.recv()
-            data = json.loads(msg)
-            print(
-                f"\n[Initial] Type: {data.get('type')}, Size: {data.get('cols')}x{data.get('rows')}"
-            )
-
-            # Test various UTF-8 characters
-            test_commands = [
-                ("echo 'Hello World'", "Basic ASCII"),
-                ("echo 'Café résumé naïve'", "Latin extended (accents)"),
-                ("echo '你好世界'", "Chinese characters"),
-                ("echo '🚀 🎉 ✨'", "Emojis"),
-                ("echo 'Привет мир'", "Cyrillic"),
-                ("echo 'مرحبا بالعالم'", "Arabic"),
-                ("echo '日本語テスト'", "Japanese"),
-            ]
-
-            for cmd, description in test_commands:
-                print(f"\n[Testing] {description}: {cmd}")
-
-                # Send command
-                await websocket.send(json.dumps({"type": "input", "data": cmd + "\n"}))
-
-                # Collect output for this command
-                outputs = []
-                for _ in range(30):  # Wait up to 3 seconds
-                    try:
-                        msg = await asyncio.wait_for(websocket.recv(), timeout=0.1)
-                        data = json.loads(msg)
+    async with connect() as client:
+        # Receive initial connection message
+        data = await client.recv_json()
+        print(
+            f"\n[Initial] Type: {data.get('type')}, Size: {data.get('cols')}x{data.get('rows')}"
+        )
+
+        for n, (payload, cmd, description, test_str) in enumerate(COMMANDS):
+            print(f"\n[Testing] {description}: {cmd}")
+
+            # Send command
+            await client.send(payload)
+
+            # Collect output until the shell reports the command finished
+            buf = bytearray()
+            try:
+                async with asyncio.timeout(3.0):
+                    async for data in client.until_done(str(n)):
                         if data.get("type") == "output":
-                            outputs.append(data.get("data", ""))
-                    except asyncio.TimeoutError:
-                        break
-
-                # Print collected output
-                full_output = "".join(outputs)
-                print(f"[Output] {repr(full_output)}")
-
-                # Check if our test string appears in output
-                test_str = cmd.split("'")[1] if "'" in cmd else cmd
-                if test_str in full_output:
-                    print("✅ UTF-8 preserved correctly")
-                else:
-                    print("❌ UTF-8 may be corrupted")
-
-            print("\n[Test complete]")
-
-    except Exception as e:
-        print(f"Error: {e}")
-        import traceback
-
-        traceback.print_exc()
+                            buf.extend(data.get("data", "").encode())
+            except TimeoutError:
+                pass
+
+            # Print collected output, up to the completion marker command
+            done = buf.find(b"printf '__DONE_")
+            output = buf if done < 0 else buf[:done]
+            print(f"[Output] {repr(output.decode('utf-8', 'replace'))}")
+
+            # Check if our test string appears in output
+            if test_str in NEEDLE_RE.findall(buf):
+                print("✅ UTF-8 preserved correctly")
+            else:
+                print("❌ UTF-8 may be corrupted")
+
+        print("\n[Test complete]")
 
 
 if __name__ == "__main__":
@@ -352,6 +352,14 @@ struct Args {
     #[arg(long, default_value = "0", env = "PAR_TERM_INPUT_RATE_LIMIT")]
     input_rate_limit: usize,
 
+    /// Client socket send buffer size in bytes (0 = OS default)
+    #[arg(long, default_value = "0", env = "PAR_TERM_SEND_BUFFER_BYTES")]
+    send_buffer_bytes: usize,
+
+    /// Client socket receive buffer size in bytes (0 = OS default)
+    #[arg(long, default_value = "0", env = "PAR_TERM_RECV_BUFFER_BYTES")]
+    recv_buffer_bytes: usize,
+
     /// Enable system resource statistics collection (CPU, memory, disk, network)
     #[arg(long, env = "PAR_TERM_ENABLE_SYSTEM_STATS")]
     enable_system_stats: bool,
@@ -1418,6 +1426,8 @@ async fn main() -> Result<()> {
         api_key: args.api_key.clone(),
         allow_api_key_in_query: args.allow_api_key_in_query,
         allowed_origins: args.allowed_origins.clone(),
+        send_buffer_bytes: args.send_buffer_bytes,
+        recv_buffer_bytes: args.recv_buffer_bytes,
     };
 
     // Create streaming server
@@ -1507,8 +1517,10 @@ async fn main() -> Result<()> {
         let output_sender = streaming_server.get_output_sender();
 
         info!("Loading macro file: {}", macro_file);
-        let macro_data = Macro::load_yaml(macro_file)
-            .context(format!("Failed to load macro file: {}", macro_file))?;
+        let macro_data = Arc::new(
+            Macro::load_yaml(macro_file)
+                .context(format!("Failed to load macro file: {}", macro_file))?,
+        );
 
         info!("Macro loaded: {}", macro_data.name);
         if let Some(desc) = &macro_data.description {
@@ -1527,7 +1539,7 @@ async fn main() -> Result<()> {
         let macro_loop = args.macro_loop;
         tokio::spawn(async move {
             loop {
-                let mut playback = MacroPlayback::with_speed(macro_data.clone(), macro_speed);
+                let mut playback = MacroPlayback::with_speed(Arc::clone(&macro_data), macro_speed);
                 info!("Starting macro playback: {}", playback.name());
 
                 while !playback.is_finished() {
@@ -190,6 +190,20 @@ pub fn adjust_contrast_rgb(
     )
 }
 
+/// Nearest 6x6x6 color cube level (0-5) for each 8-bit channel value.
+///
+/// Integer form of `round(v / 255 * 5)`, evaluated at compile time so the
+/// 256-color conversion is three table loads instead of float math.
+const CUBE_LEVEL: [u8; 256] = {
+    let mut table = [0u8; 256];
+    let mut v = 0;
+    while v < 256 {
+        table[v] = ((v * 10 + 255) / 510) as u8;
+        v += 1;
+    }
+    table
+};
+
 /// Extended color utilities
 impl Color {
     /// Convert color to hex string
@@ -229,9 +243,9 @@ impl Color {
         }
 
         // Convert to 6x6x6 color cube (16-231)
-        let r_idx = (r as f32 / 255.0 * 5.0).round() as u8;
-        let g_idx = (g as f32 / 255.0 * 5.0).round() as u8;
-        let b_idx = (b as f32 / 255.0 * 5.0).round() as u8;
+        let r_idx = CUBE_LEVEL[r as usize];
+        let g_idx = CUBE_LEVEL[g as usize];
+        let b_idx = CUBE_LEVEL[b as usize];
 
         16 + 36 * r_idx + 6 * g_idx + b_idx
     }
@@ -733,6 +747,14 @@ mod tests {
         assert_eq!(black.to_ansi_256(), 16);
     }
 
+    #[test]
+    fn test_cube_level_matches_float_rounding() {
+        for v in 0..=255u8 {
+            let expected = (v as f32 / 255.0 * 5.0).round() as u8;
+            assert_eq!(CUBE_LEVEL[v as usize], expected, "channel value {v}");
+        }
+    }
+
     #[test]
     fn test_meets_wcag_aa() {
         // Black on white should meet AA
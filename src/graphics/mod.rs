@@ -28,7 +28,7 @@ pub use iterm::ITermParser;
 pub use placeholder::{
     create_placeholder_with_diacritics, number_to_diacritic, PlaceholderInfo, PLACEHOLDER_CHAR,
 };
-pub use serialization::{GraphicsSnapshot, ImageDataRef, SerializableGraphic};
+pub use serialization::{GraphicsSnapshot, ImageDataRef, SerializableGraphic, SharedPixels};
 
 /// Image display mode for rendering
 #[derive(Debug, Clone, Copy, PartialEq, Eq, Default, Serialize, Deserialize)]
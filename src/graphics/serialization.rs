@@ -13,12 +13,27 @@
 //!
 //! A `GraphicsSnapshot` captures the full graphics state (active placements,
 //! scrollback, and animations) for round-trip persistence.
+//!
+//! The snapshot types are generic over their pixel data reference (defaulting
+//! to `ImageDataRef`). `export_json` / `import_json` use borrowed stand-ins so
+//! pixel data is base64-encoded straight into the JSON output and decoded
+//! straight out of the input string, without an intermediate `String` per
+//! image. The JSON format is identical either way.
+//!
+//! `SharedPixels` holds pixel data by reference count, detached from any
+//! store. `copy_from` uses it for in-process transfers between stores, where
+//! no encoding happens at all, and `shared_snapshot` / `import_shared_snapshot`
+//! let callers run the JSON encoding and decoding without holding the store.
 
+use std::borrow::Cow;
 use std::collections::HashMap;
+use std::io::{BufWriter, Write};
 use std::sync::Arc;
 
+use base64::display::Base64Display;
 use base64::Engine;
-use serde::{Deserialize, Serialize};
+use serde::ser::SerializeStruct;
+use serde::{Deserialize, Serialize, Serializer};
 
 use super::animation::{AnimationFrame, AnimationState, CompositionMode};
 use super::{GraphicProtocol, GraphicsStore, ImagePlacement, TerminalGraphic};
@@ -33,9 +48,100 @@ pub enum ImageDataRef {
     File(String),
 }
 
+/// Borrowed pixel data, serialized exactly like `ImageDataRef::Inline`
+///
+/// The base64 text is streamed into the serializer instead of being built as
+/// a separate `String` first.
+struct InlinePixels<'a>(&'a [u8]);
+
+impl Serialize for InlinePixels<'_> {
+    fn serialize<S: Serializer>(&self, serializer: S) -> Result<S::Ok, S::Error> {
+        /// Base64 text of a byte slice, written through `collect_str`
+        struct Base64Str<'a>(&'a [u8]);
+
+        impl Serialize for Base64Str<'_> {
+            fn serialize<S: Serializer>(&self, serializer: S) -> Result<S::Ok, S::Error> {
+                serializer.collect_str(&Base64Display::new(
+                    self.0,
+                    &base64::engine::general_purpose::STANDARD,
+                ))
+            }
+        }
+
+        let mut state = serializer.serialize_struct("ImageDataRef", 2)?;
+        state.serialize_field("type", "Inline")?;
+        state.serialize_field("value", &Base64Str(self.0))?;
+        state.end()
+    }
+}
+
+/// `ImageDataRef` that borrows its payload from the JSON input when possible
+#[derive(Deserialize)]
+#[serde(rename = "ImageDataRef", tag = "type", content = "value")]
+enum BorrowedDataRef<'a> {
+    Inline(#[serde(borrow)] Cow<'a, str>),
+    File(#[serde(borrow)] Cow<'a, str>),
+}
+
+/// RGBA pixel buffer held by reference count rather than copied
+///
+/// Serializes like `ImageDataRef::Inline`. JSON is read back through
+/// `GraphicsSnapshot::<SharedPixels>::from_json` / `read_json_file`, which
+/// resolve the data references only after the snapshot version is checked.
+#[derive(Debug, Clone)]
+pub struct SharedPixels(pub Arc<Vec<u8>>);
+
+impl Serialize for SharedPixels {
+    fn serialize<S: Serializer>(&self, serializer: S) -> Result<S::Ok, S::Error> {
+        InlinePixels(&self.0).serialize(serializer)
+    }
+}
+
+/// Pixel data reference that can be resolved to raw RGBA bytes
+trait ResolvePixels {
+    fn resolve_pixels(&self) -> Result<Arc<Vec<u8>>, GraphicsSerializationError>;
+}
+
+impl ResolvePixels for ImageDataRef {
+    fn resolve_pixels(&self) -> Result<Arc<Vec<u8>>, GraphicsSerializationError> {
+        match self {
+            ImageDataRef::Inline(b64) => decode_inline(b64),
+            ImageDataRef::File(path) => read_data_file(path),
+        }
+        .map(Arc::new)
+    }
+}
+
+impl ResolvePixels for BorrowedDataRef<'_> {
+    fn resolve_pixels(&self) -> Result<Arc<Vec<u8>>, GraphicsSerializationError> {
+        match self {
+            BorrowedDataRef::Inline(b64) => decode_inline(b64),
+            BorrowedDataRef::File(path) => read_data_file(path),
+        }
+        .map(Arc::new)
+    }
+}
+
+impl ResolvePixels for SharedPixels {
+    fn resolve_pixels(&self) -> Result<Arc<Vec<u8>>, GraphicsSerializationError> {
+        Ok(Arc::clone(&self.0))
+    }
+}
+
+fn decode_inline(b64: &str) -> Result<Vec<u8>, GraphicsSerializationError> {
+    base64::engine::general_purpose::STANDARD
+        .decode(b64)
+        .map_err(|e| GraphicsSerializationError::Base64Decode(e.to_string()))
+}
+
+fn read_data_file(path: &str) -> Result<Vec<u8>, GraphicsSerializationError> {
+    std::fs::read(path)
+        .map_err(|e| GraphicsSerializationError::FileRead(path.to_string(), e.to_string()))
+}
+
 /// Serializable animation frame metadata
 #[derive(Debug, Clone, Serialize, Deserialize)]
-pub struct SerializableAnimationFrame {
+pub struct SerializableAnimationFrame<D = ImageDataRef> {
     pub frame_number: u32,
     pub width: usize,
     pub height: usize,
@@ -43,14 +149,14 @@ pub struct SerializableAnimationFrame {
     pub x_offset: u32,
     pub y_offset: u32,
     pub composition: CompositionMode,
-    pub data: ImageDataRef,
+    pub data: D,
 }
 
 /// Serializable animation metadata
 #[derive(Debug, Clone, Serialize, Deserialize)]
-pub struct SerializableAnimation {
+pub struct SerializableAnimation<D = ImageDataRef> {
     pub image_id: u32,
-    pub frames: Vec<SerializableAnimationFrame>,
+    pub frames: Vec<SerializableAnimationFrame<D>>,
     pub default_delay_ms: u32,
     pub state: AnimationState,
     pub current_frame: u32,
@@ -63,7 +169,7 @@ pub struct SerializableAnimation {
 /// This captures all metadata needed to restore an image placement,
 /// including protocol-specific fields and pixel data.
 #[derive(Debug, Clone, Serialize, Deserialize)]
-pub struct SerializableGraphic {
+pub struct SerializableGraphic<D = ImageDataRef> {
     /// Unique placement ID
     pub id: u64,
     /// Graphics protocol used
@@ -99,20 +205,20 @@ pub struct SerializableGraphic {
     pub placement: ImagePlacement,
 
     /// Image pixel data reference
-    pub data: ImageDataRef,
+    pub data: D,
 }
 
 /// Complete snapshot of graphics state for session persistence
 #[derive(Debug, Clone, Serialize, Deserialize)]
-pub struct GraphicsSnapshot {
+pub struct GraphicsSnapshot<D = ImageDataRef> {
     /// Schema version for forward compatibility
     pub version: u32,
     /// Active placements (visible area)
-    pub placements: Vec<SerializableGraphic>,
+    pub placements: Vec<SerializableGraphic<D>>,
     /// Graphics in scrollback
-    pub scrollback: Vec<SerializableGraphic>,
+    pub scrollback: Vec<SerializableGraphic<D>>,
     /// Animations indexed by image ID
-    pub animations: Vec<SerializableAnimation>,
+    pub animations: Vec<SerializableAnimation<D>>,
 }
 
 impl GraphicsSnapshot {
@@ -120,11 +226,139 @@ impl GraphicsSnapshot {
     pub const CURRENT_VERSION: u32 = 1;
 }
 
+impl<D> GraphicsSnapshot<D> {
+    /// Reject snapshots written with a newer schema version
+    fn check_version(&self) -> Result<(), GraphicsSerializationError> {
+        if self.version > GraphicsSnapshot::CURRENT_VERSION {
+            return Err(GraphicsSerializationError::UnsupportedVersion(
+                self.version,
+                GraphicsSnapshot::CURRENT_VERSION,
+            ));
+        }
+        Ok(())
+    }
+}
+
+impl GraphicsSnapshot<BorrowedDataRef<'_>> {
+    /// Check the version, then resolve every pixel reference
+    ///
+    /// Nothing is decoded or read from disk for a snapshot that would be
+    /// rejected, and decode and file errors keep their own variants.
+    fn into_shared(self) -> Result<GraphicsSnapshot<SharedPixels>, GraphicsSerializationError> {
+        self.check_version()?;
+
+        let graphic = |sg: &SerializableGraphic<BorrowedDataRef<'_>>| {
+            let pixels = sg.data.resolve_pixels()?;
+            Ok(SerializableGraphic::with_data(
+                &sg.with_pixels(Arc::clone(&pixels)),
+                SharedPixels(pixels),
+            ))
+        };
+        let placements = self
+            .placements
+            .iter()
+            .map(graphic)
+            .collect::<Result<_, GraphicsSerializationError>>()?;
+        let scrollback = self
+            .scrollback
+            .iter()
+            .map(graphic)
+            .collect::<Result<_, GraphicsSerializationError>>()?;
+
+        let mut animations = Vec::with_capacity(self.animations.len());
+        for sa in &self.animations {
+            let mut frames = Vec::with_capacity(sa.frames.len());
+            for sf in &sa.frames {
+                let pixels = sf.data.resolve_pixels()?;
+                frames.push(SerializableAnimationFrame::with_data(
+                    &sf.with_pixels(Arc::clone(&pixels)),
+                    SharedPixels(pixels),
+                ));
+            }
+            animations.push(SerializableAnimation {
+                image_id: sa.image_id,
+                frames,
+                default_delay_ms: sa.default_delay_ms,
+                state: sa.state,
+                current_frame: sa.current_frame,
+                loop_count: sa.loop_count,
+                loops_completed: sa.loops_completed,
+            });
+        }
+
+        Ok(GraphicsSnapshot {
+            version: self.version,
+            placements,
+            scrollback,
+            animations,
+        })
+    }
+}
+
+impl GraphicsSnapshot<SharedPixels> {
+    /// Serialize to the same JSON document as `GraphicsStore::export_json`
+    pub fn to_json(&self) -> Result<String, GraphicsSerializationError> {
+        serde_json::to_string(self)
+            .map_err(|e| GraphicsSerializationError::SerdeError(e.to_string()))
+    }
+
+    /// Parse JSON from `GraphicsStore::export_json`, decoding pixel data
+    ///
+    /// The version is checked before any pixel data is decoded or any
+    /// referenced data file is read.
+    pub fn from_json(json: &str) -> Result<Self, GraphicsSerializationError> {
+        let snapshot: GraphicsSnapshot<BorrowedDataRef<'_>> = serde_json::from_str(json)
+            .map_err(|e| GraphicsSerializationError::SerdeError(e.to_string()))?;
+        snapshot.into_shared()
+    }
+
+    /// Write the `to_json` document straight to a file
+    ///
+    /// Output goes through a 64 KiB buffer, so no `String` holding the whole
+    /// document is built.
+    pub fn write_json_file(&self, path: &str) -> Result<(), GraphicsSerializationError> {
+        let write_err = |e: std::io::Error| {
+            GraphicsSerializationError::FileWrite(path.to_string(), e.to_string())
+        };
+        let file = std::fs::File::create(path).map_err(write_err)?;
+        let mut writer = BufWriter::with_capacity(JSON_FILE_BUFFER_SIZE, file);
+        serde_json::to_writer(&mut writer, self).map_err(|e| {
+            if e.is_io() {
+                GraphicsSerializationError::FileWrite(path.to_string(), e.to_string())
+            } else {
+                GraphicsSerializationError::SerdeError(e.to_string())
+            }
+        })?;
+        writer.flush().map_err(write_err)
+    }
+
+    /// Read a file written by `write_json_file` or `GraphicsStore::export_json`
+    pub fn read_json_file(path: &str) -> Result<Self, GraphicsSerializationError> {
+        // One read of the whole file, then a slice parse that borrows the
+        // base64 text, which is faster than serde_json's byte-wise reader
+        let bytes = std::fs::read(path)
+            .map_err(|e| GraphicsSerializationError::FileRead(path.to_string(), e.to_string()))?;
+        let snapshot: GraphicsSnapshot<BorrowedDataRef<'_>> = serde_json::from_slice(&bytes)
+            .map_err(|e| GraphicsSerializationError::SerdeError(e.to_string()))?;
+        snapshot.into_shared()
+    }
+}
+
+/// Buffer size for `GraphicsSnapshot::write_json_file`
+const JSON_FILE_BUFFER_SIZE: usize = 64 * 1024;
+
 // --- Conversion: TerminalGraphic -> SerializableGraphic ---
 
 impl From<&TerminalGraphic> for SerializableGraphic {
     fn from(g: &TerminalGraphic) -> Self {
         let encoded = base64::engine::general_purpose::STANDARD.encode(g.pixels.as_ref());
+        Self::with_data(g, ImageDataRef::Inline(encoded))
+    }
+}
+
+impl<D> SerializableGraphic<D> {
+    /// Copy the metadata of `g`, attaching `data` as its pixel reference
+    fn with_data(g: &TerminalGraphic, data: D) -> Self {
         Self {
             id: g.id,
             protocol: g.protocol,
@@ -145,21 +379,13 @@ impl From<&TerminalGraphic> for SerializableGraphic {
             relative_y_offset: g.relative_y_offset,
             was_compressed: g.was_compressed,
             placement: g.placement.clone(),
-            data: ImageDataRef::Inline(encoded),
+            data,
         }
     }
-}
 
-impl SerializableGraphic {
-    /// Convert back to a TerminalGraphic by resolving the image data reference
-    ///
-    /// For `ImageDataRef::Inline`, decodes the base64 data directly.
-    /// For `ImageDataRef::File`, reads the file contents.
-    ///
-    /// Returns an error if the data cannot be resolved.
-    pub fn to_terminal_graphic(&self) -> Result<TerminalGraphic, GraphicsSerializationError> {
-        let pixels = self.resolve_data()?;
-        Ok(TerminalGraphic {
+    /// Rebuild the `TerminalGraphic` around already-resolved pixel data
+    fn with_pixels(&self, pixels: Arc<Vec<u8>>) -> TerminalGraphic {
+        TerminalGraphic {
             id: self.id,
             protocol: self.protocol,
             position: self.position,
@@ -167,7 +393,7 @@ impl SerializableGraphic {
             height: self.height,
             original_width: self.original_width,
             original_height: self.original_height,
-            pixels: Arc::new(pixels),
+            pixels,
             cell_dimensions: self.cell_dimensions,
             scroll_offset_rows: self.scroll_offset_rows,
             scrollback_row: self.scrollback_row,
@@ -180,18 +406,19 @@ impl SerializableGraphic {
             relative_y_offset: self.relative_y_offset,
             was_compressed: self.was_compressed,
             placement: self.placement.clone(),
-        })
+        }
     }
+}
 
-    /// Resolve the image data reference to raw RGBA bytes
-    fn resolve_data(&self) -> Result<Vec<u8>, GraphicsSerializationError> {
-        match &self.data {
-            ImageDataRef::Inline(b64) => base64::engine::general_purpose::STANDARD
-                .decode(b64)
-                .map_err(|e| GraphicsSerializationError::Base64Decode(e.to_string())),
-            ImageDataRef::File(path) => std::fs::read(path)
-                .map_err(|e| GraphicsSerializationError::FileRead(path.clone(), e.to_string())),
-        }
+impl SerializableGraphic {
+    /// Convert back to a TerminalGraphic by resolving the image data reference
+    ///
+    /// For `ImageDataRef::Inline`, decodes the base64 data directly.
+    /// For `ImageDataRef::File`, reads the file contents.
+    ///
+    /// Returns an error if the data cannot be resolved.
+    pub fn to_terminal_graphic(&self) -> Result<TerminalGraphic, GraphicsSerializationError> {
+        Ok(self.with_pixels(self.data.resolve_pixels()?))
     }
 
     /// Create a SerializableGraphic with a file reference instead of inline data.
@@ -215,6 +442,13 @@ impl SerializableGraphic {
 impl From<&AnimationFrame> for SerializableAnimationFrame {
     fn from(f: &AnimationFrame) -> Self {
         let encoded = base64::engine::general_purpose::STANDARD.encode(f.pixels.as_ref());
+        Self::with_data(f, ImageDataRef::Inline(encoded))
+    }
+}
+
+impl<D> SerializableAnimationFrame<D> {
+    /// Copy the metadata of `f`, attaching `data` as its pixel reference
+    fn with_data(f: &AnimationFrame, data: D) -> Self {
         Self {
             frame_number: f.frame_number,
             width: f.width,
@@ -223,31 +457,29 @@ impl From<&AnimationFrame> for SerializableAnimationFrame {
             x_offset: f.x_offset,
             y_offset: f.y_offset,
             composition: f.composition,
-            data: ImageDataRef::Inline(encoded),
+            data,
         }
     }
-}
 
-impl SerializableAnimationFrame {
-    /// Convert back to an AnimationFrame
-    pub fn to_animation_frame(&self) -> Result<AnimationFrame, GraphicsSerializationError> {
-        let pixels = match &self.data {
-            ImageDataRef::Inline(b64) => base64::engine::general_purpose::STANDARD
-                .decode(b64)
-                .map_err(|e| GraphicsSerializationError::Base64Decode(e.to_string()))?,
-            ImageDataRef::File(path) => std::fs::read(path)
-                .map_err(|e| GraphicsSerializationError::FileRead(path.clone(), e.to_string()))?,
-        };
-        Ok(AnimationFrame {
+    /// Rebuild the `AnimationFrame` around already-resolved pixel data
+    fn with_pixels(&self, pixels: Arc<Vec<u8>>) -> AnimationFrame {
+        AnimationFrame {
             frame_number: self.frame_number,
-            pixels: Arc::new(pixels),
+            pixels,
             width: self.width,
             height: self.height,
             delay_ms: self.delay_ms,
             x_offset: self.x_offset,
             y_offset: self.y_offset,
             composition: self.composition,
-        })
+        }
+    }
+}
+
+impl SerializableAnimationFrame {
+    /// Convert back to an AnimationFrame
+    pub fn to_animation_frame(&self) -> Result<AnimationFrame, GraphicsSerializationError> {
+        Ok(self.with_pixels(self.data.resolve_pixels()?))
     }
 }
 
@@ -259,16 +491,23 @@ impl GraphicsStore {
     /// This captures active placements, scrollback graphics, and animation
     /// state. Pixel data is encoded as base64 inline.
     pub fn export_snapshot(&self) -> GraphicsSnapshot {
+        self.snapshot_with(|pixels| {
+            ImageDataRef::Inline(base64::engine::general_purpose::STANDARD.encode(pixels.as_ref()))
+        })
+    }
+
+    /// Build a snapshot, mapping each image's pixel buffer through `data`
+    fn snapshot_with<'a, D>(&'a self, data: impl Fn(&'a Arc<Vec<u8>>) -> D) -> GraphicsSnapshot<D> {
         let placements = self
             .all_graphics()
             .iter()
-            .map(SerializableGraphic::from)
+            .map(|g| SerializableGraphic::with_data(g, data(&g.pixels)))
             .collect();
 
         let scrollback = self
             .all_scrollback_graphics()
             .iter()
-            .map(SerializableGraphic::from)
+            .map(|g| SerializableGraphic::with_data(g, data(&g.pixels)))
             .collect();
 
         let animations = self
@@ -279,7 +518,7 @@ impl GraphicsStore {
                 frames: anim
                     .frames
                     .values()
-                    .map(SerializableAnimationFrame::from)
+                    .map(|f| SerializableAnimationFrame::with_data(f, data(&f.pixels)))
                     .collect(),
                 default_delay_ms: anim.default_delay_ms,
                 state: anim.state,
@@ -305,29 +544,75 @@ impl GraphicsStore {
         &mut self,
         snapshot: &GraphicsSnapshot,
     ) -> Result<usize, GraphicsSerializationError> {
-        if snapshot.version > GraphicsSnapshot::CURRENT_VERSION {
-            return Err(GraphicsSerializationError::UnsupportedVersion(
-                snapshot.version,
-                GraphicsSnapshot::CURRENT_VERSION,
-            ));
-        }
+        self.restore_snapshot(snapshot)
+    }
+
+    /// Replace this store's graphics state with a copy of `other`'s
+    ///
+    /// Equivalent to `import_json(&other.export_json()?)`, but without any
+    /// serialization: pixel buffers are shared with `other` by reference
+    /// count instead of being encoded and decoded. Returns the number of
+    /// graphics restored.
+    pub fn copy_from(
+        &mut self,
+        other: &GraphicsStore,
+    ) -> Result<usize, GraphicsSerializationError> {
+        self.import_shared_snapshot(&other.shared_snapshot())
+    }
+
+    /// Capture a snapshot that shares this store's pixel buffers
+    ///
+    /// No pixel data is copied or encoded, so this is cheap; the snapshot
+    /// can then be serialized with `to_json` without borrowing the store.
+    pub fn shared_snapshot(&self) -> GraphicsSnapshot<SharedPixels> {
+        self.snapshot_with(|pixels| SharedPixels(Arc::clone(pixels)))
+    }
+
+    /// Import graphics state from a snapshot with already-resolved pixels
+    ///
+    /// Like `import_snapshot`, but the pixel buffers are shared with the
+    /// snapshot instead of being decoded.
+    pub fn import_shared_snapshot(
+        &mut self,
+        snapshot: &GraphicsSnapshot<SharedPixels>,
+    ) -> Result<usize, GraphicsSerializationError> {
+        self.restore_snapshot(snapshot)
+    }
+
+    /// Shared body of the `import_*` methods and `copy_from`
+    fn restore_snapshot<D: ResolvePixels>(
+        &mut self,
+        snapshot: &GraphicsSnapshot<D>,
+    ) -> Result<usize, GraphicsSerializationError> {
+        snapshot.check_version()?;
 
         // Clear existing state
         self.clear();
         self.clear_scrollback_graphics();
 
+        // Size both lists once; neither can outgrow its store limit
+        let limits = &self.limits;
+        self.placements
+            .reserve(snapshot.placements.len().min(limits.max_graphics_count));
+        self.scrollback.reserve(
+            snapshot
+                .scrollback
+                .len()
+                .min(limits.max_scrollback_graphics),
+        );
+
         let mut restored = 0;
 
         // Restore active placements
         for sg in &snapshot.placements {
-            let graphic = sg.to_terminal_graphic()?;
+            let graphic = sg.with_pixels(sg.data.resolve_pixels()?);
             self.add_graphic(graphic);
             restored += 1;
         }
 
         // Restore scrollback
         for sg in &snapshot.scrollback {
-            let graphic = sg.to_terminal_graphic()?;
+            let graphic = sg.with_pixels(sg.data.resolve_pixels()?);
             // Add directly to scrollback via the internal method
             self.add_scrollback_graphic(graphic);
             restored += 1;
@@ -337,7 +622,7 @@ impl GraphicsStore {
         for sa in &snapshot.animations {
             let mut frames = HashMap::new();
             for sf in &sa.frames {
-                let frame = sf.to_animation_frame()?;
+                let frame = sf.with_pixels(sf.data.resolve_pixels()?);
                 frames.insert(frame.frame_number, frame);
             }
             self.restore_animation(sa, frames);
@@ -347,24 +632,30 @@ impl GraphicsStore {
     }
 
     /// Serialize the graphics snapshot to JSON
+    ///
+    /// Produces the same document as serializing `export_snapshot()`, but
+    /// encodes pixel data directly into the output.
     pub fn export_json(&self) -> Result<String, GraphicsSerializationError> {
-        let snapshot = self.export_snapshot();
+        let snapshot = self.snapshot_with(|pixels| InlinePixels(pixels));
         serde_json::to_string(&snapshot)
             .map_err(|e| GraphicsSerializationError::SerdeError(e.to_string()))
     }
 
     /// Serialize the graphics snapshot to pretty-printed JSON
     pub fn export_json_pretty(&self) -> Result<String, GraphicsSerializationError> {
-        let snapshot = self.export_snapshot();
+        let snapshot = self.snapshot_with(|pixels| InlinePixels(pixels));
         serde_json::to_string_pretty(&snapshot)
             .map_err(|e| GraphicsSerializationError::SerdeError(e.to_string()))
     }
 
     /// Import graphics state from JSON
+    ///
+    /// Inline pixel data is decoded from the input without copying the
+    /// base64 text into an owned `String` first.
     pub fn import_json(&mut self, json: &str) -> Result<usize, GraphicsSerializationError> {
-        let snapshot: GraphicsSnapshot = serde_json::from_str(json)
+        let snapshot: GraphicsSnapshot<BorrowedDataRef<'_>> = serde_json::from_str(json)
             .map_err(|e| GraphicsSerializationError::SerdeError(e.to_string()))?;
-        self.import_snapshot(&snapshot)
+        self.restore_snapshot(&snapshot)
     }
 
     /// Add a graphic directly to scrollback storage
@@ -377,9 +668,9 @@ impl GraphicsStore {
     }
 
     /// Restore a complete animation from serialized state
-    fn restore_animation(
+    fn restore_animation<D>(
         &mut self,
-        sa: &SerializableAnimation,
+        sa: &SerializableAnimation<D>,
         frames: HashMap<u32, AnimationFrame>,
     ) {
         use super::animation::Animation;
@@ -563,6 +854,62 @@ mod tests {
         assert_eq!(store2.graphics_count(), 1);
     }
 
+    #[test]
+    fn test_export_json_matches_snapshot_serialization() {
+        use crate::graphics::animation::AnimationFrame;
+
+        let mut store = GraphicsStore::new();
+        let g = create_test_graphic();
+        let image_id = g.kitty_image_id.unwrap();
+        store.add_graphic(g);
+        let mut sixel = TerminalGraphic::new(
+            next_graphic_id(),
+            GraphicProtocol::Sixel,
+            (0, 0),
+            10,
+            4,
+            (0..160u8).collect(),
+        );
+        sixel.set_cell_dimensions(8, 2);
+        store.add_graphic(sixel);
+        store.adjust_for_scroll_up_with_scrollback(10, 0, 23, 0);
+        store.add_animation_frame(image_id, AnimationFrame::new(1, vec![7u8; 16], 2, 2));
+
+        // The streamed writer must produce exactly the serde output of the
+        // owned snapshot, so either form can be read back by older versions
+        let expected = serde_json::to_string(&store.export_snapshot()).unwrap();
+        assert_eq!(store.export_json().unwrap(), expected);
+        let expected = serde_json::to_string_pretty(&store.export_snapshot()).unwrap();
+        assert_eq!(store.export_json_pretty().unwrap(), expected);
+    }
+
+    #[test]
+    fn test_import_json_with_reordered_and_escaped_data() {
+        let original = create_test_graphic();
+        let mut store = GraphicsStore::new();
+        store.add_graphic(original.clone());
+        let json = store.export_json().unwrap();
+
+        // Content before tag and JSON-escaped slashes cannot be borrowed
+        // from the input and take the owned path instead
+        let b64 = base64::engine::general_purpose::STANDARD.encode(original.pixels.as_ref());
+        let reordered = json.replace(
+            &format!(r#"{{"type":"Inline","value":"{}"}}"#, b64),
+            &format!(
+                r#"{{"value":"{}","type":"Inline"}}"#,
+                b64.replace('/', r"\/")
+            ),
+        );
+        assert_ne!(reordered, json);
+
+        let mut store2 = GraphicsStore::new();
+        assert_eq!(store2.import_json(&reordered).unwrap(), 1);
+        assert_eq!(
+            store2.all_graphics()[0].pixels.as_ref(),
+            original.pixels.as_ref()
+        );
+    }
+
     #[test]
     fn test_graphics_store_export_with_scrollback() {
         let mut store = GraphicsStore::new();
@@ -628,6 +975,117 @@ mod tests {
         assert_eq!(anim.default_delay_ms, 100);
     }
 
+    #[test]
+    fn test_copy_from_shares_pixel_buffers() {
+        use crate::graphics::animation::AnimationFrame;
+
+        let mut store = GraphicsStore::new();
+        let g = create_test_graphic();
+        let image_id = g.kitty_image_id.unwrap();
+        store.add_graphic(g);
+        store.add_animation_frame(image_id, AnimationFrame::new(1, vec![255u8; 16], 2, 2));
+
+        let mut store2 = GraphicsStore::new();
+        store2.add_graphic(create_test_graphic());
+        store2.add_graphic(create_test_graphic());
+        let count = store2.copy_from(&store).unwrap();
+        assert_eq!(count, 1);
+        assert_eq!(store2.graphics_count(), 1);
+
+        let src = &store.all_graphics()[0];
+        let dst = &store2.all_graphics()[0];
+        assert_eq!(dst.id, src.id);
+        assert!(Arc::ptr_eq(&dst.pixels, &src.pixels));
+
+        let src_frame = &store.get_animation(image_id).unwrap().frames[&1];
+        let dst_frame = &store2.get_animation(image_id).unwrap().frames[&1];
+        assert!(Arc::ptr_eq(&dst_frame.pixels, &src_frame.pixels));
+
+        // Same document as a JSON round trip
+        assert_eq!(store2.export_json().unwrap(), store.export_json().unwrap());
+    }
+
+    #[test]
+    fn test_shared_snapshot_json_round_trip() {
+        let mut store = GraphicsStore::new();
+        store.add_graphic(create_test_graphic());
+
+        let json = store.shared_snapshot().to_json().unwrap();
+        assert_eq!(json, store.export_json().unwrap());
+
+        let snapshot = GraphicsSnapshot::<SharedPixels>::from_json(&json).unwrap();
+        let mut store2 = GraphicsStore::new();
+        assert_eq!(store2.import_shared_snapshot(&snapshot).unwrap(), 1);
+        assert_eq!(
+            store2.all_graphics()[0].pixels,
+            store.all_graphics()[0].pixels
+        );
+    }
+
+    #[test]
+    fn test_shared_snapshot_json_file_round_trip() {
+        let mut store = GraphicsStore::new();
+        store.add_graphic(create_test_graphic());
+
+        let dir = tempfile::tempdir().unwrap();
+        let path = dir.path().join("graphics.json");
+        let path_str = path.to_str().unwrap();
+        store.shared_snapshot().write_json_file(path_str).unwrap();
+        assert_eq!(
+            std::fs::read_to_string(&path).unwrap(),
+            store.export_json().unwrap()
+        );
+
+        let snapshot = GraphicsSnapshot::<SharedPixels>::read_json_file(path_str).unwrap();
+        let mut store2 = GraphicsStore::new();
+        assert_eq!(store2.import_shared_snapshot(&snapshot).unwrap(), 1);
+        assert_eq!(
+            store2.all_graphics()[0].pixels,
+            store.all_graphics()[0].pixels
+        );
+
+        let missing = dir.path().join("missing.json");
+        let err = GraphicsSnapshot::<SharedPixels>::read_json_file(missing.to_str().unwrap())
+            .unwrap_err();
+        assert!(matches!(err, GraphicsSerializationError::FileRead(..)));
+    }
+
+    #[test]
+    fn test_shared_snapshot_from_json_rejects_bad_pixels() {
+        let mut store = GraphicsStore::new();
+        store.add_graphic(create_test_graphic());
+        let json = store.export_json().unwrap();
+        let pixels = store.all_graphics()[0].pixels.as_slice();
+        let encoded = base64::engine::general_purpose::STANDARD.encode(pixels);
+
+        let bad = json.replace(&encoded, "not base64!");
+        let err = GraphicsSnapshot::<SharedPixels>::from_json(&bad).unwrap_err();
+        assert!(matches!(err, GraphicsSerializationError::Base64Decode(_)));
+    }
+
+    #[test]
+    fn test_shared_snapshot_from_json_reports_missing_data_file() {
+        let dir = tempfile::tempdir().unwrap();
+        let missing = dir.path().join("missing.rgba");
+        let mut sg = SerializableGraphic::from(&create_test_graphic());
+        sg.data = ImageDataRef::File(missing.to_str().unwrap().to_string());
+        let mut snapshot = GraphicsStore::new().export_snapshot();
+        snapshot.placements.push(sg);
+        let json = serde_json::to_string(&snapshot).unwrap();
+
+        let err = GraphicsSnapshot::<SharedPixels>::from_json(&json).unwrap_err();
+        assert!(matches!(err, GraphicsSerializationError::FileRead(..)));
+
+        // A newer version is rejected before the data file is looked at
+        snapshot.version = GraphicsSnapshot::CURRENT_VERSION + 1;
+        let json = serde_json::to_string(&snapshot).unwrap();
+        let err = GraphicsSnapshot::<SharedPixels>::from_json(&json).unwrap_err();
+        assert!(matches!(
+            err,
+            GraphicsSerializationError::UnsupportedVersion(..)
+        ));
+    }
+
     #[test]
     fn test_unsupported_version() {
         let snapshot = GraphicsSnapshot {
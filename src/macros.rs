@@ -25,8 +25,9 @@
 use serde::{Deserialize, Serialize};
 use std::collections::HashMap;
 use std::fs;
-use std::io;
+use std::io::{self, BufWriter, Write};
 use std::path::Path;
+use std::sync::Arc;
 use std::time::{SystemTime, UNIX_EPOCH};
 
 /// A single macro event
@@ -112,6 +113,23 @@ impl Macro {
         self
     }
 
+    /// Add a key press event for each friendly key name, in order
+    ///
+    /// Equivalent to calling [`Macro::add_key`] once per key.
+    pub fn add_keys<I>(&mut self, keys: I) -> &mut Self
+    where
+        I: IntoIterator,
+        I::Item: Into<String>,
+    {
+        let timestamp = self.events.last().map(|e| e.timestamp()).unwrap_or(0);
+        self.events
+            .extend(keys.into_iter().map(|key| MacroEvent::KeyPress {
+                key: key.into(),
+                timestamp,
+            }));
+        self
+    }
+
     /// Add a delay event
     pub fn add_delay(&mut self, duration_ms: u64) -> &mut Self {
         let timestamp = self.events.last().map(|e| e.timestamp()).unwrap_or(0);
@@ -156,9 +174,11 @@ impl Macro {
 
     /// Save the macro to a YAML file
     pub fn save_yaml<P: AsRef<Path>>(&self, path: P) -> io::Result<()> {
-        let yaml = serde_yaml::to_string(self)
+        // Stream straight to the file instead of building the document first
+        let mut writer = BufWriter::new(fs::File::create(path)?);
+        serde_yaml::to_writer(&mut writer, self)
             .map_err(|e| io::Error::new(io::ErrorKind::InvalidData, e))?;
-        fs::write(path, yaml)
+        writer.flush()
     }
 
     /// Load a macro from a YAML file
@@ -197,16 +217,27 @@ impl KeyParser {
     ///
     /// Returns the bytes to send to the terminal
     pub fn parse_key(key: &str) -> Vec<u8> {
-        let key_lower = key.to_lowercase();
-        let parts: Vec<&str> = key_lower.split('+').collect();
-
         // Check for modifiers
-        let has_ctrl = parts.contains(&"ctrl");
-        let has_alt = parts.contains(&"alt");
-        let has_shift = parts.contains(&"shift");
+        let mut has_ctrl = false;
+        let mut has_alt = false;
+        let mut has_shift = false;
+        for part in key.split('+') {
+            has_ctrl |= part.eq_ignore_ascii_case("ctrl");
+            has_alt |= part.eq_ignore_ascii_case("alt");
+            has_shift |= part.eq_ignore_ascii_case("shift");
+        }
 
-        // Get the main key (last part)
-        let main_key = parts.last().copied().unwrap_or("");
+        // Get the main key (last part), lowercased in a stack buffer. The
+        // longest key name is "backspace", so longer keys can only be passed
+        // through as-is.
+        let main_key = key.rsplit('+').next().unwrap_or("");
+        let mut buf = [0u8; 9];
+        let Some(lower) = buf.get_mut(..main_key.len()) else {
+            return key.as_bytes().to_vec();
+        };
+        lower.copy_from_slice(main_key.as_bytes());
+        lower.make_ascii_lowercase();
+        let main_key = std::str::from_utf8(lower).unwrap_or_default();
 
         // Handle special keys
         match main_key {
@@ -278,8 +309,8 @@ impl KeyParser {
 /// Macro playback state machine
 #[derive(Debug, Clone)]
 pub struct MacroPlayback {
-    /// The macro being played
-    macro_data: Macro,
+    /// The macro being played (shared with the macro library it came from)
+    macro_data: Arc<Macro>,
     /// Current event index
     current_index: usize,
     /// Playback start time (milliseconds)
@@ -296,9 +327,9 @@ pub struct MacroPlayback {
 
 impl MacroPlayback {
     /// Create a new playback session
-    pub fn new(macro_data: Macro) -> Self {
+    pub fn new(macro_data: impl Into<Arc<Macro>>) -> Self {
         Self {
-            macro_data,
+            macro_data: macro_data.into(),
             current_index: 0,
             start_time: Self::current_time_ms(),
             speed: 1.0,
@@ -309,7 +340,7 @@ impl MacroPlayback {
     }
 
     /// Create a playback session with custom speed
-    pub fn with_speed(macro_data: Macro, speed: f64) -> Self {
+    pub fn with_speed(macro_data: impl Into<Arc<Macro>>, speed: f64) -> Self {
         let mut playback = Self::new(macro_data);
         playback.speed = speed;
         playback
@@ -411,6 +442,20 @@ mod tests {
         assert_eq!(macro_seq.name, "Test");
     }
 
+    #[test]
+    fn test_add_keys_matches_add_key() {
+        let mut batched = Macro::new("Test");
+        batched.add_delay(50).add_keys(["up", "down", "enter"]);
+
+        let mut single = Macro::new("Test");
+        single.add_delay(50);
+        for key in ["up", "down", "enter"] {
+            single.add_key(key);
+        }
+
+        assert_eq!(batched.events, single.events);
+    }
+
     #[test]
     fn test_key_parser() {
         assert_eq!(KeyParser::parse_key("ctrl+c"), vec![3]); // Ctrl+C
@@ -419,6 +464,20 @@ mod tests {
         assert_eq!(KeyParser::parse_key("a"), vec![b'a']);
     }
 
+    #[test]
+    fn test_key_parser_case_insensitive() {
+        assert_eq!(KeyParser::parse_key("CTRL+C"), vec![3]);
+        assert_eq!(KeyParser::parse_key("Shift+Tab"), vec![0x1b, b'[', b'Z']);
+        assert_eq!(KeyParser::parse_key("Alt+X"), vec![0x1b, b'x']);
+        assert_eq!(
+            KeyParser::parse_key("PageDown"),
+            vec![0x1b, b'[', b'6', b'~']
+        );
+        // Unknown names are passed through unchanged, whatever their length
+        assert_eq!(KeyParser::parse_key("Xy"), b"Xy".to_vec());
+        assert_eq!(KeyParser::parse_key("NotAKeyName"), b"NotAKeyName".to_vec());
+    }
+
     #[test]
     fn test_yaml_serialization() {
         let mut macro_seq = Macro::new("Test Macro");
@@ -465,6 +465,43 @@ macro_rules! impl_terminal_state_setters {
                 Ok(())
             }
 
+            /// Set default colors and the ANSI palette in one call
+            ///
+            /// Equivalent to `set_default_bg`, `set_default_fg` and one
+            /// `set_ansi_palette_color` per entry, but applied under a single
+            /// terminal lock.
+            ///
+            /// Args:
+            ///     default_bg: Default background color as (r, g, b)
+            ///     default_fg: Default foreground color as (r, g, b)
+            ///     palette: Up to 16 (r, g, b) colors, assigned from index 0
+            ///
+            /// Raises:
+            ///     ValueError: If palette has more than 16 entries
+            fn set_palette_bulk(
+                &mut self,
+                default_bg: (u8, u8, u8),
+                default_fg: (u8, u8, u8),
+                palette: Vec<(u8, u8, u8)>,
+            ) -> pyo3::PyResult<()> {
+                if palette.len() > 16 {
+                    return Err(pyo3::exceptions::PyValueError::new_err(format!(
+                        "palette has {} entries (must be at most 16)",
+                        palette.len()
+                    )));
+                }
+                let mut t = $crate::python_bindings::common::TerminalAccess::term_mut(self);
+                let (r, g, b) = default_bg;
+                t.set_default_bg($crate::color::Color::Rgb(r, g, b));
+                let (r, g, b) = default_fg;
+                t.set_default_fg($crate::color::Color::Rgb(r, g, b));
+                for (index, (r, g, b)) in palette.into_iter().enumerate() {
+                    t.set_ansi_palette_color(index, $crate::color::Color::Rgb(r, g, b))
+                        .map_err(pyo3::exceptions::PyValueError::new_err)?;
+                }
+                Ok(())
+            }
+
             /// Set cursor color (OSC 12)
             ///
             /// Args:
@@ -325,13 +325,32 @@ fn with_py_callback_reentrancy_guard<R>(f: impl FnOnce() -> R) -> Option<R> {
 pub(crate) struct PyCallbackObserver {
     callback: Py<PyAny>,
     subscriptions: Option<HashSet<TerminalEventKind>>,
+    /// Only deliver shell integration events with this `event_type`
+    /// (e.g. `"command_finished"`); other events are dropped before the
+    /// event dict is built or the GIL is taken.
+    event_type: Option<String>,
 }
 
 impl PyCallbackObserver {
-    pub fn new(callback: Py<PyAny>, subscriptions: Option<HashSet<TerminalEventKind>>) -> Self {
+    pub fn new(
+        callback: Py<PyAny>,
+        subscriptions: Option<HashSet<TerminalEventKind>>,
+        event_type: Option<String>,
+    ) -> Self {
         Self {
             callback,
             subscriptions,
+            event_type,
+        }
+    }
+
+    fn matches_event_type(&self, event: &TerminalEvent) -> bool {
+        match &self.event_type {
+            None => true,
+            Some(wanted) => matches!(
+                event,
+                TerminalEvent::ShellIntegrationEvent { event_type, .. } if event_type == wanted
+            ),
         }
     }
 }
@@ -343,6 +362,9 @@ unsafe impl Sync for PyCallbackObserver {}
 
 impl TerminalObserver for PyCallbackObserver {
     fn on_event(&self, event: &TerminalEvent) {
+        if !self.matches_event_type(event) {
+            return;
+        }
         let dict = event_to_dict(event);
         // Guard against reentrant dispatch deadlocking on the Terminal mutex
         // (ARC-016): drop the event if this thread is already inside a Python
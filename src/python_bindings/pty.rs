@@ -1272,7 +1272,7 @@ impl PyPtyTerminal {
     ///     macro: Macro object to load
     fn load_macro(&self, name: String, macro_obj: &super::types::PyMacro) -> PyResult<()> {
         if let Ok(mut term) = Ok::<_, ()>(self.inner.terminal().write()) {
-            term.load_macro(name, macro_obj.inner.clone());
+            term.load_shared_macro(name, std::sync::Arc::clone(&macro_obj.inner));
         }
         Ok(())
     }
@@ -1287,8 +1287,7 @@ impl PyPtyTerminal {
     fn get_macro(&self, name: String) -> PyResult<Option<super::types::PyMacro>> {
         if let Ok(term) = Ok::<_, ()>(self.inner.terminal().write()) {
             Ok(term
-                .get_macro(&name)
-                .cloned()
+                .get_shared_macro(&name)
                 .map(super::types::PyMacro::from))
         } else {
             Ok(None)
@@ -1517,6 +1516,11 @@ impl PyPtyTerminal {
     ) -> Option<std::sync::Arc<parking_lot::Mutex<Box<dyn std::io::Write + Send>>>> {
         self.inner.get_writer()
     }
+
+    /// Resize the PTY and terminal on behalf of the streaming server
+    pub(crate) fn resize_for_streaming(&mut self, cols: u16, rows: u16) -> PyResult<()> {
+        self.resize(cols, rows)
+    }
 }
 
 #[cfg(test)]
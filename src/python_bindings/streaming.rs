@@ -33,7 +33,7 @@ impl Clone for PyStreamingConfig {
 #[pymethods]
 impl PyStreamingConfig {
     #[new]
-    #[pyo3(signature = (max_clients=1000, send_initial_screen=true, keepalive_interval=30, default_read_only=false, initial_cols=0, initial_rows=0, enable_http=false, web_root="./web_term", max_clients_per_session=0, input_rate_limit_bytes_per_sec=0, enable_system_stats=false, system_stats_interval_secs=5, api_key=None, allow_api_key_in_query=false, allowed_origins=None))]
+    #[pyo3(signature = (max_clients=1000, send_initial_screen=true, keepalive_interval=30, default_read_only=false, initial_cols=0, initial_rows=0, enable_http=false, web_root="./web_term", max_clients_per_session=0, input_rate_limit_bytes_per_sec=0, enable_system_stats=false, system_stats_interval_secs=5, api_key=None, allow_api_key_in_query=false, allowed_origins=None, send_buffer_bytes=0, recv_buffer_bytes=0))]
     #[allow(clippy::too_many_arguments)]
     fn new(
         max_clients: usize,
@@ -51,6 +51,8 @@ impl PyStreamingConfig {
         api_key: Option<String>,
         allow_api_key_in_query: bool,
         allowed_origins: Option<Vec<String>>,
+        send_buffer_bytes: usize,
+        recv_buffer_bytes: usize,
     ) -> Self {
         Self {
             inner: StreamingConfig {
@@ -74,6 +76,8 @@ impl PyStreamingConfig {
                 api_key,
                 allow_api_key_in_query,
                 allowed_origins,
+                send_buffer_bytes,
+                recv_buffer_bytes,
             },
         }
     }
@@ -222,6 +226,30 @@ impl PyStreamingConfig {
         self.inner.input_rate_limit_bytes_per_sec = input_rate_limit_bytes_per_sec;
     }
 
+    /// Get the client socket send buffer size in bytes (0 = OS default)
+    #[getter]
+    fn send_buffer_bytes(&self) -> usize {
+        self.inner.send_buffer_bytes
+    }
+
+    /// Set the client socket send buffer size in bytes (0 = OS default)
+    #[setter]
+    fn set_send_buffer_bytes(&mut self, send_buffer_bytes: usize) {
+        self.inner.send_buffer_bytes = send_buffer_bytes;
+    }
+
+    /// Get the client socket receive buffer size in bytes (0 = OS default)
+    #[getter]
+    fn recv_buffer_bytes(&self) -> usize {
+        self.inner.recv_buffer_bytes
+    }
+
+    /// Set the client socket receive buffer size in bytes (0 = OS default)
+    #[setter]
+    fn set_recv_buffer_bytes(&mut self, recv_buffer_bytes: usize) {
+        self.inner.recv_buffer_bytes = recv_buffer_bytes;
+    }
+
     /// Get whether system stats collection is enabled
     #[getter]
     fn enable_system_stats(&self) -> bool {
@@ -423,19 +451,20 @@ impl PyStreamingServer {
                 let mut buffer = utf8_buffer.lock();
                 buffer.extend_from_slice(data);
 
-                // Try to convert as much as possible to valid UTF-8
-                match std::str::from_utf8(&buffer) {
-                    Ok(valid_str) => {
+                // Try to convert as much as possible to valid UTF-8. The common
+                // all-valid case moves the buffer into the String instead of
+                // copying it.
+                match String::from_utf8(std::mem::take(&mut *buffer)) {
+                    Ok(output) => {
                         // All bytes are valid UTF-8
-                        let output = valid_str.to_string();
-                        buffer.clear();
                         if output_sender.try_send(output).is_err() {
                             crate::debug_info!("STREAMING", "Output channel full, message dropped");
                         }
                     }
                     Err(error) => {
                         // Find how much is valid
-                        let valid_up_to = error.valid_up_to();
+                        let valid_up_to = error.utf8_error().valid_up_to();
+                        *buffer = error.into_bytes();
 
                         if valid_up_to > 0 {
                             // Send the valid portion
@@ -481,11 +510,23 @@ impl PyStreamingServer {
         })
     }
 
-    /// Start the streaming server (non-blocking)
+    /// Start the streaming server
     ///
-    /// This spawns the server in a background thread
-    fn start(&mut self) -> PyResult<()> {
+    /// This spawns the server in a background thread and returns once it is
+    /// listening, so clients can connect immediately without a startup sleep.
+    ///
+    /// Raises:
+    ///     RuntimeError: If the server is already started, fails to start
+    ///         (e.g. the address is in use) or is not listening within 5 seconds
+    fn start(&mut self, py: Python<'_>) -> PyResult<()> {
         if let Some(server) = &self.server {
+            let mut listening = server.listening_receiver();
+            // The flag stays set once bound, so a second start() would
+            // otherwise report success while its own bind fails
+            if *listening.borrow() {
+                return Err(PyRuntimeError::new_err("Server is already started"));
+            }
+            let (failed_tx, failed_rx) = tokio::sync::oneshot::channel::<String>();
             let server = server.clone();
             let runtime = self.runtime.clone();
 
@@ -494,11 +535,36 @@ impl PyStreamingServer {
                 runtime.block_on(async {
                     if let Err(e) = server.start().await {
                         crate::debug_error!("STREAMING", "Streaming server error: {}", e);
+                        let _ = failed_tx.send(e.to_string());
                     }
                 });
             });
 
-            Ok(())
+            // Wait (GIL released) until the listener is bound or startup fails
+            let runtime = self.runtime.clone();
+            let ready = py.detach(move || {
+                runtime.block_on(async {
+                    let wait = async {
+                        tokio::select! {
+                            bound = listening.wait_for(|bound| *bound) => bound
+                                .map(|_| ())
+                                .map_err(|_| "server exited before listening".to_string()),
+                            failed = failed_rx => match failed {
+                                Ok(e) => Err(e),
+                                Err(_) => Err("server exited before listening".to_string()),
+                            },
+                        }
+                    };
+                    tokio::time::timeout(std::time::Duration::from_secs(5), wait)
+                        .await
+                        .unwrap_or_else(|_| {
+                            Err("timed out waiting for the server to listen".to_string())
+                        })
+                })
+            });
+            ready.map_err(|e| {
+                PyRuntimeError::new_err(format!("Failed to start streaming server: {}", e))
+            })
         } else {
             Err(PyRuntimeError::new_err("Server has been stopped"))
         }
@@ -569,8 +635,15 @@ impl PyStreamingServer {
     /// Send output data to all connected clients
     ///
     /// Args:
-    ///     data: The output data to send (ANSI escape sequences)
-    fn send_output(&self, data: String) -> PyResult<()> {
+    ///     data: The output data to send (ANSI escape sequences), as str or
+    ///         UTF-8 bytes. Bytes are forwarded without a str round-trip, so
+    ///         callers can keep pre-encoded constants; invalid UTF-8 is
+    ///         replaced with U+FFFD.
+    fn send_output(&self, data: &Bound<'_, PyAny>) -> PyResult<()> {
+        let data = match data.extract::<&[u8]>() {
+            Ok(bytes) => String::from_utf8_lossy(bytes).into_owned(),
+            Err(_) => data.extract::<String>()?,
+        };
         if let Some(server) = &self.server {
             server
                 .send_output(data)
@@ -594,6 +667,35 @@ impl PyStreamingServer {
         }
     }
 
+    /// Resize the PTY and broadcast the new size to all clients
+    ///
+    /// Equivalent to pty_terminal.resize(cols, rows) followed by
+    /// send_resize(cols, rows), but done in one call. The terminal is resized
+    /// before the event is broadcast, so any client that connects in between
+    /// already receives the new size in its initial screen.
+    ///
+    /// Args:
+    ///     pty_terminal: The PtyTerminal this server streams
+    ///     cols: Number of columns
+    ///     rows: Number of rows
+    ///
+    /// Raises:
+    ///     ValueError: If cols or rows is 0
+    ///     RuntimeError: If the server has been stopped
+    fn resize_and_broadcast(
+        &self,
+        pty_terminal: &mut crate::python_bindings::pty::PyPtyTerminal,
+        cols: u16,
+        rows: u16,
+    ) -> PyResult<()> {
+        let Some(server) = &self.server else {
+            return Err(PyRuntimeError::new_err("Server has been stopped"));
+        };
+        pty_terminal.resize_for_streaming(cols, rows)?;
+        server.send_resize(cols, rows);
+        Ok(())
+    }
+
     /// Poll for resize requests from clients (non-blocking)
     ///
     /// Returns:
@@ -615,6 +717,62 @@ impl PyStreamingServer {
         }
     }
 
+    /// Wait for a resize request from clients (blocking, releases the GIL)
+    ///
+    /// Args:
+    ///     timeout: Maximum time to wait in seconds (default: 1.0)
+    ///     coalesce: If True, also drain any requests already queued behind the
+    ///         first one and return only the latest size (default: False)
+    ///
+    /// Returns:
+    ///     Optional tuple of (cols, rows) if a resize request arrived, None on timeout
+    ///
+    /// Event-driven alternative to calling poll_resize() from a sleep loop:
+    /// the caller wakes as soon as a request arrives instead of on the next tick.
+    /// With coalesce=True a burst of requests (e.g. from a window drag) costs
+    /// one call and one resize instead of one per request.
+    #[pyo3(signature = (timeout=1.0, coalesce=false))]
+    fn wait_resize(
+        &self,
+        py: Python<'_>,
+        timeout: f64,
+        coalesce: bool,
+    ) -> PyResult<Option<(u16, u16)>> {
+        // Rejects negative, NaN and infinite values, and finite values too
+        // large for a Duration, which from_secs_f64 would panic on
+        let timeout = std::time::Duration::try_from_secs_f64(timeout).map_err(|_| {
+            pyo3::exceptions::PyValueError::new_err(
+                "timeout must be a non-negative number of seconds",
+            )
+        })?;
+        if let Some(ref resize_rx) = self.resize_rx {
+            let resize_rx = resize_rx.clone();
+            let runtime = self.runtime.clone();
+
+            Ok(py.detach(move || {
+                runtime.block_on(async {
+                    // The lock is taken inside the timeout so a concurrent
+                    // poll_resize()/wait_resize() cannot hold this call past it
+                    tokio::time::timeout(timeout, async {
+                        let mut rx = resize_rx.lock().await;
+                        let mut size = rx.recv().await;
+                        if coalesce && size.is_some() {
+                            while let Ok(latest) = rx.try_recv() {
+                                size = Some(latest);
+                            }
+                        }
+                        size
+                    })
+                    .await
+                    .ok()
+                    .flatten()
+                })
+            }))
+        } else {
+            Ok(None)
+        }
+    }
+
     /// Send a title change event to all clients
     ///
     /// Args:
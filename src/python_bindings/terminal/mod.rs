@@ -29,6 +29,7 @@ use pyo3::prelude::*;
 use std::collections::HashMap;
 
 use crate::color::Color;
+use crate::graphics::{GraphicsSnapshot, SharedPixels};
 
 use super::enums::PyMouseEncoding;
 use super::types::{PyAttributes, PyScreenSnapshot};
@@ -1033,7 +1034,8 @@ impl PyTerminal {
     /// Export all graphics metadata as a JSON string for session persistence
     ///
     /// Serializes all active placements, scrollback graphics, and animation state
-    /// into a JSON string. Image pixel data is base64-encoded inline.
+    /// into a JSON string. Image pixel data is base64-encoded inline. The
+    /// encoding runs with the GIL released.
     ///
     /// Returns:
     ///     JSON string containing the serialized graphics snapshot
@@ -1042,10 +1044,12 @@ impl PyTerminal {
     ///     >>> json_str = terminal.export_graphics_json()
     ///     >>> with open("session_graphics.json", "w") as f:
     ///     ...     f.write(json_str)
-    fn export_graphics_json(&self) -> PyResult<String> {
-        self.inner
-            .graphics_store()
-            .export_json()
+    fn export_graphics_json(slf: &Bound<'_, Self>) -> PyResult<String> {
+        // The snapshot shares the pixel buffers, so the terminal is only
+        // borrowed for this line and not while the JSON is written
+        let snapshot = slf.borrow().inner.graphics_store().shared_snapshot();
+        slf.py()
+            .detach(|| snapshot.to_json())
             .map_err(|e| PyRuntimeError::new_err(e.to_string()))
     }
 
@@ -1053,6 +1057,7 @@ impl PyTerminal {
     ///
     /// Deserializes graphics from JSON and restores active placements, scrollback
     /// graphics, and animation state. Existing graphics are cleared first.
+    /// Parsing and pixel decoding run with the GIL released.
     ///
     /// Args:
     ///     json: JSON string from a previous export_graphics_json() call
@@ -1060,15 +1065,91 @@ impl PyTerminal {
     /// Returns:
     ///     Number of graphics restored
     ///
+    /// Raises:
+    ///     IOError: If a pixel data file referenced by the JSON cannot be read
+    ///     RuntimeError: If the JSON or its pixel data is invalid, or the
+    ///         snapshot version is not supported
+    ///
     /// Example:
     ///     >>> with open("session_graphics.json") as f:
     ///     ...     json_str = f.read()
     ///     >>> count = terminal.import_graphics_json(json_str)
     ///     >>> print(f"Restored {count} graphics")
-    fn import_graphics_json(&mut self, json: &str) -> PyResult<usize> {
+    fn import_graphics_json(slf: &Bound<'_, Self>, json: &str) -> PyResult<usize> {
+        // Decode before borrowing the terminal so other threads can use it
+        let snapshot = slf
+            .py()
+            .detach(|| GraphicsSnapshot::<SharedPixels>::from_json(json))
+            .map_err(graphics_file_error)?;
+        slf.borrow_mut()
+            .inner
+            .graphics_store_mut()
+            .import_shared_snapshot(&snapshot)
+            .map_err(|e| PyRuntimeError::new_err(e.to_string()))
+    }
+
+    /// Export graphics to a JSON file for session persistence
+    ///
+    /// Writes the same document as export_graphics_json() directly to the
+    /// file, without building the JSON string in Python. The encoding and
+    /// file I/O run with the GIL released.
+    ///
+    /// Args:
+    ///     path: File to create or overwrite
+    ///
+    /// Raises:
+    ///     IOError: If the file cannot be written
+    fn export_graphics_file(slf: &Bound<'_, Self>, path: &str) -> PyResult<()> {
+        let snapshot = slf.borrow().inner.graphics_store().shared_snapshot();
+        slf.py()
+            .detach(|| snapshot.write_json_file(path))
+            .map_err(graphics_file_error)
+    }
+
+    /// Import graphics from a JSON file to restore session state
+    ///
+    /// Reads a file written by export_graphics_file(), or any JSON saved from
+    /// export_graphics_json(). Existing graphics are cleared first. Reading
+    /// and decoding run with the GIL released.
+    ///
+    /// Args:
+    ///     path: File to read
+    ///
+    /// Returns:
+    ///     Number of graphics restored
+    ///
+    /// Raises:
+    ///     IOError: If the file, or a pixel data file it references, cannot
+    ///         be read
+    ///     RuntimeError: If the JSON or its pixel data is invalid, or the
+    ///         snapshot version is not supported
+    fn import_graphics_file(slf: &Bound<'_, Self>, path: &str) -> PyResult<usize> {
+        let snapshot = slf
+            .py()
+            .detach(|| GraphicsSnapshot::<SharedPixels>::read_json_file(path))
+            .map_err(graphics_file_error)?;
+        slf.borrow_mut()
+            .inner
+            .graphics_store_mut()
+            .import_shared_snapshot(&snapshot)
+            .map_err(|e| PyRuntimeError::new_err(e.to_string()))
+    }
+
+    /// Replace this terminal's graphics with a copy of another terminal's
+    ///
+    /// Same result as `import_graphics_json(other.export_graphics_json())`,
+    /// but pixel data is shared in memory instead of being encoded to JSON
+    /// and decoded again. Existing graphics are cleared first.
+    ///
+    /// Args:
+    ///     other: Terminal to copy graphics from
+    ///
+    /// Returns:
+    ///     Number of graphics restored
+    fn copy_graphics_from(&mut self, other: PyRef<'_, PyTerminal>) -> PyResult<usize> {
         self.inner
             .graphics_store_mut()
-            .import_json(json)
+            .copy_from(other.inner.graphics_store())
             .map_err(|e| PyRuntimeError::new_err(e.to_string()))
     }
 
@@ -1441,6 +1522,15 @@ impl PyTerminal {
         Ok(events.iter().map(event_to_dict).collect())
     }
 
+    /// Discard all pending terminal events
+    ///
+    /// Same effect as ``poll_events()`` without building the list of event
+    /// dictionaries. Use it to skip events that are not of interest.
+    fn clear_events(&mut self) -> PyResult<()> {
+        self.inner.clear_events();
+        Ok(())
+    }
+
     /// Drain pending screen cleared events
     ///
     /// Returns a list of booleans indicating whether each clear event also
@@ -1500,6 +1590,10 @@ impl PyTerminal {
     /// Args:
     ///     callback: A Python callable that accepts a single dict argument.
     ///     kinds: Optional list of event kind strings to filter on.
+    ///     event_type: Optional shell integration event type (e.g.
+    ///         "command_finished"). When set, only shell_integration events
+    ///         with that event_type are delivered; the filter runs in Rust
+    ///         before the callback is invoked.
     ///
     /// Returns:
     ///     int: A unique observer ID.
@@ -1508,11 +1602,12 @@ impl PyTerminal {
     ///     >>> def on_event(event):
     ///     ...     print(event["type"])
     ///     >>> observer_id = term.add_observer(on_event, kinds=["bell", "title_changed"])
-    #[pyo3(signature = (callback, kinds=None))]
+    #[pyo3(signature = (callback, kinds=None, event_type=None))]
     fn add_observer(
         &mut self,
         callback: Py<pyo3::types::PyAny>,
         kinds: Option<Vec<String>>,
+        event_type: Option<String>,
     ) -> PyResult<u64> {
         use crate::python_bindings::observer::PyCallbackObserver;
         let subs = kinds.map(|items| {
@@ -1521,7 +1616,7 @@ impl PyTerminal {
                 .filter_map(|k| Self::parse_event_kind(&k))
                 .collect()
         });
-        let observer = std::sync::Arc::new(PyCallbackObserver::new(callback, subs));
+        let observer = std::sync::Arc::new(PyCallbackObserver::new(callback, subs, event_type));
         Ok(self.inner.add_observer(observer))
     }
 
@@ -1867,6 +1962,21 @@ pub(super) fn parse_clipboard_slot(slot: &str) -> PyResult<crate::terminal::Clip
     }
 }
 
+/// Map a graphics file export/import error to a Python exception
+///
+/// File access failures become `IOError`; anything else in the document
+/// (bad JSON, bad pixel data, unsupported version) is a `RuntimeError`, as
+/// for the JSON string methods.
+fn graphics_file_error(e: crate::graphics::serialization::GraphicsSerializationError) -> PyErr {
+    use crate::graphics::serialization::GraphicsSerializationError;
+    match e {
+        GraphicsSerializationError::FileRead(..) | GraphicsSerializationError::FileWrite(..) => {
+            PyIOError::new_err(e.to_string())
+        }
+        _ => PyRuntimeError::new_err(e.to_string()),
+    }
+}
+
 /// Convert a `FileTransfer` to a Python dictionary
 ///
 /// Creates a `PyDict` with the transfer's metadata fields. When `include_data`
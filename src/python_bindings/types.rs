@@ -7,6 +7,8 @@
 //! - PyGraphic: Sixel graphics representation
 //! - LineCellData: Type alias for row cell data
 
+use std::sync::Arc;
+
 use pyo3::prelude::*;
 
 use super::enums::{PyCursorStyle, PyUnderlineStyle};
@@ -333,7 +335,7 @@ pub struct PyImageDimension {
     /// Numeric value (0 means auto)
     pub value: f64,
     /// Unit: "auto", "cells", "pixels", or "percent"
-    pub unit: String,
+    pub unit: &'static str,
 }
 
 #[pymethods]
@@ -356,7 +358,7 @@ impl From<&crate::graphics::ImageDimension> for PyImageDimension {
     fn from(dim: &crate::graphics::ImageDimension) -> Self {
         Self {
             value: dim.value,
-            unit: dim.unit.as_str().to_string(),
+            unit: dim.unit.as_str(),
         }
     }
 }
@@ -367,7 +369,7 @@ impl From<&crate::graphics::ImageDimension> for PyImageDimension {
 #[derive(Clone)]
 pub struct PyImagePlacement {
     /// Display mode: "inline" or "download"
-    pub display_mode: String,
+    pub display_mode: &'static str,
     /// Requested width dimension
     pub requested_width: PyImageDimension,
     /// Requested height dimension
@@ -399,7 +401,7 @@ impl PyImagePlacement {
 impl From<&crate::graphics::ImagePlacement> for PyImagePlacement {
     fn from(placement: &crate::graphics::ImagePlacement) -> Self {
         Self {
-            display_mode: placement.display_mode.as_str().to_string(),
+            display_mode: placement.display_mode.as_str(),
             requested_width: PyImageDimension::from(&placement.requested_width),
             requested_height: PyImageDimension::from(&placement.requested_height),
             preserve_aspect_ratio: placement.preserve_aspect_ratio,
@@ -419,7 +421,7 @@ pub struct PyGraphic {
     #[pyo3(get)]
     pub id: u64,
     #[pyo3(get)]
-    pub protocol: String,
+    pub protocol: &'static str,
     #[pyo3(get)]
     pub position: (usize, usize),
     #[pyo3(get)]
@@ -526,7 +528,7 @@ impl From<&crate::sixel::SixelGraphic> for PyGraphic {
     fn from(graphic: &crate::sixel::SixelGraphic) -> Self {
         Self {
             id: graphic.id,
-            protocol: "sixel".to_string(),
+            protocol: "sixel",
             position: graphic.position,
             width: graphic.width,
             height: graphic.height,
@@ -545,7 +547,7 @@ impl From<&crate::graphics::TerminalGraphic> for PyGraphic {
     fn from(graphic: &crate::graphics::TerminalGraphic) -> Self {
         Self {
             id: graphic.id,
-            protocol: graphic.protocol.as_str().to_string(),
+            protocol: graphic.protocol.as_str(),
             position: graphic.position,
             width: graphic.width,
             height: graphic.height,
@@ -1523,8 +1525,8 @@ impl PyClipboardEntry {
 #[pyclass(name = "MouseEvent", from_py_object)]
 #[derive(Clone)]
 pub struct PyMouseEvent {
-    pub event_type: String,
-    pub button: String,
+    pub event_type: &'static str,
+    pub button: &'static str,
     pub col: usize,
     pub row: usize,
     pub pixel_x: Option<u16>,
@@ -1554,16 +1556,14 @@ impl From<&crate::mouse::MouseEventRecord> for PyMouseEvent {
             MouseEventType::Drag => "drag",
             MouseEventType::ScrollUp => "scrollup",
             MouseEventType::ScrollDown => "scrolldown",
-        }
-        .to_string();
+        };
 
         let button = match event.button {
             MouseButton::Left => "left",
             MouseButton::Middle => "middle",
             MouseButton::Right => "right",
             MouseButton::None => "none",
-        }
-        .to_string();
+        };
 
         PyMouseEvent {
             event_type,
@@ -3003,7 +3003,7 @@ impl From<&PyCoprocessConfig> for crate::coprocess::CoprocessConfig {
 #[derive(Clone)]
 pub struct PyRecordingEvent {
     pub timestamp: u64,
-    pub event_type: String,
+    pub event_type: &'static str,
     pub data: Vec<u8>,
     pub metadata: Option<(usize, usize)>,
 }
@@ -3028,11 +3028,11 @@ impl PyRecordingEvent {
 impl From<&crate::terminal::RecordingEvent> for PyRecordingEvent {
     fn from(event: &crate::terminal::RecordingEvent) -> Self {
         let event_type = match event.event_type {
-            crate::terminal::RecordingEventType::Input => "Input".to_string(),
-            crate::terminal::RecordingEventType::Output => "Output".to_string(),
-            crate::terminal::RecordingEventType::Resize => "Resize".to_string(),
-            crate::terminal::RecordingEventType::Metadata => "Metadata".to_string(),
-            crate::terminal::RecordingEventType::Marker => "Marker".to_string(),
+            crate::terminal::RecordingEventType::Input => "Input",
+            crate::terminal::RecordingEventType::Output => "Output",
+            crate::terminal::RecordingEventType::Resize => "Resize",
+            crate::terminal::RecordingEventType::Metadata => "Metadata",
+            crate::terminal::RecordingEventType::Marker => "Marker",
         };
 
         PyRecordingEvent {
@@ -3133,7 +3133,7 @@ impl From<crate::terminal::RecordingSession> for PyRecordingSession {
 #[pyclass(name = "MacroEvent", from_py_object)]
 #[derive(Clone)]
 pub struct PyMacroEvent {
-    pub event_type: String,
+    pub event_type: &'static str,
     pub timestamp: u64,
     pub key: Option<String>,
     pub duration: Option<u64>,
@@ -3143,7 +3143,7 @@ pub struct PyMacroEvent {
 #[pymethods]
 impl PyMacroEvent {
     fn __repr__(&self) -> String {
-        match self.event_type.as_str() {
+        match self.event_type {
             "key" => format!(
                 "MacroEvent(key={}, timestamp={}ms)",
                 self.key.as_ref().unwrap(),
@@ -3167,7 +3167,7 @@ impl From<&crate::macros::MacroEvent> for PyMacroEvent {
     fn from(event: &crate::macros::MacroEvent) -> Self {
         match event {
             crate::macros::MacroEvent::KeyPress { key, timestamp } => PyMacroEvent {
-                event_type: "key".to_string(),
+                event_type: "key",
                 timestamp: *timestamp,
                 key: Some(key.clone()),
                 duration: None,
@@ -3177,14 +3177,14 @@ impl From<&crate::macros::MacroEvent> for PyMacroEvent {
                 duration,
                 timestamp,
             } => PyMacroEvent {
-                event_type: "delay".to_string(),
+                event_type: "delay",
                 timestamp: *timestamp,
                 key: None,
                 duration: Some(*duration),
                 label: None,
             },
             crate::macros::MacroEvent::Screenshot { label, timestamp } => PyMacroEvent {
-                event_type: "screenshot".to_string(),
+                event_type: "screenshot",
                 timestamp: *timestamp,
                 key: None,
                 duration: None,
@@ -3198,7 +3198,8 @@ impl From<&crate::macros::MacroEvent> for PyMacroEvent {
 #[pyclass(name = "Macro", from_py_object)]
 #[derive(Clone)]
 pub struct PyMacro {
-    pub(crate) inner: crate::macros::Macro,
+    /// Shared with the terminal's macro library; copied on first mutation
+    pub(crate) inner: Arc<crate::macros::Macro>,
 }
 
 #[pymethods]
@@ -3207,7 +3208,7 @@ impl PyMacro {
     #[new]
     fn new(name: String) -> Self {
         PyMacro {
-            inner: crate::macros::Macro::new(name),
+            inner: Arc::new(crate::macros::Macro::new(name)),
         }
     }
 
@@ -3222,22 +3223,29 @@ impl PyMacro {
 
     /// Add a key press event
     fn add_key(&mut self, key: String) {
-        self.inner.add_key(key);
+        Arc::make_mut(&mut self.inner).add_key(key);
+    }
+
+    /// Add a key press event for each key in the list, in order
+    ///
+    /// Equivalent to calling add_key() once per key, in a single call.
+    fn add_keys(&mut self, keys: Vec<String>) {
+        Arc::make_mut(&mut self.inner).add_keys(keys);
     }
 
     /// Add a delay event
     fn add_delay(&mut self, duration_ms: u64) {
-        self.inner.add_delay(duration_ms);
+        Arc::make_mut(&mut self.inner).add_delay(duration_ms);
     }
 
     /// Add a screenshot trigger
     fn add_screenshot(&mut self, label: Option<String>) {
-        self.inner.add_screenshot_labeled(label);
+        Arc::make_mut(&mut self.inner).add_screenshot_labeled(label);
     }
 
     /// Set description
     fn set_description(&mut self, description: String) {
-        self.inner.description = Some(description);
+        Arc::make_mut(&mut self.inner).description = Some(description);
     }
 
     /// Save to YAML file
@@ -3251,7 +3259,7 @@ impl PyMacro {
     #[staticmethod]
     fn load_yaml(path: String) -> PyResult<Self> {
         crate::macros::Macro::load_yaml(path)
-            .map(|inner| PyMacro { inner })
+            .map(PyMacro::from)
             .map_err(|e| pyo3::exceptions::PyIOError::new_err(e.to_string()))
     }
 
@@ -3266,7 +3274,7 @@ impl PyMacro {
     #[staticmethod]
     fn from_yaml(yaml: String) -> PyResult<Self> {
         crate::macros::Macro::from_yaml(&yaml)
-            .map(|inner| PyMacro { inner })
+            .map(PyMacro::from)
             .map_err(|e| pyo3::exceptions::PyValueError::new_err(e.to_string()))
     }
 
@@ -3309,7 +3317,15 @@ impl PyMacro {
 
 impl From<crate::macros::Macro> for PyMacro {
     fn from(macro_data: crate::macros::Macro) -> Self {
-        PyMacro { inner: macro_data }
+        PyMacro {
+            inner: Arc::new(macro_data),
+        }
+    }
+}
+
+impl From<Arc<crate::macros::Macro>> for PyMacro {
+    fn from(inner: Arc<crate::macros::Macro>) -> Self {
+        PyMacro { inner }
     }
 }
 
@@ -3641,7 +3657,7 @@ mod tests {
 
         let graphic = PyGraphic {
             id: 1,
-            protocol: "sixel".to_string(),
+            protocol: "sixel",
             position: (0, 0),
             width: 2,
             height: 2,
@@ -3664,7 +3680,7 @@ mod tests {
     fn test_pygraphic_get_pixel_out_of_bounds() {
         let graphic = PyGraphic {
             id: 1,
-            protocol: "sixel".to_string(),
+            protocol: "sixel",
             position: (0, 0),
             width: 2,
             height: 2,
@@ -3686,7 +3702,7 @@ mod tests {
     fn test_pygraphic_get_pixel_edge_cases() {
         let graphic = PyGraphic {
             id: 1,
-            protocol: "sixel".to_string(),
+            protocol: "sixel",
             position: (5, 10),
             width: 3,
             height: 3,
@@ -3715,7 +3731,7 @@ mod tests {
         let original_pixels = vec![10, 20, 30, 40, 50, 60, 70, 80];
         let graphic = PyGraphic {
             id: 1,
-            protocol: "sixel".to_string(),
+            protocol: "sixel",
             position: (0, 0),
             width: 2,
             height: 1,
@@ -3737,7 +3753,7 @@ mod tests {
     fn test_pygraphic_repr() {
         let graphic = PyGraphic {
             id: 42,
-            protocol: "sixel".to_string(),
+            protocol: "sixel",
             position: (10, 20),
             width: 100,
             height: 50,
@@ -3761,7 +3777,7 @@ mod tests {
     fn test_pygraphic_clone() {
         let graphic1 = PyGraphic {
             id: 1,
-            protocol: "sixel".to_string(),
+            protocol: "sixel",
             position: (5, 10),
             width: 20,
             height: 30,
@@ -3802,7 +3818,7 @@ mod tests {
 
         let graphic = PyGraphic {
             id: 1,
-            protocol: "sixel".to_string(),
+            protocol: "sixel",
             position: (0, 0),
             width: 2,
             height: 2,
@@ -3931,7 +3947,7 @@ mod tests {
 
         let graphic = PyGraphic {
             id: 1,
-            protocol: "sixel".to_string(),
+            protocol: "sixel",
             position: (0, 0),
             width: 4,
             height: 1,
@@ -14,7 +14,7 @@ use std::path::Path;
 use std::sync::atomic::{AtomicU64, AtomicUsize, Ordering};
 use std::sync::Arc;
 use std::time::Duration;
-use tokio::net::{TcpListener, TcpStream};
+use tokio::net::{TcpListener, TcpSocket, TcpStream};
 use tokio::sync::{broadcast, mpsc};
 use tokio_rustls::rustls::pki_types::pem::PemObject;
 use tokio_rustls::rustls::pki_types::{CertificateDer, PrivateKeyDer};
@@ -360,6 +360,15 @@ pub struct StreamingConfig {
     /// are rejected to prevent CSRF-via-WebSocket. Set this to expose the server
     /// to specific remote browser origins.
     pub allowed_origins: Option<Vec<String>>,
+    /// Kernel send buffer size (`SO_SNDBUF`) for client sockets in bytes
+    /// (0 = OS default).
+    ///
+    /// A larger buffer lets output bursts (e.g. `cat` of a large file) keep
+    /// flowing on high-latency links instead of stalling on TCP backpressure.
+    pub send_buffer_bytes: usize,
+    /// Kernel receive buffer size (`SO_RCVBUF`) for client sockets in bytes
+    /// (0 = OS default)
+    pub recv_buffer_bytes: usize,
 }
 
 impl Default for StreamingConfig {
@@ -385,6 +394,8 @@ impl Default for StreamingConfig {
             api_key: None,
             allow_api_key_in_query: false,
             allowed_origins: None,
+            send_buffer_bytes: 0,
+            recv_buffer_bytes: 0,
         }
     }
 }
@@ -743,7 +754,22 @@ impl SessionState {
                     match msg {
                         Some(data) => {
                             if !data.is_empty() {
-                                buffer.push_str(&data);
+                                if buffer.is_empty() {
+                                    // Adopt the chunk's allocation rather than
+                                    // copying it into a fresh buffer
+                                    buffer = data;
+                                } else {
+                                    buffer.push_str(&data);
+                                }
+                                // Drain whatever else is already queued without
+                                // waiting, so a PTY burst becomes one frame
+                                // instead of one wakeup per chunk
+                                while buffer.len() <= MAX_BATCH_SIZE {
+                                    match rx.try_recv() {
+                                        Ok(more) => buffer.push_str(&more),
+                                        Err(_) => break,
+                                    }
+                                }
                                 if buffer.len() > MAX_BATCH_SIZE {
                                     let data_len = buffer.len();
                                     let msg = ServerMessage::output(std::mem::take(&mut buffer));
@@ -1131,6 +1157,8 @@ pub struct StreamingServer {
     shutdown: Arc<tokio::sync::Notify>,
     /// The default session (for backward-compatible single-session mode)
     default_session: Option<Arc<SessionState>>,
+    /// Set to true once the listening socket is bound
+    listening: tokio::sync::watch::Sender<bool>,
 }
 
 impl StreamingServer {
@@ -1167,6 +1195,7 @@ impl StreamingServer {
             theme: None,
             shutdown: Arc::new(tokio::sync::Notify::new()),
             default_session: Some(default_session),
+            listening: tokio::sync::watch::channel(false).0,
         }
     }
 
@@ -1187,9 +1216,18 @@ impl StreamingServer {
             theme: None,
             shutdown: Arc::new(tokio::sync::Notify::new()),
             default_session: None,
+            listening: tokio::sync::watch::channel(false).0,
         }
     }
 
+    /// Subscribe to the server's listening state
+    ///
+    /// The value becomes `true` once `start()` has bound its listening socket,
+    /// so callers can wait for readiness instead of sleeping.
+    pub fn listening_receiver(&self) -> tokio::sync::watch::Receiver<bool> {
+        self.listening.subscribe()
+    }
+
     /// Set the theme to be sent to clients on connection
     pub fn set_theme(&mut self, theme: ThemeInfo) {
         self.theme = Some(theme.clone());
@@ -1559,9 +1597,11 @@ impl StreamingServer {
             .layer(build_cors_layer(&self.config.allowed_origins));
 
         // Start server
-        let listener = tokio::net::TcpListener::bind(&self.addr)
+        let listener = self
+            .bind_listener()
             .await
             .map_err(|e| StreamingError::ServerError(format!("Failed to bind: {}", e)))?;
+        self.listening.send_replace(true);
 
         axum::serve(listener, app.into_make_service())
             .await
@@ -1627,13 +1667,20 @@ impl StreamingServer {
         .await
         .map_err(|e| StreamingError::ServerError(format!("Failed to create TLS config: {}", e)))?;
 
-        // Parse address for axum-server
-        let addr: std::net::SocketAddr = self.addr.parse().map_err(|e| {
-            StreamingError::ServerError(format!("Invalid address '{}': {}", self.addr, e))
-        })?;
+        // Bind the socket here rather than inside axum-server's serve(), so
+        // bind failures are reported to start() and the configured socket
+        // buffer sizes apply to HTTPS as well
+        let listener = self
+            .bind_listener()
+            .await
+            .and_then(|listener| listener.into_std())
+            .map_err(|e| StreamingError::ServerError(format!("Failed to bind: {}", e)))?;
+        let server = axum_server::from_tcp_rustls(listener, rustls_config)
+            .map_err(|e| StreamingError::ServerError(format!("Failed to bind: {}", e)))?;
+        self.listening.send_replace(true);
 
         // Start HTTPS server
-        axum_server::bind_rustls(addr, rustls_config)
+        server
             .serve(app.into_make_service())
             .await
             .map_err(|e| StreamingError::ServerError(format!("Server error: {}", e)))?;
@@ -1641,9 +1688,62 @@ impl StreamingServer {
         Ok(())
     }
 
+    /// Bind the listening socket, applying the configured socket buffer sizes
+    ///
+    /// Buffer sizes set on the listener are inherited by every accepted
+    /// connection, so they only need to be applied once here. Like
+    /// `TcpListener::bind`, each resolved address is tried in turn and the
+    /// last error is returned if none can be bound. Callers mark the server
+    /// as listening once they are ready to accept.
+    async fn bind_listener(&self) -> std::io::Result<TcpListener> {
+        let (send, recv) = (self.config.send_buffer_bytes, self.config.recv_buffer_bytes);
+        if send == 0 && recv == 0 {
+            return TcpListener::bind(&self.addr).await;
+        }
+
+        let mut last_err = None;
+        for addr in tokio::net::lookup_host(&self.addr).await? {
+            match Self::bind_with_buffers(addr, send, recv) {
+                Ok(listener) => return Ok(listener),
+                Err(e) => last_err = Some(e),
+            }
+        }
+        Err(last_err.unwrap_or_else(|| {
+            std::io::Error::new(
+                std::io::ErrorKind::InvalidInput,
+                format!("Could not resolve address '{}'", self.addr),
+            )
+        }))
+    }
+
+    /// Bind one resolved address with the given socket buffer sizes (0 = OS default)
+    fn bind_with_buffers(
+        addr: std::net::SocketAddr,
+        send: usize,
+        recv: usize,
+    ) -> std::io::Result<TcpListener> {
+        let socket = if addr.is_ipv4() {
+            TcpSocket::new_v4()?
+        } else {
+            TcpSocket::new_v6()?
+        };
+        // Match TcpListener::bind, which sets SO_REUSEADDR on Unix
+        #[cfg(unix)]
+        socket.set_reuseaddr(true)?;
+        if send > 0 {
+            socket.set_send_buffer_size(u32::try_from(send).unwrap_or(u32::MAX))?;
+        }
+        if recv > 0 {
+            socket.set_recv_buffer_size(u32::try_from(recv).unwrap_or(u32::MAX))?;
+        }
+        socket.bind(addr)?;
+        socket.listen(1024)
+    }
+
     /// Start WebSocket-only server (original implementation)
     async fn start_websocket_only(self: Arc<Self>) -> Result<()> {
-        let listener = TcpListener::bind(&self.addr).await?;
+        let listener = self.bind_listener().await?;
+        self.listening.send_replace(true);
         crate::debug_info!(
             "STREAMING",
             "WebSocket-only server listening on {}",
@@ -1763,7 +1863,8 @@ impl StreamingServer {
         let rustls_config = tls_config.build_rustls_config()?;
         let acceptor = TlsAcceptor::from(Arc::new(rustls_config));
 
-        let listener = TcpListener::bind(&self.addr).await?;
+        let listener = self.bind_listener().await?;
+        self.listening.send_replace(true);
         crate::debug_info!(
             "STREAMING",
             "WebSocket-only server with TLS (WSS) listening on {}",
@@ -3309,6 +3410,32 @@ mod tests {
         assert!(tx.try_send("test".to_string()).is_ok());
     }
 
+    #[tokio::test]
+    async fn test_broadcaster_coalesces_queued_output() {
+        let terminal = Arc::new(RwLock::new(Terminal::new(80, 24)));
+        let session = Arc::new(SessionState::new("sess".to_string(), terminal, None, true));
+        let mut rx = session.broadcast_tx.subscribe();
+
+        // Queue a burst before the broadcaster starts so it is all ready at once
+        for chunk in ["a", "b", "c"] {
+            session.output_tx.try_send(chunk.repeat(4000)).unwrap();
+        }
+
+        let broadcaster = Arc::clone(&session);
+        let handle = tokio::spawn(async move { broadcaster.output_broadcaster_loop().await });
+
+        let msg = tokio::time::timeout(Duration::from_secs(1), rx.recv())
+            .await
+            .unwrap()
+            .unwrap();
+        match msg {
+            ServerMessage::Output { data, .. } => assert_eq!(data.len(), 12000),
+            other => panic!("unexpected message: {:?}", other),
+        }
+
+        handle.abort();
+    }
+
     #[tokio::test]
     async fn test_session_state_creation() {
         let terminal = Arc::new(RwLock::new(Terminal::new(80, 24)));
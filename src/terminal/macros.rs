@@ -2,6 +2,8 @@
 //!
 //! Provides types and Terminal implementation for recording and playing back macros.
 
+use std::sync::Arc;
+
 use crate::terminal::Terminal;
 
 impl Terminal {
@@ -9,17 +11,30 @@ impl Terminal {
 
     /// Load a macro into the library
     pub fn load_macro(&mut self, name: String, m: crate::macros::Macro) {
+        self.macros.macro_library.insert(name, Arc::new(m));
+    }
+
+    /// Load a shared macro into the library without copying its events
+    pub fn load_shared_macro(&mut self, name: String, m: Arc<crate::macros::Macro>) {
         self.macros.macro_library.insert(name, m);
     }
 
     /// Get a macro from the library
     pub fn get_macro(&self, name: &str) -> Option<&crate::macros::Macro> {
-        self.macros.macro_library.get(name)
+        self.macros.macro_library.get(name).map(Arc::as_ref)
+    }
+
+    /// Get a shared handle to a library macro without copying its events
+    pub fn get_shared_macro(&self, name: &str) -> Option<Arc<crate::macros::Macro>> {
+        self.macros.macro_library.get(name).cloned()
     }
 
     /// Remove a macro from the library
     pub fn remove_macro(&mut self, name: &str) -> Option<crate::macros::Macro> {
-        self.macros.macro_library.remove(name)
+        self.macros
+            .macro_library
+            .remove(name)
+            .map(Arc::unwrap_or_clone)
     }
 
     /// List all macros in the library
@@ -31,8 +46,9 @@ impl Terminal {
 
     /// Start playing a macro by name
     pub fn play_macro(&mut self, name: &str) -> Result<(), String> {
-        if let Some(m) = self.macros.macro_library.get(name).cloned() {
-            self.macros.macro_playback = Some(crate::macros::MacroPlayback::new(m));
+        // Playback shares the library entry rather than deep-copying its events
+        if let Some(m) = self.macros.macro_library.get(name) {
+            self.macros.macro_playback = Some(crate::macros::MacroPlayback::new(Arc::clone(m)));
             Ok(())
         } else {
             Err(format!("Macro '{}' not found", name))
@@ -200,6 +216,21 @@ mod tests {
         assert!(term.list_macros().is_empty());
     }
 
+    #[test]
+    fn shared_macro_load_and_get_share_the_allocation() {
+        let mut term = Terminal::new(80, 24);
+        let m = Arc::new(make_macro("greet"));
+
+        term.load_shared_macro("greet".to_string(), Arc::clone(&m));
+        let fetched = term.get_shared_macro("greet").unwrap();
+        assert!(Arc::ptr_eq(&m, &fetched));
+        assert!(term.get_shared_macro("missing").is_none());
+
+        // Removing hands back the macro's contents intact
+        drop((m, fetched));
+        assert_eq!(term.remove_macro("greet").unwrap().events.len(), 4);
+    }
+
     #[test]
     fn play_macro_unknown_name_errors() {
         let mut term = Terminal::new(80, 24);
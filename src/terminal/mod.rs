@@ -300,7 +300,7 @@ pub(crate) struct RenderingState {
 
 /// Macro library and playback state (Feature 38).
 pub(crate) struct MacroState {
-    pub(crate) macro_library: HashMap<String, crate::macros::Macro>,
+    pub(crate) macro_library: HashMap<String, std::sync::Arc<crate::macros::Macro>>,
     pub(crate) macro_playback: Option<crate::macros::MacroPlayback>,
     pub(crate) macro_screenshot_triggers: Vec<String>,
 }
@@ -2814,6 +2814,14 @@ impl Terminal {
         std::mem::take(&mut self.events.terminal_events)
     }
 
+    /// Discard pending events without returning them
+    ///
+    /// Same as dropping the result of [`poll_events`](Self::poll_events),
+    /// including any `ZoneScrolledOut` events it would have queued.
+    pub fn clear_events(&mut self) {
+        self.poll_events();
+    }
+
     /// Drain pending bell events
     pub fn drain_bell_events(&mut self) -> Vec<BellEvent> {
         std::mem::take(&mut self.events.bell_events)
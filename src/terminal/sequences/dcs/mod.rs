@@ -107,29 +107,17 @@ impl Terminal {
             if let Some(parser) = self.dcs_state.sixel_parser.take() {
                 let position = (self.cursor.col, self.cursor.row);
                 let sixel_graphic = parser.build_graphic(position);
+                let height = sixel_graphic.height;
 
-                // Convert SixelGraphic to TerminalGraphic
-                let mut pixels = Vec::with_capacity(sixel_graphic.width * sixel_graphic.height * 4);
-                for y in 0..sixel_graphic.height {
-                    for x in 0..sixel_graphic.width {
-                        if let Some((r, g, b, a)) = sixel_graphic.get_pixel(x, y) {
-                            pixels.push(r);
-                            pixels.push(g);
-                            pixels.push(b);
-                            pixels.push(a);
-                        } else {
-                            pixels.extend_from_slice(&[0, 0, 0, 0]);
-                        }
-                    }
-                }
-
+                // Convert SixelGraphic to TerminalGraphic. Its pixel buffer is
+                // already row-major RGBA, so it is moved over as-is.
                 let mut graphic = TerminalGraphic::new(
                     next_graphic_id(),
                     GraphicProtocol::Sixel,
                     position,
                     sixel_graphic.width,
-                    sixel_graphic.height,
-                    pixels,
+                    height,
+                    sixel_graphic.pixels,
                 );
 
                 let (cell_w, cell_h) = self.graphics.cell_dimensions;
@@ -143,7 +131,7 @@ impl Terminal {
 
                 // Advance cursor to next line(s) as per test expectation
                 if cell_h > 0 {
-                    let rows = (sixel_graphic.height as f32 / cell_h as f32).ceil() as usize;
+                    let rows = (height as f32 / cell_h as f32).ceil() as usize;
                     self.cursor.col = 0;
                     let (_cols, screen_rows) = self.size();
                     self.cursor.move_down(rows, screen_rows.saturating_sub(1));
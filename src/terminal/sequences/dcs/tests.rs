@@ -357,6 +357,28 @@ fn test_dcs_graphics_list_updated() {
     assert_eq!(term.graphics_count(), initial_graphics_count + 1);
 }
 
+#[test]
+fn test_dcs_unhook_graphic_pixels() {
+    let mut term = create_test_terminal();
+    let params = create_empty_params();
+
+    term.dcs_hook(&params, &[], false, 'q');
+
+    // 2x6 raster, red in the first column only
+    for &byte in b"\"1;1;2;6#0;2;100;0;0#0~" {
+        term.dcs_put(byte);
+    }
+
+    term.dcs_unhook();
+
+    let graphic = &term.all_graphics()[0];
+    assert_eq!((graphic.width, graphic.height), (2, 6));
+    assert_eq!(graphic.pixels.len(), 2 * 6 * 4);
+    for row in graphic.pixels.chunks_exact(2 * 4) {
+        assert_eq!(row, [255, 0, 0, 255, 0, 0, 0, 0]);
+    }
+}
+
 #[test]
 fn test_sixel_graphics_limit_enforced() {
     let mut term = create_test_terminal();
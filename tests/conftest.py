@@ -0,0 +1,11 @@
+"""Shared pytest fixtures."""
+
+import pytest
+
+from par_term_emu_core_rust import Terminal
+
+
+@pytest.fixture(scope="module")
+def fresh_term() -> Terminal:
+    """Pristine terminal shared by a module's tests that only read state."""
+    return Terminal(80, 24, scrollback=100)
@@ -9,11 +9,12 @@ class TestGetCommandOutput:
     def test_basic_output_capture(self) -> None:
         term = Terminal(80, 24, scrollback=100)
         term.start_command_execution("ls")
-        term.process(b"\x1b]133;A\x07$ \r\n")
-        term.process(b"\x1b]133;B\x07ls\r\n")
-        term.process(b"\x1b]133;C\x07")
-        term.process(b"file1.txt\r\nfile2.txt\r\n")
-        term.process(b"\x1b]133;D;0\x07")
+        term.process(
+            b"\x1b]133;A\x07$ \r\n"
+            b"\x1b]133;B\x07ls\r\n"
+            b"\x1b]133;C\x07file1.txt\r\nfile2.txt\r\n"
+            b"\x1b]133;D;0\x07"
+        )
         term.end_command_execution(0)
 
         output = term.get_command_output(0)
@@ -21,17 +22,13 @@ class TestGetCommandOutput:
         assert "file1.txt" in output
         assert "file2.txt" in output
 
-    def test_returns_none_for_empty_history(self) -> None:
-        term = Terminal(80, 24, scrollback=100)
-        assert term.get_command_output(0) is None
+    def test_returns_none_for_empty_history(self, fresh_term: Terminal) -> None:
+        assert fresh_term.get_command_output(0) is None
 
     def test_returns_none_for_out_of_bounds(self) -> None:
         term = Terminal(80, 24, scrollback=100)
         term.start_command_execution("ls")
-        term.process(b"\x1b]133;A\x07")
-        term.process(b"\x1b]133;B\x07")
-        term.process(b"\x1b]133;C\x07")
-        term.process(b"\x1b]133;D;0\x07")
+        term.process(b"\x1b]133;A\x07\x1b]133;B\x07\x1b]133;C\x07\x1b]133;D;0\x07")
         term.end_command_execution(0)
         assert term.get_command_output(5) is None
 
@@ -46,20 +43,22 @@ class TestGetCommandOutput:
 
         # First command
         term.start_command_execution("cmd1")
-        term.process(b"\x1b]133;A\x07$ \r\n")
-        term.process(b"\x1b]133;B\x07cmd1\r\n")
-        term.process(b"\x1b]133;C\x07")
-        term.process(b"output1\r\n")
-        term.process(b"\x1b]133;D;0\x07")
+        term.process(
+            b"\x1b]133;A\x07$ \r\n"
+            b"\x1b]133;B\x07cmd1\r\n"
+            b"\x1b]133;C\x07output1\r\n"
+            b"\x1b]133;D;0\x07"
+        )
         term.end_command_execution(0)
 
         # Second command
         term.start_command_execution("cmd2")
-        term.process(b"\x1b]133;A\x07$ \r\n")
-        term.process(b"\x1b]133;B\x07cmd2\r\n")
-        term.process(b"\x1b]133;C\x07")
-        term.process(b"output2\r\n")
-        term.process(b"\x1b]133;D;0\x07")
+        term.process(
+            b"\x1b]133;A\x07$ \r\n"
+            b"\x1b]133;B\x07cmd2\r\n"
+            b"\x1b]133;C\x07output2\r\n"
+            b"\x1b]133;D;0\x07"
+        )
         term.end_command_execution(0)
 
         # 0 = most recent
@@ -74,10 +73,7 @@ class TestGetCommandOutput:
     def test_empty_output_returns_string(self) -> None:
         term = Terminal(80, 24, scrollback=100)
         term.start_command_execution("true")
-        term.process(b"\x1b]133;A\x07")
-        term.process(b"\x1b]133;B\x07")
-        term.process(b"\x1b]133;C\x07")
-        term.process(b"\x1b]133;D;0\x07")
+        term.process(b"\x1b]133;A\x07\x1b]133;B\x07\x1b]133;C\x07\x1b]133;D;0\x07")
         term.end_command_execution(0)
 
         output = term.get_command_output(0)
@@ -88,18 +84,18 @@ class TestGetCommandOutput:
 class TestGetCommandOutputs:
     """Test get_command_outputs() bulk method."""
 
-    def test_empty_history(self) -> None:
-        term = Terminal(80, 24, scrollback=100)
-        assert term.get_command_outputs() == []
+    def test_empty_history(self, fresh_term: Terminal) -> None:
+        assert fresh_term.get_command_outputs() == []
 
     def test_returns_dict_with_expected_keys(self) -> None:
         term = Terminal(80, 24, scrollback=100)
         term.start_command_execution("ls")
-        term.process(b"\x1b]133;A\x07$ \r\n")
-        term.process(b"\x1b]133;B\x07ls\r\n")
-        term.process(b"\x1b]133;C\x07")
-        term.process(b"hello\r\n")
-        term.process(b"\x1b]133;D;0\x07")
+        term.process(
+            b"\x1b]133;A\x07$ \r\n"
+            b"\x1b]133;B\x07ls\r\n"
+            b"\x1b]133;C\x07hello\r\n"
+            b"\x1b]133;D;0\x07"
+        )
         term.end_command_execution(0)
 
         outputs = term.get_command_outputs()
@@ -119,11 +115,9 @@ class TestGetCommandOutputs:
 
         # Command with zones
         term.start_command_execution("with-zones")
-        term.process(b"\x1b]133;A\x07")
-        term.process(b"\x1b]133;B\x07")
-        term.process(b"\x1b]133;C\x07")
-        term.process(b"output\r\n")
-        term.process(b"\x1b]133;D;0\x07")
+        term.process(
+            b"\x1b]133;A\x07\x1b]133;B\x07\x1b]133;C\x07output\r\n\x1b]133;D;0\x07"
+        )
         term.end_command_execution(0)
 
         outputs = term.get_command_outputs()
@@ -138,11 +132,12 @@ class TestCommandExecutionFields:
     def test_output_rows_on_command_execution(self) -> None:
         term = Terminal(80, 24, scrollback=100)
         term.start_command_execution("ls")
-        term.process(b"\x1b]133;A\x07$ \r\n")
-        term.process(b"\x1b]133;B\x07ls\r\n")
-        term.process(b"\x1b]133;C\x07")
-        term.process(b"output\r\n")
-        term.process(b"\x1b]133;D;0\x07")
+        term.process(
+            b"\x1b]133;A\x07$ \r\n"
+            b"\x1b]133;B\x07ls\r\n"
+            b"\x1b]133;C\x07output\r\n"
+            b"\x1b]133;D;0\x07"
+        )
         term.end_command_execution(0)
 
         history = term.get_command_history()
@@ -1,14 +1,32 @@
 """Tests for contextual awareness API events (issue #37)."""
 
+from operator import itemgetter
+
+import pytest
+
 import par_term_emu_core_rust as pte
 
+# Enough lines to push a 5-row screen past a 10-line scrollback
+_SCROLL_FILLER = b"x\r\n" * 30
 
-def test_zone_opened_event() -> None:
-    """ZoneOpened event fires on OSC 133 A."""
+
+@pytest.fixture(scope="module")
+def zone_events() -> list[dict[str, str]]:
+    """Events from one full prompt/command/output/finished cycle.
+
+    Shared by the tests that only check which zones opened; tests of a
+    particular transition feed their own stream.
+    """
     term = pte.Terminal(80, 24)
-    term.process(b"\x1b]133;A\x1b\\")
-    events = term.poll_events()
-    zone_opened = [e for e in events if e["type"] == "zone_opened"]
+    term.process(
+        b"\x1b]133;A\x1b\\$ \r\n\x1b]133;B\x1b\\\x1b]133;C\x1b\\\x1b]133;D;0\x1b\\"
+    )
+    return term.poll_events()
+
+
+def test_zone_opened_event(zone_events: list[dict[str, str]]) -> None:
+    """ZoneOpened event fires on OSC 133 A."""
+    zone_opened = [e for e in zone_events if e["type"] == "zone_opened"]
     assert len(zone_opened) >= 1
     assert zone_opened[0]["zone_type"] == "prompt"
     assert "zone_id" in zone_opened[0]
@@ -19,10 +37,9 @@ def test_zone_closed_event() -> None:
     """ZoneClosed event fires when zone transitions."""
     term = pte.Terminal(80, 24)
     term.process(b"\x1b]133;A\x1b\\")
-    term.poll_events()  # drain
+    term.clear_events()
     term.process(b"\x1b]133;B\x1b\\")
-    events = term.poll_events()
-    zone_closed = [e for e in events if e["type"] == "zone_closed"]
+    zone_closed = [e for e in term.poll_events() if e["type"] == "zone_closed"]
     assert len(zone_closed) >= 1
     assert zone_closed[0]["zone_type"] == "prompt"
 
@@ -30,38 +47,26 @@ def test_zone_closed_event() -> None:
 def test_zone_closed_with_exit_code() -> None:
     """ZoneClosed for output zone includes exit code."""
     term = pte.Terminal(80, 24)
-    term.process(b"\x1b]133;A\x1b\\")
-    term.process(b"\x1b]133;B\x1b\\")
-    term.process(b"\x1b]133;C\x1b\\")
-    term.poll_events()
+    term.process(b"\x1b]133;A\x1b\\\x1b]133;B\x1b\\\x1b]133;C\x1b\\")
+    term.clear_events()
     term.process(b"\x1b]133;D;0\x1b\\")
-    events = term.poll_events()
-    zone_closed = [e for e in events if e["type"] == "zone_closed"]
+    zone_closed = [e for e in term.poll_events() if e["type"] == "zone_closed"]
     output_closes = [e for e in zone_closed if e["zone_type"] == "output"]
     assert len(output_closes) >= 1
     assert output_closes[0].get("exit_code") == "0"
 
 
-def test_zone_ids_monotonic() -> None:
+def test_zone_ids_monotonic(zone_events: list[dict[str, str]]) -> None:
     """Zone IDs increase monotonically."""
-    term = pte.Terminal(80, 24)
-    term.process(b"\x1b]133;A\x1b\\")
-    term.process(b"\x1b]133;B\x1b\\")
-    term.process(b"\x1b]133;C\x1b\\")
-    events = term.poll_events()
-    zone_ids = [int(e["zone_id"]) for e in events if e["type"] == "zone_opened"]
+    zone_opened = [e for e in zone_events if e["type"] == "zone_opened"]
+    zone_ids = list(map(int, map(itemgetter("zone_id"), zone_opened)))
     assert zone_ids == sorted(zone_ids)
     assert len(zone_ids) == 3
 
 
-def test_zone_opened_includes_all_types() -> None:
+def test_zone_opened_includes_all_types(zone_events: list[dict[str, str]]) -> None:
     """ZoneOpened events cover prompt, command, and output zone types."""
-    term = pte.Terminal(80, 24)
-    term.process(b"\x1b]133;A\x1b\\")
-    term.process(b"\x1b]133;B\x1b\\")
-    term.process(b"\x1b]133;C\x1b\\")
-    events = term.poll_events()
-    zone_types = [e["zone_type"] for e in events if e["type"] == "zone_opened"]
+    zone_types = [e["zone_type"] for e in zone_events if e["type"] == "zone_opened"]
     assert "prompt" in zone_types
     assert "command" in zone_types
     assert "output" in zone_types
@@ -70,10 +75,8 @@ def test_zone_opened_includes_all_types() -> None:
 def test_zone_closed_has_row_range() -> None:
     """ZoneClosed events include abs_row_start and abs_row_end."""
     term = pte.Terminal(80, 24)
-    term.process(b"\x1b]133;A\x1b\\$ \r\n")
-    term.process(b"\x1b]133;B\x1b\\")
-    events = term.poll_events()
-    zone_closed = [e for e in events if e["type"] == "zone_closed"]
+    term.process(b"\x1b]133;A\x1b\\$ \r\n\x1b]133;B\x1b\\")
+    zone_closed = [e for e in term.poll_events() if e["type"] == "zone_closed"]
     assert len(zone_closed) >= 1
     assert "abs_row_start" in zone_closed[0]
     assert "abs_row_end" in zone_closed[0]
@@ -105,7 +108,7 @@ def test_environment_changed_old_value() -> None:
     """EnvironmentChanged includes old_value when cwd changes."""
     term = pte.Terminal(80, 24)
     term.process(b"\x1b]7;file:///home/user/dir1\x1b\\")
-    term.poll_events()  # drain
+    term.clear_events()
     term.process(b"\x1b]7;file:///home/user/dir2\x1b\\")
     events = term.poll_events()
     cwd_events = [
@@ -141,7 +144,7 @@ def test_remote_host_transition_includes_old_values() -> None:
     """RemoteHostTransition includes old_hostname and old_username."""
     term = pte.Terminal(80, 24)
     term.process(b"\x1b]1337;RemoteHost=alice@server1\x1b\\")
-    term.poll_events()  # drain
+    term.clear_events()
     term.process(b"\x1b]1337;RemoteHost=bob@server2\x1b\\")
     events = term.poll_events()
     host_events = [e for e in events if e["type"] == "remote_host_transition"]
@@ -192,16 +195,21 @@ def test_poll_events_drains_queue() -> None:
     assert len(events2) == 0
 
 
+def test_clear_events_discards_queue() -> None:
+    """clear_events drops pending events without returning them."""
+    term = pte.Terminal(80, 24)
+    term.process(b"\x1b]133;A\x1b\\")
+    assert term.clear_events() is None
+    assert term.poll_events() == []
+
+
 def test_zone_scrolled_out_event() -> None:
     """ZoneScrolledOut fires when zones are evicted from scrollback."""
     term = pte.Terminal(80, 5, scrollback=10)
-    term.process(b"\x1b]133;A\x07")
-    term.process(b"\x1b]133;B\x07")
-    term.process(b"\x1b]133;C\x07")
-    term.poll_events()  # drain
+    term.process(b"\x1b]133;A\x07\x1b]133;B\x07\x1b]133;C\x07")
+    term.clear_events()
     # Generate enough output to overflow scrollback and evict zones
-    for i in range(30):
-        term.process(f"line {i}\r\n".encode())
+    term.process(_SCROLL_FILLER)
     term.process(b"\x1b]133;D;0\x07")
     events = term.poll_events()
     scrolled_out = [e for e in events if e["type"] == "zone_scrolled_out"]
@@ -213,9 +221,7 @@ def test_zone_scrolled_out_event() -> None:
 def test_multiple_cwd_changes_emit_multiple_events() -> None:
     """Each CWD change emits its own EnvironmentChanged event."""
     term = pte.Terminal(80, 24)
-    term.process(b"\x1b]7;file:///dir1\x1b\\")
-    term.process(b"\x1b]7;file:///dir2\x1b\\")
-    term.process(b"\x1b]7;file:///dir3\x1b\\")
+    term.process(b"".join(b"\x1b]7;file:///dir%d\x1b\\" % i for i in range(1, 4)))
     events = term.poll_events()
     cwd_events = [
         e for e in events if e["type"] == "environment_changed" and e["key"] == "cwd"
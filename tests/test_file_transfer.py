@@ -11,8 +11,7 @@ Tests cover:
 """
 
 import base64
-import struct
-import zlib
+from functools import lru_cache
 
 from par_term_emu_core_rust import Terminal
 
@@ -22,34 +21,34 @@ from par_term_emu_core_rust import Terminal
 # ---------------------------------------------------------------------------
 
 
+@lru_cache(maxsize=128)
 def make_osc1337_file(
     data: bytes, filename: str | None = None, inline: int = 0
 ) -> bytes:
     """Build an OSC 1337 File= sequence."""
-    b64_data = base64.b64encode(data).decode("ascii")
-    params = [f"inline={inline}", f"size={len(data)}"]
+    params = [b"inline=%d" % inline, b"size=%d" % len(data)]
     if filename:
-        b64_name = base64.b64encode(filename.encode()).decode("ascii")
-        params.append(f"name={b64_name}")
-    params_str = ";".join(params)
-    return f"\x1b]1337;File={params_str}:{b64_data}\x07".encode()
-
-
-def make_1x1_png() -> bytes:
-    """Create a minimal valid 1x1 red PNG."""
-    signature = b"\x89PNG\r\n\x1a\n"
-    # IHDR: 1x1, 8-bit RGB
-    ihdr_data = struct.pack(">IIBBBBB", 1, 1, 8, 2, 0, 0, 0)
-    ihdr_crc = zlib.crc32(b"IHDR" + ihdr_data) & 0xFFFFFFFF
-    ihdr = struct.pack(">I", 13) + b"IHDR" + ihdr_data + struct.pack(">I", ihdr_crc)
-    # IDAT: filter=0, R=255, G=0, B=0
-    raw = zlib.compress(b"\x00\xff\x00\x00")
-    idat_crc = zlib.crc32(b"IDAT" + raw) & 0xFFFFFFFF
-    idat = struct.pack(">I", len(raw)) + b"IDAT" + raw + struct.pack(">I", idat_crc)
-    # IEND
-    iend_crc = zlib.crc32(b"IEND") & 0xFFFFFFFF
-    iend = struct.pack(">I", 0) + b"IEND" + struct.pack(">I", iend_crc)
-    return signature + ihdr + idat + iend
+        params.append(b"name=" + base64.b64encode(filename.encode()))
+    return (
+        b"\x1b]1337;File=" + b";".join(params) + b":" + base64.b64encode(data) + b"\x07"
+    )
+
+
+# Minimal valid 1x1 red PNG (8-bit RGB): signature, IHDR, IDAT holding the
+# zlib-compressed scanline 00 ff 00 00, and IEND, each chunk with its CRC
+_PNG_1x1: bytes = bytes.fromhex(
+    "89504e470d0a1a0a"
+    "0000000d4948445200000001000000010802000000907753de"
+    "0000000c49444154789c63f8cfc0000003010100c9fe92ef"
+    "0000000049454e44ae426082"
+)
+_PNG_1x1_OSC: bytes = make_osc1337_file(_PNG_1x1, filename="image.png", inline=1)
+
+# Static payloads and their encoded forms, likewise computed at import time
+_DOC_DATA = b"Important document content"
+_DOC_SEQ: bytes = make_osc1337_file(_DOC_DATA, filename="doc.txt")
+_UPLOAD_DATA = b"file content here"
+_UPLOAD_RESPONSE: bytes = b"ok\n" + base64.b64encode(_UPLOAD_DATA) + b"\n\n"
 
 
 # ---------------------------------------------------------------------------
@@ -60,10 +59,9 @@ def make_1x1_png() -> bytes:
 class TestFileTransferBasics:
     """Basic file transfer configuration and state tests."""
 
-    def test_default_max_size(self) -> None:
+    def test_default_max_size(self, fresh_term: Terminal) -> None:
         """Default max transfer size should be 50 MB."""
-        term = Terminal(80, 24)
-        assert term.get_max_transfer_size() == 50 * 1024 * 1024
+        assert fresh_term.get_max_transfer_size() == 50 * 1024 * 1024
 
     def test_set_get_max_size(self) -> None:
         """Setting max transfer size should be reflected in get."""
@@ -71,11 +69,10 @@ class TestFileTransferBasics:
         term.set_max_transfer_size(100 * 1024 * 1024)
         assert term.get_max_transfer_size() == 100 * 1024 * 1024
 
-    def test_no_transfers_initially(self) -> None:
+    def test_no_transfers_initially(self, fresh_term: Terminal) -> None:
         """No active or completed transfers on a fresh terminal."""
-        term = Terminal(80, 24)
-        assert len(term.get_active_transfers()) == 0
-        assert len(term.get_completed_transfers()) == 0
+        assert len(fresh_term.get_active_transfers()) == 0
+        assert len(fresh_term.get_completed_transfers()) == 0
 
 
 # ---------------------------------------------------------------------------
@@ -113,9 +110,7 @@ class TestFileDownload:
     def test_take_completed_transfer(self) -> None:
         """take_completed_transfer should return data and remove from buffer."""
         term = Terminal(80, 24)
-        file_data = b"Important document content"
-        seq = make_osc1337_file(file_data, filename="doc.txt")
-        term.process(seq)
+        term.process(_DOC_SEQ)
 
         # Get the transfer ID from the completed event
         events = term.poll_events()
@@ -126,7 +121,7 @@ class TestFileDownload:
         # Take the completed transfer
         transfer = term.take_completed_transfer(transfer_id)
         assert transfer is not None
-        assert transfer["data"] == file_data
+        assert transfer["data"] == _DOC_DATA
         assert transfer["filename"] == "doc.txt"
 
         # Should be removed after taking
@@ -140,9 +135,7 @@ class TestFileDownload:
         do NOT trigger file transfer events.
         """
         term = Terminal(80, 24)
-        png_data = make_1x1_png()
-        seq = make_osc1337_file(png_data, filename="image.png", inline=1)
-        term.process(seq)
+        term.process(_PNG_1x1_OSC)
 
         events = term.poll_events()
         file_events = [
@@ -193,27 +186,17 @@ class TestUploadRequest:
     def test_send_upload_data_response(self) -> None:
         """send_upload_data should write 'ok\\n' + base64(data) + '\\n\\n' to responses."""
         term = Terminal(80, 24)
-        upload_data = b"file content here"
-        term.send_upload_data(upload_data)
-
-        response = term.drain_responses()
-        response_str = bytes(response).decode("ascii")
-        assert response_str.startswith("ok\n")
+        term.send_upload_data(_UPLOAD_DATA)
 
-        # The rest should be base64 encoded data followed by \n\n
-        parts = response_str.split("\n", 1)
-        assert parts[0] == "ok"
-        b64_part = parts[1].rstrip("\n")
-        decoded = base64.b64decode(b64_part)
-        assert decoded == upload_data
+        # "ok", then the base64 payload terminated by a blank line
+        assert term.drain_responses() == _UPLOAD_RESPONSE
 
     def test_cancel_upload_response(self) -> None:
         """cancel_upload should write Ctrl-C (0x03) to responses."""
         term = Terminal(80, 24)
         term.cancel_upload()
 
-        response = term.drain_responses()
-        assert bytes(response) == b"\x03"
+        assert term.drain_responses() == b"\x03"
 
 
 # ---------------------------------------------------------------------------
@@ -260,7 +243,7 @@ class TestCancelTransfer:
         term.process(seq)
 
         # Drain events
-        term.poll_events()
+        term.clear_events()
 
         # Check completed list
         completed = term.get_completed_transfers()
@@ -1,8 +1,8 @@
 """Tests for image metadata serialization for session persistence."""
 
 import json
-import tempfile
-from pathlib import Path
+
+import pytest
 
 from par_term_emu_core_rust import Terminal
 
@@ -20,6 +20,14 @@ def _create_sixel_graphic(term: Terminal) -> None:
     term.process_str(sixel)
 
 
+@pytest.fixture(scope="module")
+def sixel_term() -> Terminal:
+    """Terminal holding one sixel graphic, shared by tests that only read it."""
+    term = Terminal(80, 24)
+    _create_sixel_graphic(term)
+    return term
+
+
 def test_export_graphics_json_empty():
     """Exporting with no graphics returns valid JSON with empty arrays."""
     term = Terminal(80, 24)
@@ -31,13 +39,11 @@ def test_export_graphics_json_empty():
     assert data["animations"] == []
 
 
-def test_export_graphics_json_with_sixel():
+def test_export_graphics_json_with_sixel(sixel_term):
     """Exporting after adding a sixel graphic produces valid JSON."""
-    term = Terminal(80, 24)
-    _create_sixel_graphic(term)
-    assert term.graphics_count() >= 1
+    assert sixel_term.graphics_count() >= 1
 
-    json_str = term.export_graphics_json()
+    json_str = sixel_term.export_graphics_json()
     data = json.loads(json_str)
 
     assert data["version"] == 1
@@ -52,14 +58,12 @@ def test_export_graphics_json_with_sixel():
     assert placement["height"] > 0
 
 
-def test_import_graphics_json_round_trip():
+def test_import_graphics_json_round_trip(sixel_term):
     """Graphics exported from one terminal can be imported into another."""
-    term1 = Terminal(80, 24)
-    _create_sixel_graphic(term1)
-    original_count = term1.graphics_count()
+    original_count = sixel_term.graphics_count()
     assert original_count >= 1
 
-    json_str = term1.export_graphics_json()
+    json_str = sixel_term.export_graphics_json()
 
     # Import into a new terminal
     term2 = Terminal(80, 24)
@@ -69,18 +73,15 @@ def test_import_graphics_json_round_trip():
     assert term2.graphics_count() == original_count
 
 
-def test_import_graphics_preserves_metadata():
+def test_import_graphics_preserves_metadata(sixel_term):
     """Imported graphics should preserve placement metadata."""
-    term1 = Terminal(80, 24)
-    _create_sixel_graphic(term1)
-
-    original = term1.graphics_at_row(0)[0]
+    original = sixel_term.graphics_at_row(0)[0]
     original_width = original.width
     original_height = original.height
     original_protocol = original.protocol
     original_display_mode = original.placement.display_mode
 
-    json_str = term1.export_graphics_json()
+    json_str = sixel_term.export_graphics_json()
 
     term2 = Terminal(80, 24)
     term2.import_graphics_json(json_str)
@@ -119,16 +120,13 @@ def test_import_invalid_json_raises_error():
         pass
 
 
-def test_export_import_preserves_pixel_data():
+def test_export_import_preserves_pixel_data(sixel_term):
     """Pixel data should survive serialization round trip."""
-    term1 = Terminal(80, 24)
-    _create_sixel_graphic(term1)
-
-    original = term1.graphics_at_row(0)[0]
+    original = sixel_term.graphics_at_row(0)[0]
     original_pixels = original.pixels()
     assert len(original_pixels) > 0
 
-    json_str = term1.export_graphics_json()
+    json_str = sixel_term.export_graphics_json()
 
     term2 = Terminal(80, 24)
     term2.import_graphics_json(json_str)
@@ -138,27 +136,57 @@ def test_export_import_preserves_pixel_data():
     assert restored_pixels == original_pixels
 
 
-def test_export_to_file_and_reimport():
-    """Full workflow: export to file, read back, import."""
-    term1 = Terminal(80, 24)
-    _create_sixel_graphic(term1)
+def test_export_to_file_and_reimport(sixel_term, tmp_path):
+    """Full workflow: export to file, import from file."""
+    path = str(tmp_path / "graphics.json")
+    sixel_term.export_graphics_file(path)
 
-    with tempfile.NamedTemporaryFile(
-        mode="w", suffix=".json", delete=False, encoding="utf-8"
-    ) as f:
-        f.write(term1.export_graphics_json())
-        tmp_path = f.name
+    term2 = Terminal(80, 24)
+    count = term2.import_graphics_file(path)
+    assert count >= 1
+    assert term2.graphics_count() == count
 
-    try:
-        with open(tmp_path, encoding="utf-8") as f:
-            json_str = f.read()
 
-        term2 = Terminal(80, 24)
-        count = term2.import_graphics_json(json_str)
-        assert count >= 1
-        assert term2.graphics_count() == count
-    finally:
-        Path(tmp_path).unlink()
+def test_export_file_matches_json_string(sixel_term, tmp_path):
+    """The file holds the export_graphics_json() document."""
+    path = tmp_path / "graphics.json"
+    sixel_term.export_graphics_file(str(path))
+    assert path.read_text(encoding="utf-8") == sixel_term.export_graphics_json()
+
+    # A file saved from the JSON string imports the same way
+    saved = tmp_path / "saved.json"
+    saved.write_text(sixel_term.export_graphics_json(), encoding="utf-8")
+    term2 = Terminal(80, 24)
+    count = term2.import_graphics_file(str(saved))
+    assert count >= 1
+    assert term2.graphics_count() == count
+
+
+def test_import_graphics_file_missing_raises(tmp_path):
+    """A missing file raises IOError rather than clearing graphics."""
+    term = Terminal(80, 24)
+    _create_sixel_graphic(term)
+    count = term.graphics_count()
+    with pytest.raises(OSError):
+        term.import_graphics_file(str(tmp_path / "missing.json"))
+    assert term.graphics_count() == count
+
+
+def test_import_graphics_file_missing_data_file_raises(sixel_term, tmp_path):
+    """A pixel data file referenced inside the JSON that is missing raises IOError."""
+    data = json.loads(sixel_term.export_graphics_json())
+    data["placements"][0]["data"] = {
+        "type": "File",
+        "value": str(tmp_path / "missing.rgba"),
+    }
+    path = tmp_path / "graphics.json"
+    path.write_text(json.dumps(data), encoding="utf-8")
+
+    term = Terminal(80, 24)
+    with pytest.raises(OSError):
+        term.import_graphics_file(str(path))
+    with pytest.raises(OSError):
+        term.import_graphics_json(json.dumps(data))
 
 
 def test_multiple_graphics_round_trip():
@@ -177,3 +205,17 @@ def test_multiple_graphics_round_trip():
     restored = term2.import_graphics_json(json_str)
     assert restored == original_count
     assert term2.graphics_count() == original_count
+
+
+def test_copy_graphics_from_matches_json_round_trip():
+    """Copying graphics directly gives the same state as a JSON round trip."""
+    term1 = Terminal(80, 24)
+    _create_sixel_graphic(term1)
+    _create_sixel_graphic(term1)
+
+    term2 = Terminal(80, 24)
+    _create_sixel_graphic(term2)
+    restored = term2.copy_graphics_from(term1)
+    assert restored == term1.graphics_count()
+    assert term2.graphics_count() == restored
+    assert term2.export_graphics_json() == term1.export_graphics_json()
@@ -210,6 +210,20 @@ class TestFeatureIntegration:
         response = bytes(responses).decode("utf-8", errors="ignore")
         assert "rgb:" in response
 
+    def test_set_palette_bulk(self):
+        """Test setting default colors and the palette in one call."""
+        term = Terminal(80, 24)
+        palette = [(i, i * 2, i * 3) for i in range(16)]
+
+        term.set_palette_bulk((32, 64, 128), (255, 128, 64), palette)
+
+        assert term.default_bg() == (32, 64, 128)
+        assert term.default_fg() == (255, 128, 64)
+        assert term.get_ansi_palette() == palette
+
+        with pytest.raises(ValueError):
+            term.set_palette_bulk((0, 0, 0), (0, 0, 0), palette + [(0, 0, 0)])
+
     def test_rectangle_operations(self):
         """Test VT420 rectangle operations."""
         term = Terminal(80, 24)
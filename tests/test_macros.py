@@ -128,6 +128,28 @@ def test_pty_terminal_macro_library() -> None:
     assert "my_macro" not in macros
 
 
+def test_pty_terminal_macro_library_copy_on_write() -> None:
+    """Test that library macros stay independent of the Python-side objects."""
+    term = PtyTerminal(80, 24)
+
+    macro = Macro("shared")
+    macro.add_key("a")
+    term.load_macro("shared", macro)
+
+    # Editing the loaded object must not change the stored macro
+    macro.add_key("b")
+    retrieved = term.get_macro("shared")
+    assert retrieved is not None
+    assert retrieved.event_count == 1
+
+    # Nor must editing a retrieved copy
+    retrieved.add_key("c")
+    again = term.get_macro("shared")
+    assert again is not None
+    assert again.event_count == 1
+    assert macro.event_count == 2
+
+
 def test_macro_playback_simple() -> None:
     """Test basic macro playback."""
     term = PtyTerminal(80, 24)
@@ -290,29 +312,29 @@ def test_friendly_key_names() -> None:
     """Test various friendly key name formats."""
     macro = Macro("test_key_names")
 
-    # Control keys
-    macro.add_key("ctrl+c")
-    macro.add_key("ctrl+shift+s")
-
-    # Function keys
-    macro.add_key("f1")
-    macro.add_key("f12")
-
-    # Arrow keys
-    macro.add_key("up")
-    macro.add_key("down")
-    macro.add_key("left")
-    macro.add_key("right")
-
-    # Special keys
-    macro.add_key("enter")
-    macro.add_key("tab")
-    macro.add_key("backspace")
-    macro.add_key("escape")
-    macro.add_key("space")
-
-    # Alt keys
-    macro.add_key("alt+f4")
+    macro.add_keys(
+        [
+            # Control keys
+            "ctrl+c",
+            "ctrl+shift+s",
+            # Function keys
+            "f1",
+            "f12",
+            # Arrow keys
+            "up",
+            "down",
+            "left",
+            "right",
+            # Special keys
+            "enter",
+            "tab",
+            "backspace",
+            "escape",
+            "space",
+            # Alt keys
+            "alt+f4",
+        ]
+    )
 
     assert (
         macro.event_count == 14
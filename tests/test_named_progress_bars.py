@@ -111,7 +111,7 @@ def test_progress_bar_changed_event_on_remove():
     """Test that ProgressBarChanged event is emitted on remove."""
     term = Terminal(80, 24)
     term.process_str(_osc934("set", "dl-1", percent="50"))
-    term.poll_events()  # drain
+    term.clear_events()
 
     term.process_str(_osc934("remove", "dl-1"))
     events = term.poll_events()
@@ -126,7 +126,7 @@ def test_progress_bar_changed_event_on_remove_all():
     term = Terminal(80, 24)
     term.process_str(_osc934("set", "a", percent="10"))
     term.process_str(_osc934("set", "b", percent="20"))
-    term.poll_events()  # drain
+    term.clear_events()
 
     term.process_str(_osc934("remove_all"))
     events = term.poll_events()
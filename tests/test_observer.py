@@ -48,6 +48,21 @@ class TestSyncObserver:
         term.process(b"\x1b]0;Filtered\x07")
         assert any(e["type"] == "title_changed" for e in events)
 
+    def test_observer_with_event_type_filter(self) -> None:
+        term = Terminal(80, 24, scrollback=100)
+        events: list[dict[str, str]] = []
+        term.add_observer(
+            lambda e: events.append(e),
+            kinds=["shell_integration"],
+            event_type="command_finished",
+        )
+        term.process(b"\x1b]133;A\x07")
+        term.process(b"\x1b]133;B\x07")
+        term.process(b"\x1b]133;C\x07")
+        assert events == []
+        term.process(b"\x1b]133;D;0\x07")
+        assert [e["event_type"] for e in events] == ["command_finished"]
+
     def test_multiple_observers(self) -> None:
         term = Terminal(80, 24, scrollback=100)
         events1: list[dict[str, str]] = []
@@ -192,3 +207,12 @@ class TestConvenienceWrappers:
         term.process(b"\x07")
         assert any(e["type"] == "bell" for e in events)
         term.remove_observer(observer_id)
+
+    def test_wrappers_resolve_lazily_from_package(self) -> None:
+        import par_term_emu_core_rust
+
+        from par_term_emu_core_rust import on_bell as package_on_bell
+
+        assert package_on_bell is on_bell
+        assert "on_zone_change" in dir(par_term_emu_core_rust)
+        assert par_term_emu_core_rust.on_zone_change is on_zone_change
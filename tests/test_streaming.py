@@ -140,6 +140,22 @@ def test_streaming_config_setters():
     assert config.session_idle_timeout == 600
 
 
+def test_streaming_config_socket_buffers():
+    """Test socket buffer size configuration."""
+    config = StreamingConfig()
+    assert config.send_buffer_bytes == 0
+    assert config.recv_buffer_bytes == 0
+
+    config = StreamingConfig(
+        send_buffer_bytes=4 * 1024 * 1024, recv_buffer_bytes=256 * 1024
+    )
+    assert config.send_buffer_bytes == 4 * 1024 * 1024
+    assert config.recv_buffer_bytes == 256 * 1024
+
+    config.send_buffer_bytes = 0
+    assert config.send_buffer_bytes == 0
+
+
 def test_streaming_config_repr():
     """Test streaming configuration string representation."""
     config = StreamingConfig(max_clients=100)
@@ -214,6 +230,44 @@ def test_server_start_stop(pty_terminal, streaming_port):
     assert not server.is_running()
 
 
+def test_server_start_waits_until_listening(pty_terminal, streaming_port):
+    """Test start() returns only once the port accepts connections."""
+    import socket
+
+    server = StreamingServer(pty_terminal, f"127.0.0.1:{streaming_port}")
+    server.start()
+
+    # No sleep: the listener must already be bound
+    with socket.create_connection(("127.0.0.1", streaming_port), timeout=1):
+        pass
+
+    server.shutdown("test complete")
+
+
+def test_server_start_reports_bind_failure(pty_terminal, streaming_port):
+    """Test start() raises when the address is already in use."""
+    import socket
+
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", streaming_port))
+        sock.listen()
+
+        server = StreamingServer(pty_terminal, f"127.0.0.1:{streaming_port}")
+        with pytest.raises(RuntimeError):
+            server.start()
+
+
+def test_server_start_twice_raises(pty_terminal, streaming_port):
+    """Test a second start() on a running server raises."""
+    server = StreamingServer(pty_terminal, f"127.0.0.1:{streaming_port}")
+    server.start()
+
+    with pytest.raises(RuntimeError):
+        server.start()
+
+    server.shutdown("test complete")
+
+
 def test_server_client_count_no_clients(pty_terminal, streaming_port):
     """Test client count with no connected clients."""
     server = StreamingServer(pty_terminal, f"127.0.0.1:{streaming_port}")
@@ -225,6 +279,64 @@ def test_server_client_count_no_clients(pty_terminal, streaming_port):
     server.stop()
 
 
+def test_wait_resize_times_out_without_requests(pty_terminal, streaming_port):
+    """Test wait_resize returns None when no resize request arrives."""
+    server = StreamingServer(pty_terminal, f"127.0.0.1:{streaming_port}")
+
+    start = time.monotonic()
+    assert server.wait_resize(timeout=0.05) is None
+    assert time.monotonic() - start >= 0.04
+    assert server.wait_resize(timeout=0.01, coalesce=True) is None
+
+
+def test_wait_resize_timeout_covers_contended_receiver(pty_terminal, streaming_port):
+    """Test wait_resize honours its timeout while another waiter holds the queue."""
+    import threading
+
+    server = StreamingServer(pty_terminal, f"127.0.0.1:{streaming_port}")
+    waiter = threading.Thread(target=server.wait_resize, kwargs={"timeout": 1.0})
+    waiter.start()
+    time.sleep(0.05)
+
+    start = time.monotonic()
+    assert server.wait_resize(timeout=0.05) is None
+    assert time.monotonic() - start < 0.5
+    waiter.join()
+
+
+def test_wait_resize_rejects_negative_timeout(pty_terminal, streaming_port):
+    """Test wait_resize validates its timeout."""
+    server = StreamingServer(pty_terminal, f"127.0.0.1:{streaming_port}")
+
+    with pytest.raises(ValueError):
+        server.wait_resize(timeout=-1.0)
+    # Finite but too large for a Duration
+    with pytest.raises(ValueError):
+        server.wait_resize(timeout=1e20)
+
+
+def test_send_output_accepts_str_and_bytes(pty_terminal, streaming_port):
+    """Test send_output takes both str and pre-encoded bytes."""
+    server = StreamingServer(pty_terminal, f"127.0.0.1:{streaming_port}")
+
+    server.send_output("\x1b[2J\x1b[H")
+    server.send_output(b"\x1b[2J\x1b[H")
+
+    with pytest.raises(TypeError):
+        server.send_output(42)
+
+
+def test_resize_and_broadcast(pty_terminal, streaming_port):
+    """Test resizing the PTY and broadcasting the new size in one call."""
+    server = StreamingServer(pty_terminal, f"127.0.0.1:{streaming_port}")
+
+    server.resize_and_broadcast(pty_terminal, 100, 30)
+    assert pty_terminal.size() == (100, 30)
+
+    with pytest.raises(ValueError):
+        server.resize_and_broadcast(pty_terminal, 0, 30)
+
+
 @pytest.mark.asyncio
 async def test_server_address(pty_terminal, streaming_port):
     """Test getting server address."""
@@ -499,6 +499,8 @@ mod streaming_tests {
                 api_key: Some("test-key-123".to_string()),
                 allow_api_key_in_query: false,
                 allowed_origins: None,
+                send_buffer_bytes: 4 * 1024 * 1024,
+                recv_buffer_bytes: 256 * 1024,
             };
 
             assert_eq!(config.max_clients, 50);
@@ -514,6 +516,8 @@ mod streaming_tests {
             assert_eq!(config.session_idle_timeout, 600);
             assert!(config.presets.is_empty());
             assert_eq!(config.api_key.as_deref(), Some("test-key-123"));
+            assert_eq!(config.send_buffer_bytes, 4 * 1024 * 1024);
+            assert_eq!(config.recv_buffer_bytes, 256 * 1024);
         }
 
         #[test]
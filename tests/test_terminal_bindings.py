@@ -11,7 +11,7 @@ Tests the Python API for the Rust Terminal implementation, including:
 """
 
 import pytest
-from par_term_emu_core_rust import Terminal
+from par_term_emu_core_rust import Terminal, hex_to_rgb, rgb_to_ansi_256, rgb_to_hex
 
 
 class TestTerminalBasics:
@@ -260,6 +260,37 @@ class TestColorOperations:
         # Colors should be back to defaults
 
 
+class TestColorUtilities:
+    """Test the memoized module-level color conversions"""
+
+    def test_cached_conversions_match_native(self):
+        """Test cached wrappers return the native results"""
+        for fn, arg in (
+            (rgb_to_ansi_256, (255, 0, 0)),
+            (rgb_to_hex, (255, 128, 64)),
+            (hex_to_rgb, "#FF8040"),
+        ):
+            assert fn(arg) == fn.__wrapped__(arg)
+
+    def test_repeated_lookup_hits_cache(self):
+        """Test repeated conversions are served from the cache"""
+        rgb_to_hex.cache_clear()
+        assert rgb_to_hex((255, 128, 64)) == "#FF8040"
+        assert rgb_to_hex((255, 128, 64)) == "#FF8040"
+        info = rgb_to_hex.cache_info()
+        assert info.hits == 1
+        assert info.misses == 1
+
+    def test_invalid_hex_still_returns_none(self):
+        """Test invalid hex strings return None through the cache"""
+        assert hex_to_rgb("not-a-color") is None
+
+    def test_unhashable_argument_raises_type_error(self):
+        """Test unhashable arguments are rejected by the cache with TypeError"""
+        with pytest.raises(TypeError):
+            rgb_to_hex([255, 128, 64])
+
+
 class TestCellAttributes:
     """Test cell attribute queries"""
 
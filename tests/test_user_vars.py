@@ -73,7 +73,7 @@ def test_user_var_changed_event_with_old_value():
     """Test that UserVarChanged events include old_value when updating."""
     term = Terminal(80, 24)
     term.process_str(_set_user_var_seq("key", "first"))
-    term.poll_events()  # drain
+    term.clear_events()
 
     term.process_str(_set_user_var_seq("key", "second"))
     events = term.poll_events()
@@ -88,7 +88,7 @@ def test_user_var_no_event_when_same_value():
     """Test that no event is emitted when setting the same value."""
     term = Terminal(80, 24)
     term.process_str(_set_user_var_seq("key", "same"))
-    term.poll_events()  # drain
+    term.clear_events()
 
     term.process_str(_set_user_var_seq("key", "same"))
     events = term.poll_events()